@@ -0,0 +1,198 @@
+"""
+ai/logistics.py - planowanie transportów zasobów imperium
+
+Zamiast zachłannie szukać najlepszego dawcy dla każdej potrzeby osobno,
+planer zbiera wszystkie potrzeby i nadwyżki (``evaluate_all_planet_balances``)
+i dla każdego zasobu rozwiązuje zagadnienie transportowe o minimalnym
+koszcie (min-cost flow, koszt = ``calculate_transport_cost`` po trasach
+galaktyki). Wynik to pełny zestaw przesyłek na cykl - przesyłki na tej
+samej trasie idą jednym transportem (konwojem).
+
+Potrzeby pomniejszone są o ładunek już lecący do planety (transporty
+imperium, zebrane raz na cykl), więc kolejne cykle nie wysyłają tego
+samego drugi raz. Dla zasobu, którego wejście (potrzeby i nadwyżki) nie
+zmieniło się od poprzedniego cyklu, planer zwraca zapamiętane przesyłki
+zamiast liczyć przepływ od nowa. Wysłana przesyłka zmienia wejście
+(ładunek w drodze), więc powtarzane są tylko te, których nie udało się
+nadać. Zmiana wejścia liczy zagadnienie danego zasobu w całości; koszty
+par planet są pamiętane między cyklami do zmiany połączeń
+(``galaxy.lanes_version``).
+"""
+from collections import deque
+
+from empire.transport import calculate_transport_cost
+
+# największa przesyłka jednego zasobu na jednej trasie
+MAX_SHIPMENT = 40.0
+# mniejszych przesyłek nie opłaca się wysyłać
+MIN_SHIPMENT = 0.5
+
+_EPS = 1e-9
+
+
+def min_cost_transport(supplies, demands, cost, capacity=float("inf")):
+    """Przepływ o minimalnym koszcie z dostawców do odbiorców.
+
+    `supplies`, `demands` - listy ilości; `cost(i, j)` - koszt jednostki
+    z dostawcy i do odbiorcy j (None = brak trasy); `capacity` - limit na
+    parę (i, j). Maksymalizuje dostarczoną ilość, a przy niej minimalizuje
+    koszt (najkrótsze ścieżki powiększające, Bellman-Ford na grafie
+    residualnym). Zwraca {(i, j): ilość}.
+    """
+    m, n = len(supplies), len(demands)
+    source, sink = m + n, m + n + 1
+    graph = [[] for _ in range(m + n + 2)]
+
+    # krawędź: [cel, przepustowość, koszt, indeks krawędzi zwrotnej]
+    def add_edge(a, b, cap, c):
+        graph[a].append([b, cap, c, len(graph[b])])
+        graph[b].append([a, 0.0, -c, len(graph[a]) - 1])
+
+    for i, amount in enumerate(supplies):
+        if amount > _EPS:
+            add_edge(source, i, amount, 0.0)
+    for j, amount in enumerate(demands):
+        if amount > _EPS:
+            add_edge(m + j, sink, amount, 0.0)
+
+    pairs = {}
+    for i in range(m):
+        for j in range(n):
+            c = cost(i, j)
+            if c is not None:
+                pairs[(i, j)] = (i, len(graph[i]))
+                add_edge(i, m + j, capacity, c)
+
+    # najkrótsze ścieżki powiększające
+    count = len(graph)
+    while True:
+        dist = [None] * count
+        prev = [None] * count
+        dist[source] = 0.0
+        queue = deque([source])
+        queued = [False] * count
+        queued[source] = True
+        while queue:
+            node = queue.popleft()
+            queued[node] = False
+            for k, (to, cap, c, _) in enumerate(graph[node]):
+                if cap > _EPS and (dist[to] is None or dist[node] + c < dist[to] - _EPS):
+                    dist[to] = dist[node] + c
+                    prev[to] = (node, k)
+                    if not queued[to]:
+                        queued[to] = True
+                        queue.append(to)
+
+        if dist[sink] is None:
+            break
+
+        amount = float("inf")
+        node = sink
+        while node != source:
+            a, k = prev[node]
+            amount = min(amount, graph[a][k][1])
+            node = a
+
+        node = sink
+        while node != source:
+            a, k = prev[node]
+            edge = graph[a][k]
+            edge[1] -= amount
+            graph[node][edge[3]][1] += amount
+            node = a
+
+    flows = {}
+    for pair, (i, k) in pairs.items():
+        to, cap, c, rev = graph[i][k]
+        sent = graph[to][rev][1]
+        if sent > _EPS:
+            flows[pair] = sent
+    return flows
+
+
+class LogisticsPlanner:
+    """Planer transportów zasobów jednego imperium."""
+
+    def __init__(self, empire):
+        self.empire = empire
+        self._last = {}   # zasób -> (wejście, przesyłki) z poprzedniego cyklu
+        self._costs = {}  # (dawca, cel) -> koszt jednostki
+        self._costs_version = None
+
+    def plan(self, balances):
+        """Przesyłki na ten cykl: {(dawca, cel): {zasób: ilość}}"""
+        galaxy = self.empire.galaxy
+        shipments = {}
+        inbound = self._inbound()
+
+        resources = sorted({
+            res for b in balances.values() for res in b['needs']
+        })
+        for res in resources:
+            # nadwyżka nie większa niż magazyn - inaczej create_transport
+            # odrzuci cały ładunek trasy, także pozostałe zasoby
+            donors = []
+            for p, b in balances.items():
+                supply = min(b['surpluses'].get(res, 0.0), p.storage.get(res, 0.0))
+                if supply > MIN_SHIPMENT:
+                    donors.append((p, supply))
+            targets = []
+            for p, b in balances.items():
+                need = b['needs'].get(res, 0.0) - inbound.get(p, {}).get(res, 0.0)
+                if need > MIN_SHIPMENT:
+                    targets.append((p, need))
+
+            if not donors or not targets:
+                self._last.pop(res, None)
+                continue
+
+            # bez zmian od poprzedniego cyklu - te same przesyłki (nienadane)
+            inputs = (tuple(donors), tuple(targets))
+            last = self._last.get(res)
+            if last is not None and last[0] == inputs:
+                planned = last[1]
+            else:
+                planned = self._solve(donors, targets, galaxy)
+                self._last[res] = (inputs, planned)
+
+            for route, amount in planned:
+                shipments.setdefault(route, {})[res] = amount
+
+        return shipments
+
+    def _solve(self, donors, targets, galaxy):
+        """Przesyłki jednego zasobu: [((dawca, cel), ilość)]"""
+        flows = min_cost_transport(
+            [amount for _, amount in donors],
+            [amount for _, amount in targets],
+            lambda i, j: self._cost(donors[i][0], targets[j][0], galaxy),
+            capacity=MAX_SHIPMENT,
+        )
+        return [
+            ((donors[i][0], targets[j][0]), amount)
+            for (i, j), amount in sorted(flows.items())
+            if amount >= MIN_SHIPMENT
+        ]
+
+    def _cost(self, donor, target, galaxy):
+        if donor is target:
+            return None
+        # koszt zależy tylko od położenia planet i połączeń
+        if self._costs_version != galaxy.lanes_version:
+            self._costs.clear()
+            self._costs_version = galaxy.lanes_version
+        key = (donor, target)
+        try:
+            return self._costs[key]
+        except KeyError:
+            cost = self._costs[key] = calculate_transport_cost(donor, target, None, galaxy)
+            return cost
+
+    def _inbound(self):
+        """Zasoby lecące już do planet imperium: {planeta: {zasób: ilość}}"""
+        inbound = {}
+        for t in self.empire.transport_manager.active.values():
+            cargo = inbound.setdefault(t.target, {})
+            for res, amount in t.resources.items():
+                cargo[res] = cargo.get(res, 0.0) + amount
+        return inbound
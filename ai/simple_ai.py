@@ -3,7 +3,8 @@ ai/simple_ai.py - AI z systemem ról planet
 Planety dostają role na podstawie zasobów i strategii
 """
 
-import random
+from core.rng import stream
+from ai.logistics import LogisticsPlanner
 from buildings.registry import BUILDINGS
 from buildings.PopulationHub import PopulationHub
 from buildings.SpacePort import SpacePort
@@ -11,8 +12,12 @@ from buildings.Mining import MiningComplex
 from military.PlanetaryInvasion import PlanetaryInvasion
 from military.buildings import Barracks, TrainingGrounds
 from core.config import BASIC_RESOURCES, ADVANCED_RESOURCES
+from core.profiler import profiled
+from core import telemetry
 import logging
 
+log = telemetry.channel("ai")
+
 # Simple market prices (cash per unit) used by AI when buying resources
 RESOURCE_MARKET_PRICES = {
     # Increased market prices so sells generate meaningful cash
@@ -84,7 +89,18 @@ class SimpleAI:
         self.military_cooldown = 1
         self.attack_cooldown = 1
         
+        # role kluczowane planetą (nie id()) - zapis gry odtwarza klucze
+        # jako wczytane planety (core/savegame.py)
         self.planet_roles = {}  
+        # stan ról utrzymywany przyrostowo (update_planet_roles)
+        self._role_members = set()     # planety imperium z ostatniej aktualizacji
+        self._owner_version = None     # galaxy.owner_version z ostatniej aktualizacji
+        self._awaiting_role = []       # planety należące, jeszcze nieskolonizowane
+        self._military = set()         # planety z rolą MILITARY
+        # własny strumień losowy imperium (core/rng.py)
+        self.rng = stream("empire", empire.name, "ai")
+        # plan transportów zasobów (ai/logistics.py)
+        self.logistics = LogisticsPlanner(empire)
 
     def tick(self):
         """Główna pętla AI - z systemem ról"""
@@ -130,29 +146,57 @@ class SimpleAI:
     # ============================================
     
     def update_planet_roles(self):
-        """Aktualizuje role wszystkich planet w imperium"""
-        if not self.empire.planets:
+        """Aktualizuje role wszystkich planet w imperium.
+
+        Rola planety liczona jest raz - przy pierwszej aktualizacji, w której
+        planeta należy do imperium i jest skolonizowana. Kolejne wywołania
+        obsługują tylko zmiany: planety ze zdarzeń właściciela galaktyki
+        (``galaxy.owner_changes_since``) i czekające na kolonizację; liczba
+        planet MILITARY jest trzymana w `_military`.
+        """
+        planets = self.empire.planets
+        if not planets:
             return
-        
-        # Usuń role planet które już nie należą do imperium
-        current_ids = {id(p) for p in self.empire.planets}
-        self.planet_roles = {
-            pid: role for pid, role in self.planet_roles.items()
-            if pid in current_ids
-        }
-        
-        # Przypisz role nowym planetom
-        for planet in self.empire.planets:
-            if not planet.colonized:
-                continue
-                
-            pid = id(planet)
-            if pid not in self.planet_roles:
-                self.planet_roles[pid] = self.determine_planet_role(planet)
+
+        # 1️⃣ zmiany przynależności od ostatniej aktualizacji
+        version = self.galaxy.owner_version
+        if version != self._owner_version:
+            changes = self.galaxy.owner_changes_since(self._owner_version)
+            if changes is None:
+                # pierwsza aktualizacja / zbyt stare zmiany - pełne porównanie
+                current = set(planets)
+                lost = self._role_members - current
+                gained = [p for p in planets if p not in self._role_members]
+            else:
+                lost, gained = set(), []
+                for p in dict.fromkeys(changes):
+                    owned = p.owner is self.empire
+                    if owned and p not in self._role_members:
+                        gained.append(p)
+                    elif not owned and p in self._role_members:
+                        lost.add(p)
+                current = (self._role_members - lost).union(gained)
+            self._owner_version = version
+
+            for planet in lost:
+                self._set_roles(planet, None)
+            if lost:
+                self._awaiting_role = [p for p in self._awaiting_role if p not in lost]
+            self._awaiting_role += [p for p in gained if p not in self.planet_roles]
+            self._role_members = current
+
+        # 2️⃣ role dla planet, które właśnie zostały skolonizowane
+        if self._awaiting_role:
+            waiting = []
+            for planet in self._awaiting_role:
+                if planet.colonized:
+                    self._set_roles(planet, self.determine_planet_role(planet))
+                else:
+                    waiting.append(planet)
+            self._awaiting_role = waiting
 
         # Ensure at least one planet is designated MILITARY: pick a suitable candidate
-        military_count = sum(1 for pid, roles in self.planet_roles.items() if PlanetRole.MILITARY in (roles if isinstance(roles, list) else [roles]))
-        if military_count == 0:
+        if not self._military:
             # Prefer a planet with many hexes (>=10), otherwise the one with largest hex count
             candidates = [p for p in self.empire.planets if p.colonized and hasattr(p, 'hex_map')]
             if candidates:
@@ -166,15 +210,27 @@ class SimpleAI:
                     pick = max(candidates, key=lambda x: (len(x.hex_map.hexes), getattr(x.population, 'size', 0)))
 
                 if pick:
-                    self.planet_roles[id(pick)] = [PlanetRole.MILITARY]
+                    self._set_roles(pick, [PlanetRole.MILITARY])
+
+    def _set_roles(self, planet, roles):
+        """Ustawia (None = usuwa) role planety i aktualizuje licznik MILITARY"""
+        if roles is None:
+            self.planet_roles.pop(planet, None)
+        else:
+            self.planet_roles[planet] = roles
+        if roles is not None and PlanetRole.MILITARY in (roles if isinstance(roles, list) else [roles]):
+            self._military.add(planet)
+        else:
+            self._military.discard(planet)
     
     def determine_planet_role(self, planet):
         """Określa optymalną rolę dla planety na podstawie zasobów"""
         
         # Analiza zasobów
+        totals = planet.resource_totals()
         resource_totals = {}
         for res in BASIC_RESOURCES:
-            resource_totals[res] = sum(h.resources.get(res, 0) for h in planet.hex_map.hexes)
+            resource_totals[res] = totals.get(res, 0)
         
         total_resources = sum(resource_totals.values())
         
@@ -222,13 +278,13 @@ class SimpleAI:
     
     def get_planet_role(self, planet):
         """Zwraca rolę planety"""
-        r = self.planet_roles.get(id(planet), [PlanetRole.BALANCED])
+        r = self.planet_roles.get(planet, [PlanetRole.BALANCED])
         # Zwrot kompatybilny: podstawowa (pierwsza) rola
         return r[0] if isinstance(r, list) else r
 
     def get_planet_roles(self, planet):
         """Zwraca listę ról planety (nowe API)"""
-        r = self.planet_roles.get(id(planet), [PlanetRole.BALANCED])
+        r = self.planet_roles.get(planet, [PlanetRole.BALANCED])
         return r if isinstance(r, list) else [r]
 
     def can_start_build(self, planet, building):
@@ -285,7 +341,8 @@ class SimpleAI:
         for r, amt in missing.items():
             planet.storage[r] = planet.storage.get(r, 0.0) + amt
 
-        print(f"[AI {self.empire.name}] Bought resources for build on {getattr(planet,'name',id(planet))}: {missing} cost={total_price:.1f}")
+        log.info("buy", "[AI %(empire)s] Bought resources for build on %(planet)s: %(missing)s cost=%(cost).1f",
+                 empire=self.empire.name, planet=getattr(planet, 'name', id(planet)), missing=missing, cost=total_price)
 
         # Re-check affordability
         return building.can_afford(planet)
@@ -301,7 +358,8 @@ class SimpleAI:
 
                 if planet.military_level < 2:
                     if self.try_build_military_building(planet):
-                        logging.info("[AI %s] Built military building on %s", self.empire.name, getattr(planet, 'name', id(planet)))
+                        log.info("military_build", "[AI %(empire)s] Built military building on %(planet)s",
+                                 empire=self.empire.name, planet=getattr(planet, 'name', id(planet)))
                         return True
 
                 # try recruit if garrison small
@@ -310,7 +368,8 @@ class SimpleAI:
 
                 if garrison_size < max_garrison:
                     if self.try_recruit_unit(planet):
-                        logging.info("[AI %s] Recruiting unit on planet %s", self.empire.name, getattr(planet, 'name', id(planet)))
+                        log.info("recruit", "[AI %(empire)s] Recruiting unit on planet %(planet)s",
+                                 empire=self.empire.name, planet=getattr(planet, 'name', id(planet)))
                         return True
 
                 return False
@@ -335,7 +394,7 @@ class SimpleAI:
                 free_hexes = [h for h in planet.hex_map.hexes if not h.is_blocked() or len(h.buildings_small) < planet.hex_cap]
                 if not free_hexes:
                     return False
-                hex = random.choice(free_hexes)
+                hex = self.rng.choice(free_hexes)
 
                 if planet.military_level < 1:
                     building = Barracks()
@@ -350,7 +409,7 @@ class SimpleAI:
                 building.owner = self.empire
                 success, msg = building.build(planet, hex)
                 if success:
-                    logging.info("[AI %s] %s", self.empire.name, msg)
+                    log.info("military_build", "[AI %(empire)s] %(msg)s", empire=self.empire.name, msg=msg)
                     return True
                 return False
 
@@ -363,15 +422,15 @@ class SimpleAI:
                 if planet.military_level < 2:
                     unit_class = available[0]
                 elif planet.military_level < 3:
-                    unit_class = random.choice(available[:2])
+                    unit_class = self.rng.choice(available[:2])
                 else:
-                    unit_class = random.choice(available)
+                    unit_class = self.rng.choice(available)
                 can_produce, msg = mm.can_produce(unit_class)
                 if not can_produce:
                     return False
                 success, msg = mm.start_production(unit_class, doctrine=None)
                 if success:
-                    logging.info("[AI %s] %s", self.empire.name, msg)
+                    log.info("recruit", "[AI %(empire)s] %(msg)s", empire=self.empire.name, msg=msg)
                     return True
                 return False
 
@@ -386,8 +445,8 @@ class SimpleAI:
                 if not enemy_planet:
                     return
                 attack_force = garrison[: len(garrison) // 2]
-                logging.info("[AI %s] Launching invasion on enemy planet!", self.empire.name)
-                logging.info("  Attack force: %d units", len(attack_force))
+                log.info("invasion", "[AI %(empire)s] Launching invasion on enemy planet! Attack force: %(units)d units",
+                         empire=self.empire.name, units=len(attack_force))
                 for unit in attack_force:
                     garrison.remove(unit)
                 invasion = PlanetaryInvasion(self.empire, enemy_planet, attack_force)
@@ -395,16 +454,25 @@ class SimpleAI:
                     self.galaxy.active_invasions.append(invasion)
 
     def find_enemy_planet(self):
-                for entry in self.galaxy.systems:
-                    for planet in entry["system"].planets:
-                        if planet.owner and planet.owner != self.empire:
-                            return planet
-                return None
+                # Indeks własności zamiast skanowania wszystkich systemów;
+                # min() po (system, orbita) = pierwsza planeta w kolejności galaktyki
+                enemies = [
+                    p for p, owner in self.galaxy.planet_owners.items()
+                    if owner and owner != self.empire and p.owner == owner
+                ]
+                if not enemies:
+                    return None
+                return min(enemies, key=self._galaxy_order)
+
+    def _galaxy_order(self, planet):
+                entry, orbit = self.galaxy.locate_planet(planet)
+                return (entry["id"], orbit) if entry else (float("inf"), 0)
 
     # ============================================
     # DEVELOPMENT SYSTEM - z uwzględnieniem ról
     # ============================================
     
+    @profiled("ai.develop_planet")
     def develop_planet(self, planet):
         """Rozwija planetę zgodnie z jej rolą"""
         
@@ -420,8 +488,8 @@ class SimpleAI:
         success, msg = building.build(planet, hex)
         
         if success:
-            role = self.get_planet_role(planet)
-            print(f"[AI {self.empire.name}] Built on {role} planet: {msg}")
+            log.info("build", "[AI %(empire)s] Built on %(role)s planet: %(msg)s",
+                     empire=self.empire.name, role=self.get_planet_role(planet), msg=msg)
 
     def pick_hex(self, planet):
         """Wybiera najlepszy hex do budowy"""
@@ -439,17 +507,18 @@ class SimpleAI:
         hex_scores = []
         for h in free_hexes:
             score = 0
+            resources = h.resources
             
             # Score bazuje na roli
             if role == PlanetRole.MINING:
                 # Priorytet: wysokie zasoby podstawowe
-                score = h.resources.get('minerals', 0) * 2 + \
-                       h.resources.get('energy', 0) * 2 + \
-                       h.resources.get('gases', 0) * 1.5
+                score = resources.get('minerals', 0) * 2 + \
+                       resources.get('energy', 0) * 2 + \
+                       resources.get('gases', 0) * 1.5
             
             elif role == PlanetRole.REFINERY:
                 # Priorytet: różnorodność zasobów
-                score = len([v for v in h.resources.values() if v > 0.2])
+                score = len([v for v in resources.values() if v > 0.2])
             
             elif role == PlanetRole.METROPOLIS or role == PlanetRole.MILITARY:
                 # Priorytet: puste hexagony (dla budynków specjalnych)
@@ -459,7 +528,7 @@ class SimpleAI:
                     score = 1
             
             else:  # BALANCED
-                score = sum(h.resources.values())
+                score = sum(resources.values())
             
             hex_scores.append((h, score))
         
@@ -467,7 +536,7 @@ class SimpleAI:
         top_count = max(1, len(hex_scores) // 5)
         top_hexes = [h for h, _ in hex_scores[:top_count]]
         
-        return random.choice(top_hexes)
+        return self.rng.choice(top_hexes)
 
     def pick_building(self, planet, hex):
         """Wybiera budynek zgodny z rolą planety"""
@@ -525,11 +594,20 @@ class SimpleAI:
                 refinery = self.try_pick_refinery(planet, hex)
                 if refinery:
                     if not self.can_start_build(planet, refinery):
-                        can_afford = refinery.can_afford(planet)
-                        pop_after = (planet.population.size - getattr(refinery, 'pop_cost', 0.0)) if hasattr(planet, 'population') else None
-                        print(f"[AI DEBUG {self.empire.name}] Refinery {refinery.name} blocked on {getattr(planet,'name',id(planet))}: can_afford={can_afford}, pop_after={pop_after}")
+                        if log.enabled(logging.DEBUG):
+                            log.debug(
+                                "refinery_blocked",
+                                "[AI DEBUG %(empire)s] Refinery %(building)s blocked on %(planet)s: "
+                                "can_afford=%(can_afford)s, pop_after=%(pop_after)s",
+                                empire=self.empire.name,
+                                building=refinery.name,
+                                planet=getattr(planet, 'name', id(planet)),
+                                can_afford=refinery.can_afford(planet),
+                                pop_after=(planet.population.size - getattr(refinery, 'pop_cost', 0.0)) if hasattr(planet, 'population') else None,
+                            )
                     else:
-                        print(f"[AI {self.empire.name}] Building refinery on {role} planet (mines={mines_count}, refineries={refineries_count})")
+                        log.info("pick_building", "[AI %(empire)s] Building refinery on %(role)s planet (mines=%(mines)s, refineries=%(refineries)s)",
+                                 empire=self.empire.name, role=role, mines=mines_count, refineries=refineries_count)
                         return refinery
         
         # 4️⃣ Mining - priorytet dla MINING planet (tylko jeśli nie trzeba rafinerii)
@@ -576,16 +654,19 @@ class SimpleAI:
             if hex.can_build(hub, planet) and self.can_start_build(planet, hub):
                 return hub
         # Debug: no building chosen
-        print(f"[AI DEBUG {self.empire.name}] No building chosen for planet {getattr(planet,'name',id(planet))}: role={role}, P={P}, B={B}, mines={mines_count}, refineries={refineries_count}, priorities={priorities}")
+        log.debug(
+            "no_building",
+            "[AI DEBUG %(empire)s] No building chosen for planet %(planet)s: role=%(role)s, P=%(P)s, B=%(B)s, "
+            "mines=%(mines)s, refineries=%(refineries)s, priorities=%(priorities)s",
+            empire=self.empire.name, planet=getattr(planet, 'name', id(planet)), role=role, P=P, B=B,
+            mines=mines_count, refineries=refineries_count, priorities=priorities,
+        )
         return None
     
     def try_pick_refinery(self, planet, hex):
         """Próbuje wybrać rafinerię"""
         # Zsumuj zasoby surowców na planecie (hex resources)
-        resource_totals = {}
-        for h in planet.hex_map.hexes:
-            for res, val in h.resources.items():
-                resource_totals[res] = resource_totals.get(res, 0.0) + val
+        resource_totals = planet.resource_totals()
 
         refineries = []
 
@@ -635,8 +716,9 @@ class SimpleAI:
                 refineries.append(('FuelRefinery', fr))
 
         if refineries:
-            name, refinery = random.choice(refineries)
-            print(f"[AI {self.empire.name}] Selected {name} (resource_totals: { {k: round(v,1) for k,v in resource_totals.items()} })")
+            name, refinery = self.rng.choice(refineries)
+            log.info("pick_refinery", "[AI %(empire)s] Selected %(building)s (resource_totals: %(totals)s)",
+                     empire=self.empire.name, building=name, totals=resource_totals)
             return refinery
 
         # Fallback: if no strict-match refineries found, try a relaxed approach.
@@ -678,8 +760,9 @@ class SimpleAI:
                             fallback_candidates.append((label, inst))
 
             if fallback_candidates:
-                name, refinery = random.choice(fallback_candidates)
-                print(f"[AI {self.empire.name}] (fallback) Selected {name} (resource_totals: { {k: round(v,1) for k,v in resource_totals.items()} })")
+                name, refinery = self.rng.choice(fallback_candidates)
+                log.info("pick_refinery", "[AI %(empire)s] (fallback) Selected %(building)s (resource_totals: %(totals)s)",
+                         empire=self.empire.name, building=name, totals=resource_totals)
                 return refinery
         except Exception:
             # swallow fallback errors to avoid breaking AI tick
@@ -691,6 +774,7 @@ class SimpleAI:
     # COLONIZATION SYSTEM
     # ============================================
     
+    @profiled("ai.try_colonize")
     def try_colonize(self):
         """Próbuje skolonizować nową planetę"""
         valid_sources = []
@@ -715,7 +799,8 @@ class SimpleAI:
         
         # ✅ Ostateczna weryfikacja przed kolonizacją
         if target.owner or target.colonized or target.colonization_state != "none":
-            print(f"[AI {self.empire.name}] Target planet already claimed, aborting colonization")
+            log.info("colonize", "[AI %(empire)s] Target planet already claimed, aborting colonization",
+                     empire=self.empire.name)
             return False
         
         free_hex = next(
@@ -723,7 +808,7 @@ class SimpleAI:
             None
         )
         if not free_hex:
-            free_hex = random.choice(target.hex_map.hexes)
+            free_hex = self.rng.choice(target.hex_map.hexes)
         
         spaceport = SpacePort()
         spaceport.owner = self.empire
@@ -731,11 +816,11 @@ class SimpleAI:
         success, msg = spaceport.build(target, free_hex, source)
         
         if success:
-            print(f"[AI {self.empire.name}] {msg}")
+            log.info("colonize", "[AI %(empire)s] %(msg)s", empire=self.empire.name, msg=msg)
             # Nowa planeta dostanie rolę przy następnym update_planet_roles()
             return True
         else:
-            print(f"[AI {self.empire.name}] Colonization failed: {msg}")
+            log.info("colonize_failed", "[AI %(empire)s] Colonization failed: %(msg)s", empire=self.empire.name, msg=msg)
         
         return False
 
@@ -764,30 +849,29 @@ class SimpleAI:
 
         ok, msg = self.empire.create_transport(source, target, amount, transport_type="population")
         if ok:
-            print(f"[AI {self.empire.name}] Transporting pop {amount:.1f} from {id(source)} to {id(target)}")
+            log.info("transport", "[AI %(empire)s] Transporting pop %(amount).1f from %(source)s to %(target)s",
+                     empire=self.empire.name, amount=amount, source=id(source), target=id(target))
             return True
         else:
             # fallback: jeśli transport nie powiódł się, spróbuj bezpośredniego przesunięcia (bez transportu)
             if source.population.size >= amount:
                 source.population.size -= amount
                 target.population.size += amount
-                print(f"[AI {self.empire.name}] Direct moved pop {amount:.1f} from {id(source)} to {id(target)} (fallback)")
+                log.info("transport", "[AI %(empire)s] Direct moved pop %(amount).1f from %(source)s to %(target)s (fallback)",
+                         empire=self.empire.name, amount=amount, source=id(source), target=id(target))
                 return True
 
         return False
 
     def find_colonization_target(self, source_planet):
         """Znajduje najlepszą planetę do kolonizacji"""
-        source_system = None
-        for entry in self.galaxy.systems:
-            if any(id(p) == id(source_planet) for p in entry["system"].planets):
-                source_system = entry
-                break
+        source_system = self.galaxy.find_system_entry_of_planet(source_planet)
         
         if not source_system:
             return None
         
         candidates = []
+        role_counts = self.count_planet_roles()
         
         for p in source_system["system"].planets:
             # ✅ Sprawdź że planeta nie ma właściciela I nie jest skolonizowana
@@ -795,7 +879,7 @@ class SimpleAI:
                 p != source_planet and 
                 not p.owner and 
                 not p.colonized):
-                score = self.evaluate_planet_for_colonization(p) * 2
+                score = self.evaluate_planet_for_colonization(p, role_counts) * 2
                 candidates.append((p, score))
         
         for neighbor in source_system["links"]:
@@ -804,7 +888,7 @@ class SimpleAI:
                 if (p.colonization_state == "none" and 
                     not p.owner and 
                     not p.colonized):
-                    score = self.evaluate_planet_for_colonization(p)
+                    score = self.evaluate_planet_for_colonization(p, role_counts)
                     candidates.append((p, score))
         
         if not candidates:
@@ -813,22 +897,29 @@ class SimpleAI:
         candidates.sort(key=lambda x: -x[1])
         top_count = max(1, len(candidates) // 3)
         
-        return random.choice(candidates[:top_count])[0]
+        return self.rng.choice(candidates[:top_count])[0]
 
-    def evaluate_planet_for_colonization(self, planet):
+    def count_planet_roles(self):
+        """Liczba planet imperium wg podstawowej roli"""
+        role_counts = {}
+        for p in self.empire.planets:
+            role = self.get_planet_role(p)
+            role_counts[role] = role_counts.get(role, 0) + 1
+        return role_counts
+
+    def evaluate_planet_for_colonization(self, planet, role_counts=None):
         """Ocenia wartość planety pod kątem przyszłej roli"""
+        totals = planet.resource_totals()
         resource_totals = {}
         for res in BASIC_RESOURCES:
-            resource_totals[res] = sum(h.resources.get(res, 0) for h in planet.hex_map.hexes)
+            resource_totals[res] = totals.get(res, 0)
         
         total = sum(resource_totals.values())
         hex_count = len(planet.hex_map.hexes)
         
         # Bonus dla planet które mogą pełnić potrzebne role
-        role_counts = {}
-        for p in self.empire.planets:
-            role = self.get_planet_role(p)
-            role_counts[role] = role_counts.get(role, 0) + 1
+        if role_counts is None:
+            role_counts = self.count_planet_roles()
         
         # Priorytetyzuj brakujące role
         if role_counts.get(PlanetRole.MILITARY, 0) == 0:
@@ -904,14 +995,16 @@ class SimpleAI:
 
         ok, msg = self.empire.create_transport(source, target, amount, transport_type="population")
         if ok:
-            print(f"[AI {self.empire.name}] Transporting pop {amount:.1f} from {id(source)} to {id(target)}")
+            log.info("transport", "[AI %(empire)s] Transporting pop %(amount).1f from %(source)s to %(target)s",
+                     empire=self.empire.name, amount=amount, source=id(source), target=id(target))
             return True
 
         # fallback direct move (very rare)
         if source.population.size >= amount:
             source.population.size -= amount
             target.population.size += amount
-            print(f"[AI {self.empire.name}] Direct moved pop {amount:.1f} from {id(source)} to {id(target)} (fallback)")
+            log.info("transport", "[AI %(empire)s] Direct moved pop %(amount).1f from %(source)s to %(target)s (fallback)",
+                     empire=self.empire.name, amount=amount, source=id(source), target=id(target))
             return True
 
         return False
@@ -932,7 +1025,7 @@ class SimpleAI:
             if not p.colonized:
                 continue
 
-            production = p.produce() or {}
+            production = p.forecast_production()
 
             needs = {}
             surpluses = {}
@@ -962,64 +1055,23 @@ class SimpleAI:
 
         return balances
 
+    @profiled("ai.balance_resource_transfers")
     def balance_resource_transfers(self, balances):
         """Wykonuje transporty zasobów pomiędzy planetami na podstawie obliczonych bilanów.
 
+        Plan dla całego imperium liczy LogisticsPlanner (ai/logistics.py) -
+        wszystkie przesyłki cyklu naraz, po jednym transporcie na trasę.
         Zwraca True jeśli utworzono transport.
         """
-        # Najpierw szukamy krytycznych potrzeb (np. alloys dla planet military)
-        # Zbierz wszystkie potrzeby
-        needs_by_res = {}
-        for p, b in balances.items():
-            for res, amt in b['needs'].items():
-                needs_by_res.setdefault(res, []).append((p, amt))
-
-        # Spróbuj zaspokoić potrzeby od donorów z surplusem
-        for res, need_list in needs_by_res.items():
-            # Sortuj potrzeby najbardziej pilne
-            need_list.sort(key=lambda x: -x[1])
-            for target, need_amt in need_list:
-                # znajdź donora
-                best_donor = None
-                best_amount = 0.0
-                for donor, b2 in balances.items():
-                    if donor == target:
-                        continue
-                    available = b2['surpluses'].get(res, 0.0)
-                    if available > best_amount:
-                        best_amount = available
-                        best_donor = donor
-
-                # Allow smaller donors to participate; be more willing to move resources
-                if best_donor and best_amount > 0.5:
-                    send = min(best_amount, need_amt, 40.0)
-                    cargo = {res: send}
-                    ok, msg = self.empire.create_transport(best_donor, target, cargo, "resources")
-                    if ok:
-                        print(f"[AI {self.empire.name}] Transport {send:.1f} {res} from {id(best_donor)} to {id(target)}: {msg}")
-                        return True
-
-        # Jeśli brak wyraźnych donorów dla potrzeb, spróbuj przenieść ogólne nadwyżki (energy/minerals)
-        for res in ['energy', 'minerals', 'alloys']:
-            for donor, b in balances.items():
-                amt = b['surpluses'].get(res, 0.0)
-                # be more willing to move smaller surpluses
-                if amt <= 2.0:
-                    continue
-                # znajdź target potrzebujący
-                targets = [ (t, nb['needs'].get(res,0.0)) for t, nb in balances.items() if nb['needs'].get(res,0.0) > 0 ]
-                if not targets:
-                    continue
-                targets.sort(key=lambda x: -x[1])
-                target, need_amt = targets[0]
-                send = min(amt, need_amt, 40.0)
-                cargo = {res: send}
-                ok, msg = self.empire.create_transport(donor, target, cargo, "resources")
-                if ok:
-                    print(f"[AI {self.empire.name}] General transport {send:.1f} {res} from {id(donor)} to {id(target)}: {msg}")
-                    return True
-
-        return False
+        sent = False
+        for (donor, target), cargo in self.logistics.plan(balances).items():
+            ok, msg = self.empire.create_transport(donor, target, cargo, "resources")
+            if ok:
+                log.info("transport", "[AI %(empire)s] Transport %(cargo)s from %(source)s to %(target)s: %(msg)s",
+                         empire=self.empire.name, cargo=cargo, source=id(donor), target=id(target), msg=msg)
+                sent = True
+
+        return sent
     
     def _get_critical_needs(self, planet):
         """Zasoby których brakuje"""
@@ -1071,7 +1123,8 @@ class SimpleAI:
                 if send > 0.5:
                     ok, msg = self.empire.create_transport(donor, p, {'alloys': send}, "resources")
                     if ok:
-                        print(f"[AI {self.empire.name}] Transporting {send:.1f} alloys to military planet {getattr(p,'name',id(p))}: {msg}")
+                        log.info("transport", "[AI %(empire)s] Transporting %(amount).1f alloys to military planet %(target)s: %(msg)s",
+                                 empire=self.empire.name, amount=send, target=getattr(p, 'name', id(p)), msg=msg)
                         return True
 
             # No donor: consider buying alloys directly for the planet
@@ -1081,7 +1134,8 @@ class SimpleAI:
             if cost > 0 and cost <= self.empire.cash and cost <= max_spend:
                 self.empire.cash -= cost
                 p.storage['alloys'] = p.storage.get('alloys', 0.0) + need
-                print(f"[AI {self.empire.name}] Bought quick {need:.1f} alloys for military planet {getattr(p,'name',id(p))} cost={cost:.1f}")
+                log.info("buy", "[AI %(empire)s] Bought quick %(amount).1f alloys for military planet %(planet)s cost=%(cost).1f",
+                         empire=self.empire.name, amount=need, planet=getattr(p, 'name', id(p)), cost=cost)
                 return True
 
         return False
@@ -1124,7 +1178,8 @@ class SimpleAI:
                     if send > 0.5:
                         ok, msg = self.empire.create_transport(donor, p, {res: send}, "resources")
                         if ok:
-                            print(f"[AI {self.empire.name}] Quick transport {send:.1f} {res} from {id(donor)} to {id(p)}: {msg}")
+                            log.info("transport", "[AI %(empire)s] Quick transport %(amount).1f %(res)s from %(source)s to %(target)s: %(msg)s",
+                                     empire=self.empire.name, amount=send, res=res, source=id(donor), target=id(p), msg=msg)
                             return True
                 else:
                     # No donor found: consider buying the missing resource with cash
@@ -1135,7 +1190,8 @@ class SimpleAI:
                         # perform purchase
                         self.empire.cash -= cost
                         p.storage[res] = p.storage.get(res, 0.0) + amt
-                        print(f"[AI {self.empire.name}] Bought quick {amt:.1f} {res} for {getattr(p,'name',id(p))} cost={cost:.1f}")
+                        log.info("buy", "[AI %(empire)s] Bought quick %(amount).1f %(res)s for %(planet)s cost=%(cost).1f",
+                                 empire=self.empire.name, amount=amt, res=res, planet=getattr(p, 'name', id(p)), cost=cost)
                         return True
 
         # 2) Population emergencies: bring at least 1 pop if any colony falls below 1.0
@@ -1153,7 +1209,8 @@ class SimpleAI:
                     amount = max(1.0, source.population.size - 1.0)
                 ok, msg = self.empire.create_transport(source, target, amount, "population")
                 if ok:
-                    print(f"[AI {self.empire.name}] Emergency pop transport {amount:.1f} from {id(source)} to {id(target)}: {msg}")
+                    log.info("transport", "[AI %(empire)s] Emergency pop transport %(amount).1f from %(source)s to %(target)s: %(msg)s",
+                             empire=self.empire.name, amount=amount, source=id(source), target=id(target), msg=msg)
                     return True
 
         return False
@@ -1182,7 +1239,8 @@ class SimpleAI:
 
                 revenue = p.sell_excess(self.empire, res, keep, price)
                 if revenue and revenue > 0.0:
-                    print(f"[AI {self.empire.name}] Sold {res} from planet {getattr(p,'name',id(p))} revenue={revenue:.1f}")
+                    log.info("sell", "[AI %(empire)s] Sold %(res)s from planet %(planet)s revenue=%(revenue).1f",
+                             empire=self.empire.name, res=res, planet=getattr(p, 'name', id(p)), revenue=revenue)
                     sold_any = True
                     # perform only one sale per tick to keep behavior gradual
                     return True
@@ -1,4 +1,5 @@
 # buildings/Building.py - dodaj metodę build()
+from core import replay
 
 class Building:
     def __init__(
@@ -68,6 +69,8 @@ class Building:
         
         # 5️⃣ Zastosowanie efektu planetarnego
         self.apply_planet_effect(planet)
+
+        replay.active().record("build", building=self.name, empire=self.owner, planet=planet, hex=hex.index)
         
         return True, f"{self.name} built successfully"
 
@@ -1,5 +1,6 @@
 from buildings.Building import Building
 from buildings.constants import BUILDING_EMPIRE_UNIQUE
+from core import replay
 from core.config import BASIC_RESOURCES
 from empire.Population import Population
 from planet.resources import ALL_RESOURCES
@@ -45,6 +46,8 @@ class EmpireSpacePort(Building):
         planet.storage = {r: 0.0 for r in ALL_RESOURCES}
         planet.storage = {r: 10.0 for r in BASIC_RESOURCES}
 
+        replay.active().record("build", building=self.name, empire=self.owner, planet=planet, hex=hex.index)
+
 
 
 
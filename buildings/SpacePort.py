@@ -1,6 +1,7 @@
 import re
 from buildings.Building import Building
 from buildings.constants import BUILDING_PLANET_UNIQUE
+from core import replay
 from core.config import BASIC_RESOURCES
 from empire.Population import Population
 
@@ -42,6 +43,9 @@ class SpacePort(Building):
                 target_planet.population.size+=1.0
                 # 5️⃣ Postaw budynek
                 hex.add_building(self)
+                replay.active().record(
+                    "build", building=self.name, empire=self.owner, planet=target_planet, hex=hex.index
+                )
                 
                 return True, f"Colonization started from source planet"
             
@@ -9,6 +9,9 @@ HIGH_THRESHOLD = 0.3
 # siła wpływu źródeł
 SOURCE_FALLOFF = 0.3
 
+# dopuszczalna różnica silnika pól (planet/fields.py) względem Source.influence
+FIELD_TOLERANCE = 0.0
+
 # rozmiary
 PLANET_RADIUS_MIN = 6
 PLANET_RADIUS_MAX = 12
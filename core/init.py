@@ -1,4 +1,7 @@
 from buildings.EmpireSpacePort import EmpireSpacePort
+from core import telemetry
+
+log = telemetry.channel("init")
 
 
 def init_start_planet(empire, system_entry):
@@ -27,4 +30,4 @@ def init_start_planet(empire, system_entry):
     planet.owner = empire
     planet.colonized = True
 
-    print(f"INIT {empire.name}: {msg}")
+    log.info("start_planet", "INIT %(empire)s: %(msg)s", empire=empire.name, msg=msg)
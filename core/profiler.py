@@ -0,0 +1,199 @@
+# core/profiler.py
+"""
+Opcjonalny pomiar czasu faz tury.
+
+Aktywny profiler jest jeden na proces (``install()`` / ``active()``).
+Domyślnie to NULL_PROFILER - ``phase()`` zwraca wspólny, pusty context
+manager, a dekorator ``profiled`` sprawdza tylko flagę ``enabled``,
+więc wyłączony pomiar prawie nic nie kosztuje.
+
+Fazy mogą być zagnieżdżone; czas zapisywany jest pod ścieżką
+``"empires/AI 1/ai.develop_planet"``.
+"""
+import csv
+import functools
+import json
+from time import perf_counter
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class NullProfiler:
+    enabled = False
+
+    def phase(self, name):
+        return _NULL_PHASE
+
+    def count(self, name, n=1):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "path", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.path = self.profiler._push(self.name)
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._pop(self.path, perf_counter() - self.start)
+        return False
+
+
+class TickProfiler:
+    """Czas [s] i liczba wywołań dla każdej ścieżki faz + liczniki zdarzeń."""
+
+    enabled = True
+
+    def __init__(self):
+        self.totals = {}
+        self.calls = {}
+        self.counters = {}
+        self.order = {}       # ścieżka -> kolejność pierwszego wejścia
+        self._stack = []
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def _push(self, name):
+        self._stack.append(name)
+        path = "/".join(self._stack)
+        if path not in self.order:
+            self.order[path] = len(self.order)
+        return path
+
+    def _pop(self, path, elapsed):
+        self._stack.pop()
+        self.totals[path] = self.totals.get(path, 0.0) + elapsed
+        self.calls[path] = self.calls.get(path, 0) + 1
+
+    def stats(self):
+        order = self.order
+
+        def tree_key(path):
+            parts = path.split("/")
+            return [order["/".join(parts[:i + 1])] for i in range(len(parts))]
+
+        phases = [
+            PhaseStats(path, self.calls[path], total)
+            for path, total in self.totals.items()
+        ]
+        phases.sort(key=lambda p: tree_key(p.path))
+        return ProfileStats(phases, dict(self.counters))
+
+
+class PhaseStats:
+    def __init__(self, path, calls, total_s):
+        self.path = path
+        self.calls = calls
+        self.total_s = total_s
+
+    @property
+    def name(self):
+        return self.path.rsplit("/", 1)[-1]
+
+    @property
+    def depth(self):
+        return self.path.count("/")
+
+    @property
+    def mean_ms(self):
+        return self.total_s / self.calls * 1000 if self.calls else 0.0
+
+    def to_dict(self):
+        return {
+            "path": self.path,
+            "calls": self.calls,
+            "total_s": self.total_s,
+            "mean_ms": self.mean_ms,
+        }
+
+
+class ProfileStats:
+    """Wynik pomiaru: fazy (w kolejności drzewa) i liczniki."""
+
+    CSV_FIELDS = ["path", "calls", "total_s", "mean_ms"]
+
+    def __init__(self, phases, counters):
+        self.phases = list(phases)
+        self.counters = counters
+
+    def __iter__(self):
+        return iter(self.phases)
+
+    def get(self, path):
+        for phase in self.phases:
+            if phase.path == path:
+                return phase
+        return None
+
+    def to_dict(self):
+        return {
+            "phases": [p.to_dict() for p in self.phases],
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self, path=None):
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def to_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.CSV_FIELDS)
+            writer.writeheader()
+            for phase in self.phases:
+                writer.writerow(phase.to_dict())
+
+
+_active = NULL_PROFILER
+
+
+def active():
+    return _active
+
+
+def install(profiler):
+    """Ustawia aktywny profiler (None = wyłączony). Zwraca poprzedni."""
+    global _active
+    previous = _active
+    _active = profiler if profiler is not None else NULL_PROFILER
+    return previous
+
+
+def profiled(name):
+    """Dekorator: mierzy wywołania funkcji jako fazę `name`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if not profiler.enabled:
+                return fn(*args, **kwargs)
+            with profiler.phase(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
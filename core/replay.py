@@ -0,0 +1,244 @@
+# core/replay.py
+"""
+Dziennik tur: zdarzenia + klatki kluczowe, skok do dowolnej tury.
+
+Aktywny rejestrator jest jeden na proces (``install()`` / ``active()``),
+jak profiler. Domyślnie to NULL_RECORDER - ``record()`` nic nie robi.
+``ReplayLog`` zapisuje (tylko dopisując) zdarzenia gry:
+
+    build        budowa budynku (Building.build i porty)
+    transport    nowy transport (TransportManager.create_transport)
+    colonize     koniec kolonizacji (Planet.finish_colonization)
+    combat_round runda walki (CombatResolver.tick)
+    owner        zmiana właściciela (Planet.set_owner)
+
+oraz co ``keyframe_interval`` tur pełny stan galaktyki (core/savegame.py).
+
+``seek(turn)`` wczytuje najbliższą wcześniejszą klatkę i liczy tury do
+``turn`` - symulacja jest deterministyczna (core/rng.py), więc to daje
+ten sam stan co gra nagrana, bez liczenia od tury 0. Zdarzenia z
+ponownie policzonych tur porównywane są z dziennikiem; pierwsza różnica
+(np. po zmianie kodu AI) kończy się ``ReplayDivergence`` z numerem tury.
+
+Zdarzenia spoza tury (np. budowa z UI między turami) nie dają się
+odtworzyć symulacją - po takim zdarzeniu następna tura zaczyna się od
+klatki kluczowej.
+"""
+import pickle
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+REPLAY_MAGIC = b"4XREPLAY"
+REPLAY_VERSION = 1
+
+DEFAULT_KEYFRAME_INTERVAL = 50
+
+
+@dataclass(frozen=True)
+class ReplayEvent:
+    turn: int
+    kind: str
+    data: Tuple[Tuple[str, Any], ...]
+    in_tick: bool = True
+
+    def get(self, name, default=None):
+        return dict(self.data).get(name, default)
+
+
+class ReplayDivergence(RuntimeError):
+    def __init__(self, turn, expected, actual):
+        self.turn = turn
+        self.expected = expected
+        self.actual = actual
+        super().__init__(f"Replay diverged at turn {turn}")
+
+
+class NullRecorder:
+    enabled = False
+
+    def record(self, kind, **data):
+        pass
+
+    def begin_turn(self, galaxy):
+        pass
+
+    def end_turn(self, galaxy):
+        pass
+
+
+NULL_RECORDER = NullRecorder()
+
+_active = NULL_RECORDER
+
+
+def active():
+    return _active
+
+
+def install(recorder):
+    """Ustawia aktywny rejestrator (None = wyłączony). Zwraca poprzedni."""
+    global _active
+    previous = _active
+    _active = recorder if recorder is not None else NULL_RECORDER
+    return previous
+
+
+class EventRecorder:
+    """Zbiera zdarzenia tur; obiekty gry zamieniane są na proste klucze."""
+
+    enabled = True
+
+    def __init__(self, galaxy=None):
+        self.galaxy = galaxy
+        self.events = []
+        self.turn = galaxy.turn if galaxy is not None else 0
+        self.in_tick = False
+
+    def begin_turn(self, galaxy):
+        self.galaxy = galaxy
+        self.turn = galaxy.turn + 1
+        self.in_tick = True
+
+    def end_turn(self, galaxy):
+        self.in_tick = False
+
+    def record(self, kind, **data):
+        self.events.append(ReplayEvent(
+            self.turn,
+            kind,
+            tuple((name, self._key(value)) for name, value in sorted(data.items())),
+            self.in_tick,
+        ))
+
+    def _key(self, value):
+        # planety jako (id systemu, orbita), imperia jako nazwy
+        if hasattr(value, "hex_map"):
+            entry, orbit = self.galaxy.locate_planet(value) if self.galaxy else (None, None)
+            return ("planet", entry["id"] if entry else None, orbit)
+        if hasattr(value, "planets") and hasattr(value, "name"):
+            return value.name
+        if isinstance(value, dict):
+            return tuple(sorted(value.items()))
+        return value
+
+
+class ReplayLog(EventRecorder):
+    """Dziennik zdarzeń + klatki kluczowe (bajty z core/savegame.py)."""
+
+    def __init__(self, galaxy, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        super().__init__(galaxy)
+        self.keyframe_interval = keyframe_interval
+        self.keyframes = {}
+        self._needs_keyframe = True
+
+    # ---------- nagrywanie ----------
+
+    def begin_turn(self, galaxy):
+        if self._needs_keyframe or galaxy.turn % self.keyframe_interval == 0:
+            self.add_keyframe(galaxy)
+        super().begin_turn(galaxy)
+
+    def record(self, kind, **data):
+        super().record(kind, **data)
+        if not self.in_tick:
+            self._needs_keyframe = True
+
+    def add_keyframe(self, galaxy):
+        # import tutaj: core.savegame importuje klasy gry, które importują ten moduł
+        from core import savegame
+
+        self.keyframes[galaxy.turn] = savegame.dumps(galaxy)
+        self._needs_keyframe = False
+
+    def events_for(self, first, last):
+        """Zdarzenia tur first..last (włącznie) policzone w trakcie tury."""
+        return [e for e in self.events if first <= e.turn <= last and e.in_tick]
+
+    # ---------- odtwarzanie ----------
+
+    def keyframe_before(self, turn):
+        """Najpóźniejsza klatka kluczowa nie późniejsza niż `turn`."""
+        turns = [t for t in self.keyframes if t <= turn]
+        if not turns:
+            raise ValueError(f"No keyframe at or before turn {turn}")
+        return max(turns)
+
+    def seek(self, turn, verify=True):
+        """Nowa galaktyka w stanie po turze `turn`."""
+        from core import savegame
+
+        base = self.keyframe_before(turn)
+        galaxy = savegame.loads(self.keyframes[base])
+
+        # ponowne tury zbierane osobnym rejestratorem
+        check = EventRecorder(galaxy)
+        previous = install(check)
+        try:
+            while galaxy.turn < turn:
+                galaxy.tick()
+                if verify:
+                    self._verify_turn(galaxy.turn, check.events)
+                check.events = []
+        finally:
+            install(previous)
+
+        return galaxy
+
+    def _verify_turn(self, turn, actual):
+        # tury dalej niż nagranie nie mają z czym się porównać
+        if turn > self.turn:
+            return
+        expected = self.events_for(turn, turn)
+        actual = [e for e in actual if e.in_tick]
+        if actual != expected:
+            raise ReplayDivergence(turn, expected, actual)
+
+    def rewind(self, turn):
+        """Cofa nagranie do tury `turn`; zwraca galaktykę do dalszej gry.
+
+        Zdarzenia i klatki późniejsze niż `turn` są usuwane, a dalsze
+        tury nagrywają się w ten sam dziennik.
+        """
+        galaxy = self.seek(turn)
+        # zdarzenia z UI po turze `turn` są w stanie tylko, jeśli jest jej klatka
+        self.events = [
+            e for e in self.events
+            if e.turn < turn or (e.turn == turn and (e.in_tick or turn in self.keyframes))
+        ]
+        self.keyframes = {t: data for t, data in self.keyframes.items() if t <= turn}
+        self.galaxy = galaxy
+        self.turn = turn
+        self.in_tick = False
+        self._needs_keyframe = True
+        return galaxy
+
+    # ---------- plik ----------
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(REPLAY_MAGIC)
+            pickle.dump({
+                "version": REPLAY_VERSION,
+                "keyframe_interval": self.keyframe_interval,
+                "turn": self.turn,
+                "events": self.events,
+                "keyframes": self.keyframes,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            if f.read(len(REPLAY_MAGIC)) != REPLAY_MAGIC:
+                raise ValueError("Not a replay file")
+            # jak zapis gry - tylko klasy gry (core/savegame.py)
+            from core import savegame
+            state = savegame.safe_load(f)
+
+        if state["version"] != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {state['version']}")
+
+        log = cls(None, state["keyframe_interval"])
+        log.turn = state["turn"]
+        log.events = state["events"]
+        log.keyframes = state["keyframes"]
+        return log
@@ -1,9 +1,63 @@
 # core/rng.py
+"""
+Losowość gry - wszystko wyprowadzone z ``SEED``.
+
+Funkcje modułu (rand / uniform / choice / randint) korzystają ze
+wspólnego strumienia. ``stream(*path)`` zwraca niezależny strumień dla
+ścieżki, np. ``stream("galaxy", "system", 12)`` albo
+``stream("empire", "AI 1", "ai")``. Ziarno strumienia zależy tylko od
+(SEED, ścieżka), a nie od tego, ile losowań zrobiły inne podsystemy -
+ta sama tura daje ten sam wynik liczona szeregowo i równolegle.
+"""
+import hashlib
 import random
+
 from core.config import SEED
 
+_seed = SEED
 _rng = random.Random(SEED)
 
+
+def derive_seed(seed, path):
+    """Stabilne (niezależne od PYTHONHASHSEED) ziarno dla ścieżki."""
+    data = repr((seed,) + tuple(path)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+class RngStream(random.Random):
+    """random.Random z ziarnem wyprowadzonym ze ścieżki; ``split`` daje podstrumień."""
+
+    def __init__(self, path=(), seed=None):
+        self.path = tuple(path)
+        self.root_seed = _seed if seed is None else seed
+        super().__init__(derive_seed(self.root_seed, self.path))
+
+    def split(self, *names):
+        return RngStream(self.path + names, self.root_seed)
+
+    def __reduce__(self):
+        return (RngStream, (self.path, self.root_seed), self.getstate())
+
+    def __repr__(self):
+        return f"RngStream({'/'.join(map(str, self.path))})"
+
+
+def shared_stream():
+    """Wspólny strumień modułu (dla kodu, który nie dostał własnego)."""
+    return _rng
+
+
+def stream(*path):
+    return RngStream(path)
+
+
+def set_seed(seed):
+    """Ustawia ziarno gry (dla strumieni tworzonych od tej chwili)."""
+    global _seed
+    _seed = seed
+    _rng.seed(seed)
+
+
 def rand():
     return _rng.random()
 
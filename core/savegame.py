@@ -0,0 +1,430 @@
+# core/savegame.py
+"""
+Zapis i odczyt pełnego stanu galaktyki w zwartym formacie binarnym.
+
+Plik:
+    nagłówek  MAGIC, VERSION, liczba sekcji
+    sekcje    u64 długość + dane:
+      0       meta (pickle): tura, liczby obiektów, rozmiary map planet
+      1..6    pola i wydobycie heksów wszystkich planet jako spakowane
+              tablice ``array('d')`` (po jednej na parametr)
+      7..11   źródła pól planet (liczba, typ, q, r, siła) jako tablice
+      12      rekordy obiektów (pickle): tabela systemów, stan galaktyki,
+              imperiów i planet
+
+Encje (galaktyka, systemy, imperia, planety, widoki heksów) nie są
+zapisywane jako graf - każde odwołanie do nich to krótki klucz. Dzięki
+temu rekordy są małe, a zapis nie schodzi rekurencyjnie po połączeniach
+systemów (połączenia to listy indeksów w tabeli systemów). Budynki,
+jednostki, transporty i inwazje zapisywane są jako zwykłe rekordy
+atrybutów.
+Cache (metryki planet, plany produkcji, widoki) nie są zapisywane.
+
+Rekordy to pickle, ale odczyt przechodzi przez ``safe_loads`` - wolno
+tworzyć tylko klasy z pakietów gry (``GAME_PACKAGES``) i kilka typów
+wbudowanych (``_SAFE_GLOBALS``); inne globalne (funkcje, moduły systemu)
+kończą odczyt błędem ``SaveFormatError``. Zakładamy, że plik zapisu
+pochodzi z gry - lista zamyka najprostszą drogę do wykonania kodu z
+podrzuconego pliku, ale nie jest pełną walidacją jego zawartości.
+"""
+import copyreg
+import functools
+import gc
+import io
+import pickle
+import struct
+import threading
+from array import array
+
+from galaxy.galaxy import Galaxy
+from galaxy.star import Star
+from galaxy.system import StarSystem
+from empire.empire import Empire
+from planet.planet import Planet
+from planet.hex import Hex
+from planet.hex_map import HexMap
+from planet.fields import FIELD_PARAMS
+from planet.sources import SOURCE_TYPES
+
+MAGIC = b"4XSAVE"
+VERSION = 1
+
+_HEADER = struct.Struct("<6sHH")
+_SECTION = struct.Struct("<Q")
+
+# kolejność sekcji po nagłówku
+SECTIONS = (
+    "meta",
+    *(f"field.{param}" for param in FIELD_PARAMS),
+    *(f"yield.{param}" for param in FIELD_PARAMS),
+    "sources.count",
+    "sources.type",
+    "sources.q",
+    "sources.r",
+    "sources.strength",
+    "objects",
+)
+
+SOURCE_NAMES = tuple(SOURCE_TYPES)
+_SOURCE_CODES = {name: i for i, name in enumerate(SOURCE_NAMES)}
+
+# atrybuty planety odtwarzane leniwie po wczytaniu
+_PLANET_CACHES = {
+    "_metrics": dict,
+    "_metrics_version": lambda: None,
+    "_production_plan": lambda: None,
+    "_forecast": lambda: None,
+}
+
+_ENTITY_TYPES = (Galaxy, StarSystem, Empire, Planet, Hex)
+
+# pakiety, których klasy mogą wystąpić w zapisie
+GAME_PACKAGES = ("ai", "buildings", "core", "empire", "galaxy", "military", "planet")
+
+# globalne spoza pakietów gry dozwolone przy odczycie
+_SAFE_GLOBALS = {
+    ("builtins", name) for name in (
+        "int", "float", "complex", "bool", "str", "bytes", "bytearray",
+        "list", "tuple", "dict", "set", "frozenset", "range", "slice", "object",
+    )
+} | {
+    ("collections", name) for name in ("OrderedDict", "defaultdict", "deque", "Counter")
+} | {
+    ("array", "array"),
+    ("array", "_array_reconstructor"),
+}
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+class _SafeUnpickler(pickle.Unpickler):
+    """Unpickler tworzący tylko klasy gry i typy z `_SAFE_GLOBALS`."""
+
+    def find_class(self, module, name):
+        if (module, name) in _SAFE_GLOBALS:
+            return super().find_class(module, name)
+        if module == __name__ and name == "_entity":
+            return _entity
+        if "." not in name and module.split(".")[0] in GAME_PACKAGES:
+            obj = super().find_class(module, name)
+            # tylko klasy zdefiniowane w grze (nie funkcje, nie importowane moduły)
+            if isinstance(obj, type) and obj.__module__.split(".")[0] in GAME_PACKAGES:
+                return obj
+        raise SaveFormatError(f"Forbidden global in save file: {module}.{name}")
+
+
+def safe_loads(data):
+    """pickle.loads ograniczone do klas gry (patrz _SafeUnpickler)."""
+    return _SafeUnpickler(io.BytesIO(data)).load()
+
+
+def safe_load(file):
+    return _SafeUnpickler(file).load()
+
+
+# ----------------------------------------------------------------------
+# ODWOŁANIA DO ENCJI
+# ----------------------------------------------------------------------
+# Encje w rekordach zapisywane są jako wywołanie _entity(klucz). Reduktory
+# są w dispatch_table (wybór po typie w C), więc zwykłe obiekty nie
+# przechodzą przez żaden kod Pythona podczas zapisu.
+
+_loading = threading.local()
+
+
+def _entity(key):
+    return _loading.resolve(key)
+
+
+def _reference_pickler(file, refs):
+    def reduce_entity(obj):
+        key = refs.get(id(obj))
+        if key is None:
+            # obiekt spoza galaktyki - zapisywany w całości
+            return copyreg.__reduce_ex__(obj, 2)
+        return _entity, (key,)
+
+    pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    for cls in _ENTITY_TYPES:
+        pickler.dispatch_table[cls] = reduce_entity
+    return pickler
+
+
+def _galaxy_planets(galaxy):
+    return [p for entry in galaxy.systems for p in entry["system"].planets]
+
+
+# ----------------------------------------------------------------------
+# ZAPIS
+# ----------------------------------------------------------------------
+
+def _pack_sources(planets):
+    counts = array("H")
+    types = array("B")
+    qs = array("b")
+    rs = array("b")
+    strengths = array("d")
+
+    for planet in planets:
+        counts.append(len(planet.sources))
+        for src in planet.sources:
+            types.append(_SOURCE_CODES[type(src).__name__])
+            qs.append(src.q)
+            rs.append(src.r)
+            strengths.append(src.strength)
+
+    return [a.tobytes() for a in (counts, types, qs, rs, strengths)]
+
+
+def _without_gc(func):
+    # dużo krótko żyjących obiektów naraz - bez przebiegów GC w trakcie
+    @functools.wraps(func)
+    def wrapper(*args):
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return func(*args)
+        finally:
+            if enabled:
+                gc.enable()
+
+    return wrapper
+
+
+@_without_gc
+def dumps(galaxy):
+    """Pełny stan galaktyki jako bajty (format opisany wyżej)."""
+    planets = _galaxy_planets(galaxy)
+
+    # 1️⃣ klucze encji
+    refs = {id(galaxy): ("G",)}
+    for i, entry in enumerate(galaxy.systems):
+        refs[id(entry["system"])] = ("Y", i)
+    for i, empire in enumerate(galaxy.empires):
+        refs[id(empire)] = ("E", i)
+    for i, planet in enumerate(planets):
+        refs[id(planet)] = ("P", i)
+        for index, view in planet.hex_map._views.items():
+            refs[id(view)] = ("H", i, index)
+
+    # 2️⃣ spakowane tablice heksów i źródeł
+    columns = {param: [] for param in FIELD_PARAMS}
+    yield_columns = {param: [] for param in FIELD_PARAMS}
+    for planet in planets:
+        hm = planet.hex_map
+        for param in FIELD_PARAMS:
+            columns[param].append(getattr(hm, param).tobytes())
+            yield_columns[param].append(hm.yields[param].tobytes())
+
+    # 3️⃣ rekordy obiektów
+    system_index = {id(entry): i for i, entry in enumerate(galaxy.systems)}
+    systems = [
+        (
+            entry["id"],
+            entry["x"],
+            entry["y"],
+            entry["system"].star.type,
+            len(entry["system"].planets),
+            [system_index[id(t)] for t in entry["links"]],
+        )
+        for entry in galaxy.systems
+    ]
+
+    galaxy_state = dict(vars(galaxy))
+    for key in ("systems", "planet_locations", "planet_owners"):
+        galaxy_state.pop(key, None)
+
+    planet_states = []
+    for planet in planets:
+        state = dict(vars(planet))
+        for key in _PLANET_CACHES:
+            state.pop(key, None)
+        del state["sources"]
+        state["hex_map"] = planet.hex_map.to_record()
+        planet_states.append(state)
+
+    buf = io.BytesIO()
+    _reference_pickler(buf, refs).dump((
+        systems,
+        galaxy_state,
+        [dict(vars(e)) for e in galaxy.empires],
+        planet_states,
+    ))
+
+    meta = {
+        "version": VERSION,
+        "turn": galaxy.turn,
+        "systems": len(galaxy.systems),
+        "empires": len(galaxy.empires),
+        "planets": len(planets),
+        "map_sizes": array("I", (p.hex_map.size for p in planets)).tobytes(),
+        "source_types": SOURCE_NAMES,
+    }
+
+    sections = [pickle.dumps(meta, protocol=pickle.HIGHEST_PROTOCOL)]
+    sections += [b"".join(columns[param]) for param in FIELD_PARAMS]
+    sections += [b"".join(yield_columns[param]) for param in FIELD_PARAMS]
+    sections += _pack_sources(planets)
+    sections.append(buf.getvalue())
+
+    out = [_HEADER.pack(MAGIC, VERSION, len(sections))]
+    for data in sections:
+        out.append(_SECTION.pack(len(data)))
+        out.append(data)
+    return b"".join(out)
+
+
+def save_galaxy(galaxy, path):
+    data = dumps(galaxy)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+# ----------------------------------------------------------------------
+# ODCZYT
+# ----------------------------------------------------------------------
+
+def _read_sections(data):
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("File too short")
+
+    magic, version, count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a savegame file")
+    if version != VERSION:
+        raise SaveFormatError(f"Unsupported savegame version {version} (expected {VERSION})")
+    if count != len(SECTIONS):
+        raise SaveFormatError(f"Expected {len(SECTIONS)} sections, got {count}")
+
+    view = memoryview(data)
+    pos = _HEADER.size
+    sections = {}
+    for name in SECTIONS:
+        (size,) = _SECTION.unpack_from(data, pos)
+        pos += _SECTION.size
+        sections[name] = view[pos:pos + size]
+        pos += size
+    return sections
+
+
+def _column(data, typecode):
+    column = array(typecode)
+    column.frombytes(data)
+    return column
+
+
+def _split_column(data, sizes):
+    column = _column(data, "d")
+    parts = []
+    pos = 0
+    for size in sizes:
+        parts.append(column[pos:pos + size])
+        pos += size
+    return parts
+
+
+def _unpack_sources(sections, source_types):
+    """Listy źródeł kolejnych planet."""
+    classes = [SOURCE_TYPES[name] for name in source_types]
+    every = [
+        classes[t](q, r, strength)
+        for t, q, r, strength in zip(
+            _column(sections["sources.type"], "B"),
+            _column(sections["sources.q"], "b"),
+            _column(sections["sources.r"], "b"),
+            _column(sections["sources.strength"], "d"),
+        )
+    ]
+
+    pos = 0
+    for count in _column(sections["sources.count"], "H"):
+        yield every[pos:pos + count]
+        pos += count
+
+
+@_without_gc
+def loads(data):
+    """Odtwarza galaktykę (z imperiami, planetami, transportami...) z bajtów."""
+    sections = _read_sections(data)
+    meta = safe_loads(sections["meta"])
+    sizes = _column(meta["map_sizes"], "I")
+
+    fields = {param: _split_column(sections[f"field.{param}"], sizes) for param in FIELD_PARAMS}
+    yields = {param: _split_column(sections[f"yield.{param}"], sizes) for param in FIELD_PARAMS}
+
+    # 1️⃣ puste obiekty encji - rekordy odwołują się do nich kluczami
+    galaxy = Galaxy.__new__(Galaxy)
+    star_systems = [StarSystem.__new__(StarSystem) for _ in range(meta["systems"])]
+    empires = [Empire.__new__(Empire) for _ in range(meta["empires"])]
+    planets = [Planet.__new__(Planet) for _ in range(meta["planets"])]
+    hex_maps = [HexMap.shell() for _ in range(meta["planets"])]
+
+    def resolve(key):
+        kind = key[0]
+        if kind == "P":
+            return planets[key[1]]
+        if kind == "H":
+            return hex_maps[key[1]].hex(key[2])
+        if kind == "E":
+            return empires[key[1]]
+        if kind == "Y":
+            return star_systems[key[1]]
+        if kind == "G":
+            return galaxy
+        raise SaveFormatError(f"Unknown reference {key!r}")
+
+    _loading.resolve = resolve
+    try:
+        systems, galaxy_state, empire_states, planet_states = safe_loads(sections["objects"])
+    finally:
+        _loading.resolve = None
+
+    # 2️⃣ planety i ich mapy
+    sources = _unpack_sources(sections, meta["source_types"])
+    for i, (planet, state) in enumerate(zip(planets, planet_states)):
+        state["hex_map"] = hex_maps[i].restore(
+            state["hex_map"],
+            {param: fields[param][i] for param in FIELD_PARAMS},
+            {param: yields[param][i] for param in FIELD_PARAMS},
+        )
+        state["sources"] = next(sources)
+        for key, default in _PLANET_CACHES.items():
+            state[key] = default()
+        planet.__dict__.update(state)
+
+    for empire, state in zip(empires, empire_states):
+        empire.__dict__.update(state)
+
+    # 3️⃣ galaktyka: systemy, połączenia, indeksy planet
+    galaxy.__dict__.update(galaxy_state)
+    galaxy.systems = entries = [{} for _ in systems]
+    galaxy.planet_locations = {}
+    galaxy.planet_owners = {}
+
+    next_planet = 0
+    for entry, system, (sid, x, y, star_type, count, links) in zip(entries, star_systems, systems):
+        system.star = Star.of_type(star_type)
+        system.planets = planets[next_planet:next_planet + count]
+        next_planet += count
+
+        entry.update({
+            "id": sid,
+            "x": x,
+            "y": y,
+            "system": system,
+            "links": [entries[j] for j in links],
+        })
+
+    for entry in entries:
+        galaxy.register_system(entry)
+
+    return galaxy
+
+
+def load_galaxy(path):
+    with open(path, "rb") as f:
+        return loads(f.read())
@@ -0,0 +1,221 @@
+# core/scheduler.py
+"""
+Symulacja w osobnym wątku, niezależnie od pętli renderowania.
+
+``SimScheduler`` woła ``galaxy.tick()`` na wątku roboczym w tempie
+zależnym od prędkości (1x / 4x / max). Cały stan gry chroni jeden
+``lock``: wątek symulacji trzyma go przez czas tury, a UI bierze go
+nieblokująco na klatkę (``begin_frame()``). Gdy tura trwa, UI nie czeka -
+rysuje nakładkę z ostatniego niezmiennego ``TurnSnapshot``.
+
+Wątek, a nie proces: stan gry to graf zwykłych obiektów, które UI
+czyta i modyfikuje bezpośrednio - proces wymagałby serializacji
+galaktyki co turę.
+"""
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Tuple
+
+# odstęp między turami [s]; 0 = bez przerw
+SPEEDS = {
+    "1x": 1.0,
+    "4x": 0.25,
+    "max": 0.0,
+}
+SPEED_ORDER = ("1x", "4x", "max")
+
+# Przy "max" wątek oddaje lock UI najwyżej raz na tyle sekund
+FRAME_INTERVAL = 1.0 / 60
+UI_WAIT_TIMEOUT = 0.05
+
+
+@dataclass(frozen=True)
+class EmpireSnapshot:
+    name: str
+    color: Tuple[int, int, int]
+    cash: float
+    cash_last: float
+    planets: int
+
+
+@dataclass(frozen=True)
+class TurnSnapshot:
+    turn: int
+    empires: Tuple[EmpireSnapshot, ...]
+    tick_s: float = 0.0
+
+    def empire(self, name):
+        for e in self.empires:
+            if e.name == name:
+                return e
+        return None
+
+
+def take_snapshot(galaxy, tick_s=0.0):
+    return TurnSnapshot(
+        turn=galaxy.turn,
+        empires=tuple(
+            EmpireSnapshot(
+                name=e.name,
+                color=tuple(e.color),
+                cash=float(e.cash),
+                cash_last=float(getattr(e, "cash_last", 0.0)),
+                planets=len(e.planets),
+            )
+            for e in galaxy.empires
+        ),
+        tick_s=tick_s,
+    )
+
+
+class SimScheduler:
+    def __init__(self, galaxy, speed="1x", paused=True):
+        if speed not in SPEEDS:
+            raise ValueError(f"Unknown speed: {speed}")
+
+        self.galaxy = galaxy
+        self.speed = speed
+        self.paused = paused
+        self.lock = threading.RLock()
+
+        self._snapshot = take_snapshot(galaxy)
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._error = None
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._ui_waiting = threading.Event()
+        self._ui_served = threading.Event()
+        self._thread = None
+
+    # ---------- stan ----------
+
+    @property
+    def snapshot(self):
+        """Ostatni opublikowany TurnSnapshot (podmiana referencji jest atomowa)."""
+        return self._snapshot
+
+    @property
+    def pending(self):
+        return self._pending
+
+    @property
+    def error(self):
+        return self._error
+
+    def set_speed(self, speed):
+        if speed not in SPEEDS:
+            raise ValueError(f"Unknown speed: {speed}")
+        self.speed = speed
+        self._wake.set()
+
+    def cycle_speed(self):
+        i = SPEED_ORDER.index(self.speed)
+        self.set_speed(SPEED_ORDER[(i + 1) % len(SPEED_ORDER)])
+        return self.speed
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+        self._wake.set()
+        return self.paused
+
+    def run_turns(self, n):
+        """Zleca `n` tur w tle z maksymalną prędkością (także przy pauzie)."""
+        with self._pending_lock:
+            self._pending += n
+        self._wake.set()
+
+    # ---------- tury ----------
+
+    def step(self, n=1):
+        """Synchronicznie wykonuje `n` tur na bieżącym wątku."""
+        for _ in range(n):
+            self._tick()
+        return self._snapshot
+
+    def _tick(self):
+        with self.lock:
+            start = perf_counter()
+            self.galaxy.tick()
+            self._snapshot = take_snapshot(self.galaxy, perf_counter() - start)
+
+    # ---------- wątek ----------
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sim", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        last_served = perf_counter()
+        next_due = perf_counter()
+
+        try:
+            while not self._stop.is_set():
+                # 1️⃣ tury zlecone przez run_turns idą bez przerw
+                if self._pending > 0:
+                    self._tick()
+                    with self._pending_lock:
+                        self._pending -= 1
+                elif self.paused:
+                    self._wake.wait()
+                    self._wake.clear()
+                    next_due = perf_counter() + SPEEDS[self.speed]
+                    continue
+                else:
+                    # 2️⃣ tempo wg prędkości
+                    delay = next_due - perf_counter()
+                    if delay > 0:
+                        self._wake.wait(delay)
+                        self._wake.clear()
+                        continue
+                    self._tick()
+                    next_due = perf_counter() + SPEEDS[self.speed]
+
+                # 3️⃣ UI czeka na lock - oddaj mu jedną klatkę
+                if self._ui_waiting.is_set() and perf_counter() - last_served >= FRAME_INTERVAL:
+                    self._ui_served.clear()
+                    self._ui_served.wait(UI_WAIT_TIMEOUT)
+                    last_served = perf_counter()
+        except Exception as exc:
+            self._error = exc
+            raise
+
+    def begin_frame(self):
+        """Początek klatki UI: True, jeśli można czytać/modyfikować stan gry.
+
+        Nie blokuje - przy trwającej turze zwraca False, a UI powinno
+        rysować tylko z ``snapshot``. Po True trzeba wywołać ``end_frame``.
+        """
+        if self.lock.acquire(blocking=False):
+            return True
+        self._ui_waiting.set()
+        return False
+
+    def end_frame(self):
+        self.lock.release()
+        self._ui_waiting.clear()
+        self._ui_served.set()
+
+    @contextmanager
+    def frame(self):
+        live = self.begin_frame()
+        try:
+            yield live
+        finally:
+            if live:
+                self.end_frame()
@@ -0,0 +1,152 @@
+# core/telemetry.py
+"""
+Strukturalne zdarzenia gry na bazie ``logging`` (zamiast print()).
+
+Każdy podsystem ma własny kanał - logger ``game.<podsystem>`` z osobnym
+poziomem. Zdarzenie to nazwa + pola, np.
+
+    log = telemetry.channel("ai")
+    log.info("transport", "[AI %(empire)s] Transport %(amount).1f %(res)s",
+             empire=name, amount=send, res=res)
+
+Komunikat formatowany jest dopiero przy odczycie (``%(pole)s`` z pól),
+a kanał sprawdza poziom, zanim utworzy rekord - wyłączone zdarzenie
+kosztuje jedno ``isEnabledFor``. Domyślnie kanały gry mają poziom
+WARNING i nic nie piszą na stdout.
+
+``configure()`` ustawia poziomy, bufor cykliczny ostatnich zdarzeń
+(``RingBufferHandler``) i opcjonalne wyjście na strumień. Poziomy można
+podać napisem, np. ``"info,ai=debug,planet=warning"`` (zmienna
+środowiskowa ``GAME_LOG`` lub ``simulate.py --log``).
+"""
+import logging
+import os
+from collections import deque
+
+ROOT = "game"
+SUBSYSTEMS = ("ai", "empire", "planet", "military", "init")
+DEFAULT_LEVEL = logging.WARNING
+DEFAULT_BUFFER = 1000
+ENV_VAR = "GAME_LOG"
+
+logging.getLogger(ROOT).setLevel(DEFAULT_LEVEL)
+
+
+class Channel:
+    """Kanał podsystemu: zdarzenia z polami, formatowane leniwie."""
+
+    __slots__ = ("logger",)
+
+    def __init__(self, subsystem):
+        self.logger = logging.getLogger(f"{ROOT}.{subsystem}")
+
+    def enabled(self, level=logging.INFO):
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, event, msg, /, **fields):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._emit(logging.DEBUG, event, msg, fields)
+
+    def info(self, event, msg, /, **fields):
+        if self.logger.isEnabledFor(logging.INFO):
+            self._emit(logging.INFO, event, msg, fields)
+
+    def warning(self, event, msg, /, **fields):
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._emit(logging.WARNING, event, msg, fields)
+
+    def _emit(self, level, event, msg, fields):
+        # pola jako jedyny argument-słownik: record.args == fields
+        args = (fields,) if fields else ()
+        self.logger.log(level, msg, *args, extra={"event": event}, stacklevel=3)
+
+
+def channel(subsystem):
+    return Channel(subsystem)
+
+
+class RingBufferHandler(logging.Handler):
+    """Ostatnie `capacity` rekordów, bez formatowania przy zapisie."""
+
+    def __init__(self, capacity=DEFAULT_BUFFER):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def events(self, event=None, subsystem=None):
+        """Rekordy (najstarsze pierwsze), opcjonalnie tylko dane zdarzenie/podsystem."""
+        name = f"{ROOT}.{subsystem}" if subsystem else None
+        return [
+            r for r in self.records
+            if (event is None or getattr(r, "event", None) == event)
+            and (name is None or r.name == name)
+        ]
+
+    def lines(self):
+        return [f"{r.name} {r.levelname} {r.getMessage()}" for r in self.records]
+
+    def clear(self):
+        self.records.clear()
+
+
+def parse_levels(spec):
+    """``"info,ai=debug"`` -> {None: INFO, "ai": DEBUG} (None = wszystkie kanały)."""
+    levels = {}
+    for part in filter(None, (p.strip() for p in (spec or "").split(","))):
+        subsystem, _, name = part.rpartition("=")
+        level = logging.getLevelName(name.upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level: {name}")
+        levels[subsystem or None] = level
+    return levels
+
+
+_buffer = None
+_stream_handler = None
+
+
+def buffer():
+    """Bufor cykliczny z ostatniego configure() (None, jeśli nie było)."""
+    return _buffer
+
+
+def configure(levels=None, buffer_size=DEFAULT_BUFFER, stream=None):
+    """Ustawia poziomy kanałów, bufor cykliczny i (opcjonalnie) strumień.
+
+    `levels` to słownik jak z ``parse_levels`` albo napis w tym formacie.
+    Zwraca RingBufferHandler.
+    """
+    global _buffer, _stream_handler
+    if isinstance(levels, str):
+        levels = parse_levels(levels)
+    levels = levels or {}
+
+    root = logging.getLogger(ROOT)
+    root.setLevel(levels.get(None, DEFAULT_LEVEL))
+    for subsystem in SUBSYSTEMS + tuple(k for k in levels if k and k not in SUBSYSTEMS):
+        logging.getLogger(f"{ROOT}.{subsystem}").setLevel(levels.get(subsystem, logging.NOTSET))
+
+    for handler in (_buffer, _stream_handler):
+        if handler is not None:
+            root.removeHandler(handler)
+
+    _buffer = RingBufferHandler(buffer_size)
+    root.addHandler(_buffer)
+
+    _stream_handler = None
+    if stream is not None:
+        _stream_handler = logging.StreamHandler(stream)
+        _stream_handler.setFormatter(logging.Formatter("%(name)s %(levelname)s %(message)s"))
+        root.addHandler(_stream_handler)
+
+    return _buffer
+
+
+def configure_from_env(stream=None):
+    """configure() wg zmiennej GAME_LOG; bez niej nic nie zmienia."""
+    spec = os.environ.get(ENV_VAR)
+    if not spec:
+        return None
+    return configure(spec, stream=stream)
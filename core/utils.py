@@ -8,3 +8,38 @@ def hex_distance(a, b):
     return (abs(a.q - b.q)
           + abs(a.q + a.r - b.q - b.r)
           + abs(a.r - b.r)) // 2
+
+
+class DisjointSet:
+    """Union-find z kompresją ścieżek i łączeniem wg rozmiaru."""
+
+    def __init__(self, items=()):
+        self.parent = {}
+        self.size = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        if item not in self.parent:
+            self.parent[item] = item
+            self.size[item] = 1
+
+    def find(self, item):
+        parent = self.parent
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+
+    def union(self, a, b):
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return ra
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        return ra
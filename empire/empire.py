@@ -3,6 +3,10 @@ import logging
 from ai.simple_ai import SimpleAI
 from empire.transport import TransportManager
 from military.units import EmpireMilitaryManager
+from core import profiler as tick_profiler
+from core import telemetry
+
+log = telemetry.channel("empire")
 
 class Empire:
     def __init__(self, name, color, galaxy, is_player=False, cash=200):
@@ -31,12 +35,17 @@ class Empire:
             self.ai = SimpleAI(self, galaxy)
 
     def tick(self):
+        profiler = tick_profiler.active()
+
         # ✅ NOWY: Tick transportów
-        self.military_manager.tick()
-        self.transport_manager.tick()
+        with profiler.phase("military"):
+            self.military_manager.tick()
+        with profiler.phase("transport"):
+            self.transport_manager.tick()
         
         if not self.is_player:
-            self.ai.tick()
+            with profiler.phase("ai"):
+                self.ai.tick()
         # Usuń martwe kolonie (populacja 0) by nie pojawiały się w statusie
         for p in list(self.planets):
             try:
@@ -47,22 +56,40 @@ class Empire:
 
         for p in list(self.planets):
             if p.owner is not self:
-                logging.warning("PLANET OWNER DESYNC %s", p)
+                log.warning("owner_desync", "PLANET OWNER DESYNC %(planet)s", planet=p)
         
     def status(self, galaxy):
-        logging.info("=== %s STATUS ===", self.name)
+        # raport co turę - lokalizacje i opisy liczone tylko przy włączonym INFO
+        if not log.enabled(logging.INFO):
+            return
+
+        log.info("status", "=== %(empire)s STATUS ===", empire=self.name)
         
         # Pokaż aktywne transporty
         if self.transport_manager.transports:
-            logging.info("Active transports: %d", len(self.transport_manager.transports))
-            for t in self.transport_manager.transports:
-                source_sys, source_orbit = t.source.get_location(galaxy)
-                target_sys, target_orbit = t.target.get_location(galaxy)
+            log.info("status_transports", "Active transports: %(count)d",
+                     empire=self.name, count=len(self.transport_manager.transports))
         
         for p in self.planets:
             system, orbit = p.get_location(galaxy)
-            pos = f"System {system.star.type if system else '??'}, Orbit {orbit}" 
-            logging.info("Planet %s @ %s: Population=%.1f, Buildings=%s", id(p), pos, p.population.size, p.buildings_summary())
+            log.info(
+                "status_planet",
+                "Planet %(planet)s @ System %(star)s, Orbit %(orbit)s: Population=%(population).1f, Buildings=%(buildings)s",
+                empire=self.name,
+                planet=id(p),
+                star=system.star.type if system else '??',
+                orbit=orbit,
+                population=p.population.size,
+                buildings=p.buildings_summary(),
+            )
+
+    def forecast_production(self):
+        """Suma prognoz produkcji planet imperium (nic nie zmienia)."""
+        total = {}
+        for p in self.planets:
+            for res, val in p.forecast_production().items():
+                total[res] = total.get(res, 0.0) + val
+        return total
 
     def add_planet(self, planet):
         if planet not in self.planets:
@@ -85,13 +112,14 @@ class Empire:
         """
         try:
             if planet.storage.get(resource, 0.0) < amount:
-                logging.debug("Not enough %s to sell from planet %s", resource, id(planet))
+                log.debug("sell_failed", "Not enough %(res)s to sell from planet %(planet)s", res=resource, planet=id(planet))
                 return 0.0
 
             planet.storage[resource] -= amount
             revenue = amount * price_per_unit
             self.cash += revenue
-            logging.info("%s sold %.1f %s from planet %s for %.2f cash", self.name, amount, resource, id(planet), revenue)
+            log.info("sell", "%(empire)s sold %(amount).1f %(res)s from planet %(planet)s for %(revenue).2f cash",
+                     empire=self.name, amount=amount, res=resource, planet=id(planet), revenue=revenue)
             return revenue
         except Exception:
             # safe fallback: do nothing on unexpected errors
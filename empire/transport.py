@@ -1,20 +1,54 @@
 """
 empire/transport.py
 System transportu zasobów i populacji między planetami
+
+Transporty w drodze czekają w kopcu wg tury przylotu - tick menedżera
+zdejmuje tylko te, które właśnie dolatują. Czas pozostały i postęp
+liczone są z zegara menedżera (liczba jego ticków), a nie zmniejszane
+co turę. ``TransportIndex`` galaktyki podaje transporty danej planety
+bez przeglądania wszystkich.
+
+Konwoje: ładunek na tej samej trasie (źródło -> cel), nadany w turze
+wyruszenia transportu, dołącza do niego zamiast tworzyć nowy - jeden
+obiekt i jedna dostawa na kilka ładunków (zasoby i populacja razem).
+Konwój, który już wyruszył, nie przyjmuje ładunku - każdy ładunek
+dociera dokładnie po czasie swojej trasy, nigdy szybciej.
 """
+import heapq
+from collections import deque
+
+from core import replay
+
+# czas [tury] i koszt [energia] transportu
+SAME_SYSTEM_TURNS = 3
+TURNS_PER_HOP = 2
+SAME_SYSTEM_COST = 5
+COST_PER_DISTANCE = 0.05
+# gdy system nieznany albo brak trasy po połączeniach
+DEFAULT_TURNS = 5
+UNREACHABLE_TURNS = 8
+UNREACHABLE_COST = 20
+
+HISTORY_SIZE = 10
+
 
 class Transport:
-    """Pojedynczy transport w drodze"""
+    """Pojedynczy transport (konwój) w drodze"""
     
-    def __init__(self, source_planet, target_planet, cargo, transport_type="resources"):
+    def __init__(self, source_planet, target_planet, cargo, transport_type="resources", clock=None):
         self.source = source_planet
         self.target = target_planet
-        self.cargo = cargo  # dict dla zasobów lub float dla populacji
-        self.transport_type = transport_type  # "resources" lub "population"
+        self.resources = {}
+        self.population = 0.0
+        self.transport_type = transport_type  # "resources", "population" lub "mixed"
+        self.add_cargo(cargo, transport_type)
+        # zegar z polem `turn` (TransportManager); bez niego tura 0
+        self.clock = clock
         
         # Oblicz czas transportu na podstawie odległości
         self.time_total = self._calculate_travel_time()
-        self.time_remaining = self.time_total
+        self.departure_turn = self._turn()
+        self.arrival_turn = self.departure_turn + self.time_total
         self.status = "in_transit"  # in_transit, delivered, cancelled
         
     def _calculate_travel_time(self):
@@ -29,80 +63,131 @@ class Transport:
             
         galaxy = empire.galaxy
         
-        # Znajdź systemy
-        source_system = None
-        target_system = None
-        
-        for entry in galaxy.systems:
-            if self.source in entry["system"].planets:
-                source_system = entry
-            if self.target in entry["system"].planets:
-                target_system = entry
+        # Znajdź systemy (indeks lokalizacji galaktyki)
+        source_system = galaxy.find_system_entry_of_planet(self.source)
+        target_system = galaxy.find_system_entry_of_planet(self.target)
                 
         if not source_system or not target_system:
-            return 5
+            return DEFAULT_TURNS
             
         # Ten sam system = 3 tury
-        if source_system == target_system:
-            return 3
-            
-        # Sąsiednie systemy = 5 tur
-        if target_system in source_system["links"]:
-            return 5
-            
-        # Dalsze systemy = 8+ tur (można rozbudować o pathfinding)
-        return 8
+        if source_system is target_system:
+            return SAME_SYSTEM_TURNS
+
+        # +2 tury za każdy skok trasy (sąsiedni system = 5 tur)
+        hops = galaxy.routes.hops(source_system, target_system)
+        if hops is None:
+            return UNREACHABLE_TURNS
+        return SAME_SYSTEM_TURNS + TURNS_PER_HOP * hops
         
-    def tick(self):
-        """Aktualizacja transportu co turę"""
+    def _turn(self):
+        return self.clock.turn if self.clock is not None else 0
+
+    @property
+    def cargo(self):
+        """dict dla zasobów, float dla populacji, dict z "population" dla mieszanego"""
+        if self.transport_type == "population":
+            return self.population
+        if self.transport_type == "resources":
+            return self.resources
+        return dict(self.resources, population=self.population)
+
+    def add_cargo(self, cargo, transport_type):
+        """Dokłada ładunek (dict zasobów albo float populacji) do transportu"""
+        if transport_type == "population":
+            self.population += cargo
+        else:
+            for res, amount in cargo.items():
+                self.resources[res] = self.resources.get(res, 0.0) + amount
+
+        if transport_type != self.transport_type:
+            self.transport_type = "mixed"
+
+    @property
+    def time_remaining(self):
         if self.status != "in_transit":
-            return False
-            
-        self.time_remaining -= 1
-        
-        if self.time_remaining <= 0:
-            self._deliver()
-            return True
-            
-        return False
+            return 0
+        return max(0, self.arrival_turn - self._turn())
         
     def _deliver(self):
         """Dostarcza ładunek do celu"""
-        if self.transport_type == "resources":
-            for res, amount in self.cargo.items():
-                self.target.storage[res] = self.target.storage.get(res, 0) + amount
-        elif self.transport_type == "population":
-            pop_amount = self.cargo
-            self.target.population.size += pop_amount
+        if self.status != "in_transit":
+            return False
+
+        for res, amount in self.resources.items():
+            self.target.storage[res] = self.target.storage.get(res, 0) + amount
+        if self.population:
+            self.target.population.size += self.population
             
         self.status = "delivered"
+        return True
         
     def progress(self):
         """Zwraca procent ukończenia podróży"""
-        return 1.0 - (self.time_remaining / self.time_total)
+        if self.status != "in_transit":
+            return 1.0
+        return min(1.0, (self._turn() - self.departure_turn) / self.time_total)
         
     def cancel(self):
         """Anuluje transport - zasoby wracają do źródła"""
         if self.status != "in_transit":
             return False
             
-        if self.transport_type == "resources":
-            for res, amount in self.cargo.items():
-                self.source.storage[res] = self.source.storage.get(res, 0) + amount
-        elif self.transport_type == "population":
-            self.source.population.size += self.cargo
+        for res, amount in self.resources.items():
+            self.source.storage[res] = self.source.storage.get(res, 0) + amount
+        if self.population:
+            self.source.population.size += self.population
             
         self.status = "cancelled"
+        # zegar to menedżer - zdejmuje transport z kolejki przylotów
+        release = getattr(self.clock, "_release", None)
+        if release is not None:
+            release(self)
         return True
 
 
+class TransportIndex:
+    """Transporty w drodze wg planety (źródła i celu) - jeden na galaktykę."""
+
+    def __init__(self):
+        self.by_planet = {}   # planeta -> {transport: None} (kolejność utworzenia)
+
+    def add(self, transport):
+        for planet in (transport.source, transport.target):
+            self.by_planet.setdefault(planet, {})[transport] = None
+
+    def remove(self, transport):
+        for planet in (transport.source, transport.target):
+            entries = self.by_planet.get(planet)
+            if entries is not None:
+                entries.pop(transport, None)
+                if not entries:
+                    del self.by_planet[planet]
+
+    def for_planet(self, planet):
+        return list(self.by_planet.get(planet, ()))
+
+
 class TransportManager:
     """Zarządza wszystkimi transportami w imperium"""
     
     def __init__(self, empire):
         self.empire = empire
-        self.transports = []  # lista aktywnych transportów
-        self.history = []     # ostatnie 10 dostaw (dla UI)
+        self.turn = 0          # zegar transportów: liczba ticków
+        self.active = {}       # nr -> transport w drodze (kolejność utworzenia)
+        self.arrivals = []     # kopiec (tura przylotu, nr)
+        self.history = deque(maxlen=HISTORY_SIZE)  # ostatnie dostawy (dla UI)
+        self.convoys = {}      # (źródło, cel) -> nr ostatniego transportu na trasie
+        self._next_id = 0
+
+    @property
+    def transports(self):
+        """Aktywne transporty w kolejności utworzenia."""
+        return list(self.active.values())
+
+    def _index(self):
+        galaxy = getattr(self.empire, "galaxy", None)
+        return getattr(galaxy, "transports", None)
         
     def create_transport(self, source, target, cargo, transport_type="resources"):
         """Tworzy nowy transport"""
@@ -132,27 +217,74 @@ class TransportManager:
             # Odejmij populację ze źródła
             source.population.size -= pop_amount
             
-        # Utwórz transport
-        transport = Transport(source, target, cargo, transport_type)
-        self.transports.append(transport)
-        
+        # Dołącz do konwoju, który jeszcze nie wyruszył (ta sama tura), albo utwórz transport
+        route = (source, target)
+        transport = self.active.get(self.convoys.get(route))
+        joined = transport is not None and transport.departure_turn == self.turn
+        if joined:
+            transport.add_cargo(cargo, transport_type)
+        else:
+            transport = Transport(source, target, cargo, transport_type, clock=self)
+            transport.id = self._next_id
+            self._next_id += 1
+            self.active[transport.id] = transport
+            self.convoys[route] = transport.id
+            heapq.heappush(self.arrivals, (transport.arrival_turn, transport.id))
+            index = self._index()
+            if index is not None:
+                index.add(transport)
+
+        replay.active().record(
+            "transport",
+            empire=self.empire,
+            source=source,
+            target=target,
+            cargo=cargo,
+            type=transport_type,
+            turns=transport.time_remaining,
+            convoy=joined,
+        )
+
+        if joined:
+            return True, f"Joined convoy: {transport.time_remaining} turns"
         return True, f"Transport created: {transport.time_total} turns"
         
     def tick(self):
-        """Aktualizuje wszystkie transporty"""
-        completed = []
-        
-        for transport in self.transports:
-            if transport.tick():  # zwraca True gdy dostarczono
-                completed.append(transport)
-                self._add_to_history(transport)
-                
-        # Usuń zakończone transporty
-        for t in completed:
-            self.transports.remove(t)
+        """Dostarcza transporty, których tura przylotu właśnie minęła"""
+        self.turn += 1
+        arrivals = self.arrivals
+
+        # remisy tury przylotu - wg numeru, czyli kolejności utworzenia
+        while arrivals and arrivals[0][0] <= self.turn:
+            _, tid = heapq.heappop(arrivals)
+            transport = self.active.pop(tid, None)
+            if transport is None:
+                continue  # anulowany
+            transport._deliver()   # nie dostarcza transportu, który nie jest w drodze
+            self._finish(transport)
+
+    def cancel(self, transport):
+        """Anuluje transport w drodze (ładunek wraca do źródła)"""
+        if self.active.get(getattr(transport, "id", None)) is not transport:
+            return False
+        return transport.cancel()
+
+    def _release(self, transport):
+        """Transport anulowany (także przez Transport.cancel()) - koniec trasy"""
+        if self.active.pop(getattr(transport, "id", None), None) is transport:
+            self._finish(transport)
+
+    def _finish(self, transport):
+        route = (transport.source, transport.target)
+        if self.convoys.get(route) == transport.id:
+            del self.convoys[route]
+        index = self._index()
+        if index is not None:
+            index.remove(transport)
+        self._add_to_history(transport)
             
     def _add_to_history(self, transport):
-        """Dodaje transport do historii"""
+        """Dodaje transport do historii (deque trzyma HISTORY_SIZE ostatnich)"""
         self.history.append({
             "source": transport.source,
             "target": transport.target,
@@ -160,17 +292,16 @@ class TransportManager:
             "type": transport.transport_type,
             "status": transport.status
         })
-        
-        # Ogranicz historię do 10 ostatnich
-        if len(self.history) > 10:
-            self.history.pop(0)
             
     def get_active_transports_for_planet(self, planet):
-        """Zwraca transporty związane z daną planetą"""
-        return [
-            t for t in self.transports 
-            if t.source == planet or t.target == planet
-        ]
+        """Zwraca transporty imperium związane z daną planetą"""
+        index = self._index()
+        if index is None:
+            return [
+                t for t in self.active.values()
+                if t.source == planet or t.target == planet
+            ]
+        return [t for t in index.for_planet(planet) if self.active.get(t.id) is t]
 
 
 # ============================================
@@ -197,27 +328,19 @@ def can_transport_between(source, target, galaxy):
 def calculate_transport_cost(source, target, cargo, galaxy):
     """
     Oblicza koszt energii transportu
-    Można rozbudować o koszty w zależności od odległości
+    5 energii + COST_PER_DISTANCE za jednostkę długości trasy po połączeniach
     """
-    source_system = None
-    target_system = None
-    
-    for entry in galaxy.systems:
-        if source in entry["system"].planets:
-            source_system = entry
-        if target in entry["system"].planets:
-            target_system = entry
+    source_system = galaxy.find_system_entry_of_planet(source)
+    target_system = galaxy.find_system_entry_of_planet(target)
             
     if not source_system or not target_system:
         return 0
         
     # Ten sam system = 5 energii
-    if source_system == target_system:
-        return 5
-        
-    # Sąsiednie systemy = 10 energii
-    if target_system in source_system["links"]:
-        return 10
-        
-    # Dalsze systemy = 20 energii
-    return 20
\ No newline at end of file
+    if source_system is target_system:
+        return SAME_SYSTEM_COST
+
+    distance = galaxy.routes.distance(source_system, target_system)
+    if distance is None:
+        return UNREACHABLE_COST
+    return SAME_SYSTEM_COST + COST_PER_DISTANCE * distance
\ No newline at end of file
@@ -1,41 +1,58 @@
 # galaxy/galaxy.py
-from core.rng import uniform
-from galaxy.system import StarSystem
-import math
-import random
+from core.rng import stream
+from galaxy.generation import generate_systems
+from galaxy.spatial import SpatialGrid
+from galaxy.routing import RouteTable
+from core.utils import DisjointSet
+from core import profiler as tick_profiler
+from core import replay
+from collections import deque
 from empire.empire import Empire
+from empire.transport import TransportIndex
+# ile ostatnich zmian właściciela/kolonizacji pamięta galaktyka
+OWNER_CHANGES_SIZE = 256
+
+
 class Galaxy:
-    def __init__(self, system_count=20, size=1000, links_per_system=3):
+    def __init__(self, system_count=20, size=1000, links_per_system=3, workers=None):
         self.systems = []
         self.empires = []
         self.active_invasions = []
         self.turn = 0
-
-        self.generate(system_count, size)
+        # strumienie losowe galaktyki (core/rng.py)
+        self.rng = stream("galaxy")
+
+        # Indeksy planet: planeta -> (wpis systemu, orbita) oraz planeta -> właściciel
+        self.planet_locations = {}
+        self.planet_owners = {}
+        # rośnie przy każdej zmianie właściciela lub kolonizacji planety
+        # (cache renderera, role AI); owner_changes - planety tych zmian
+        self.owner_version = 0
+        self.owner_changes = deque(maxlen=OWNER_CHANGES_SIZE)
+        # rośnie przy każdej zmianie połączeń (cache tras, galaxy/routing.py)
+        self.lanes_version = 0
+        self.routes = RouteTable(self)
+        # transporty w drodze wg planety (empire/transport.py)
+        self.transports = TransportIndex()
+
+        self.generate(system_count, size, workers)
         self._generate_links(links_per_system)
         self._connect_components()
+        self.lanes_changed()
 
 
     def _generate_links(self, n):
-        for s in self.systems:
-            distances = []
-
-            for other in self.systems:
-                if other is s:
-                    continue
-                dx = s["x"] - other["x"]
-                dy = s["y"] - other["y"]
-                d = math.sqrt(dx * dx + dy * dy)
-                distances.append((d, other))
+        # Siatka przestrzenna zamiast liczenia odległości do wszystkich systemów:
+        # nearest() zwraca k najbliższych w tej samej kolejności co pełne sortowanie
+        grid = SpatialGrid.for_points([(s, s["x"], s["y"]) for s in self.systems])
 
-            distances.sort(key=lambda x: x[0])
-
-            for _, target in distances[:n]:
+        for s in self.systems:
+            for target in grid.nearest(s["x"], s["y"], n, exclude=s):
                 if target not in s["links"]:
                     s["links"].append(target)
                 if s not in target["links"]:
                     target["links"].append(s)
-  
+
     def _find_components(self):
         visited = set()
         components = []
@@ -43,53 +60,111 @@ class Galaxy:
         for s in self.systems:
             if s["id"] in visited:
                 continue
+            components.append(self._component_order(s, visited))
 
-            stack = [s]
-            group = []
+        return components
 
-            while stack:
-                current = stack.pop()
-                cid = current["id"]
+    def _component_order(self, start, visited=None):
+        """Systemy składowej w kolejności DFS (jak w _find_components)."""
+        if visited is None:
+            visited = set()
 
-                if cid in visited:
-                    continue
+        stack = [start]
+        group = []
 
-                visited.add(cid)
-                group.append(current)
+        while stack:
+            current = stack.pop()
+            cid = current["id"]
 
-                for n in current["links"]:
-                    if n["id"] not in visited:
-                        stack.append(n)
+            if cid in visited:
+                continue
 
-            components.append(group)
+            visited.add(cid)
+            group.append(current)
 
-        return components
+            for n in current["links"]:
+                if n["id"] not in visited:
+                    stack.append(n)
 
+        return group
 
     def _connect_components(self):
-        components = self._find_components()
-
-        while len(components) > 1:
-            a = components[0]
-            b = components[1]
-            best_pair = None
-            best_dist = float("inf")
-
-            for s1 in a:
-                for s2 in b:
-                    dx = s1["x"] - s2["x"]
-                    dy = s1["y"] - s2["y"]
-                    d = dx * dx + dy * dy
-                    if d < best_dist:
-                        best_dist = d
-                        best_pair = (s1, s2)
-
-            s1, s2 = best_pair
-            s1["links"].append(s2)
-            s2["links"].append(s1)
+        if not self.systems:
+            return
+
+        # 1️⃣ Składowe z union-find, w kolejności najmniejszego indeksu systemu
+        dsu = DisjointSet(s["id"] for s in self.systems)
+        for s in self.systems:
+            for t in s["links"]:
+                dsu.union(s["id"], t["id"])
+
+        groups = {}
+        for s in self.systems:
+            groups.setdefault(dsu.find(s["id"]), []).append(s)
+        components = list(groups.values())
+
+        if len(components) < 2:
+            return
+
+        # 2️⃣ Główna składowa rośnie - dołączamy kolejne najbliższym mostem
+        main = components[0]
+        cell_size = SpatialGrid.cell_size_for([(s, s["x"], s["y"]) for s in self.systems])
+        main_grid = SpatialGrid(cell_size)
+        for s in main:
+            main_grid.insert(s, s["x"], s["y"])
+        main_size = len(main)
 
-            components = self._find_components()
+        for other in components[1:]:
+            s1, s2 = self._closest_pair(main[0], main_grid, main_size, other)
 
+            s1["links"].append(s2)
+            s2["links"].append(s1)
+            dsu.union(s1["id"], s2["id"])
+
+            for s in other:
+                main_grid.insert(s, s["x"], s["y"])
+            main_size += len(other)
+
+    def _closest_pair(self, main_start, main_grid, main_size, other):
+        """Najbliższa para (system głównej składowej, system z `other`).
+
+        Remisy rozstrzygane jak w pełnym przeszukaniu par: wg kolejności DFS
+        obu składowych.
+        """
+        best = None
+        pairs = []
+
+        if len(other) <= main_size:
+            for s2 in other:
+                d, hits = main_grid.closest(s2["x"], s2["y"])
+                if best is None or d < best:
+                    best = d
+                    pairs = [(s1, s2) for s1 in hits]
+                elif d == best:
+                    pairs.extend((s1, s2) for s1 in hits)
+        else:
+            other_grid = SpatialGrid(main_grid.cell_size)
+            for s in other:
+                other_grid.insert(s, s["x"], s["y"])
+            for s1 in self._component_order(main_start):
+                d, hits = other_grid.closest(s1["x"], s1["y"])
+                if best is None or d < best:
+                    best = d
+                    pairs = [(s1, s2) for s2 in hits]
+                elif d == best:
+                    pairs.extend((s1, s2) for s2 in hits)
+
+        if len(pairs) == 1:
+            return pairs[0]
+
+        main_pos = {s["id"]: i for i, s in enumerate(self._component_order(main_start))}
+        other_pos = {s["id"]: i for i, s in enumerate(self._component_order(other[0]))}
+        return min(pairs, key=lambda p: (main_pos[p[0]["id"]], other_pos[p[1]["id"]]))
+
+
+    def lanes_changed(self):
+        """Wywoływać po każdej zmianie list `links` systemów."""
+        self.lanes_version += 1
 
     def produce(self):
         total = {}
@@ -103,47 +178,79 @@ class Galaxy:
 
         return total
 
+    def forecast_production(self):
+        """Prognoza produkcji całej galaktyki (bez efektów ubocznych)."""
+        total = {}
+
+        for entry in self.systems:
+            for res, val in entry["system"].forecast_production().items():
+                total[res] = total.get(res, 0.0) + val
+
+        return total
+
     def tick(self):
+        # dziennik tur (core/replay.py) - domyślnie wyłączony
+        recorder = replay.active()
+        recorder.begin_turn(self)
         self.turn += 1
+        # pomiar faz (core/profiler.py) - domyślnie wyłączony
+        profiler = tick_profiler.active()
+        profiler.count("turns")
         # 1️⃣ AI imperiów
         for empire in self.empires:
-            empire.tick()
-            empire.status(self)
-            cash_delta = 0.0
+            with profiler.phase("empires"), profiler.phase(empire.name):
+                empire.tick()
+                empire.status(self)
+
+            with profiler.phase("cash"):
+                cash_delta = 0.0
 
-            for planet in empire.planets:
-                cash_delta += planet.cash_delta()  
+                for planet in empire.planets:
+                    cash_delta += planet.cash_delta()  
 
-            empire.cash += cash_delta
-            empire.cash_last = cash_delta
+                empire.cash += cash_delta
+                empire.cash_last = cash_delta
 
-            if empire.cash < 0:
-                self.cash_crisis(empire)
+                if empire.cash < 0:
+                    self.cash_crisis(empire)
                 
         # 2️⃣ Tick planet
-        for entry in self.systems:
-            system = entry["system"]
-            for planet in system.planets:
-                planet.tick()
+        with profiler.phase("planets"):
+            for entry in self.systems:
+                system = entry["system"]
+                for planet in system.planets:
+                    planet.tick()
 
         # 3️⃣ Tick active invasions
-        for inv in list(self.active_invasions):
-            inv.tick()
-            if inv.status != "in_progress":
-                try:
-                    self.active_invasions.remove(inv)
-                except ValueError:
-                    pass
-
-
-
-    def generate(self, system_count, size):
-        for i in range(system_count):
-            x = random.randint(50, size - 50)
-            y = random.randint(50, size - 50)
-
-            system = StarSystem()
-
+        with profiler.phase("invasions"):
+            for inv in list(self.active_invasions):
+                inv.tick()
+                if inv.status != "in_progress":
+                    try:
+                        self.active_invasions.remove(inv)
+                    except ValueError:
+                        pass
+
+        recorder.end_turn(self)
+
+
+
+    def generate(self, system_count, size, workers=None):
+        # pozycje z jednego strumienia, zawartość systemu z własnego -
+        # system i wygląda tak samo niezależnie od kolejności generowania
+        layout = self.rng.split("layout")
+        positions = [
+            (layout.randint(50, size - 50), layout.randint(50, size - 50))
+            for _ in range(system_count)
+        ]
+
+        # workers > 1: systemy budowane w puli procesów (galaxy/generation.py)
+        systems = generate_systems(
+            (self.rng.split("system", i) for i in range(system_count)),
+            workers,
+        )
+
+        for i, ((x, y), system) in enumerate(zip(positions, systems)):
             node = {
                 "id": i,
                 "x": x,
@@ -153,9 +260,39 @@ class Galaxy:
             }
 
             self.systems.append(node)
-            
-            
-            
+            self.register_system(node)
+
+    def register_system(self, node):
+        """Dodaje planety systemu do indeksu lokalizacji/własności."""
+        for orbit, planet in enumerate(node["system"].planets):
+            self.planet_locations[planet] = (node, orbit)
+            if planet.owner is not None:
+                self.planet_owners[planet] = planet.owner
+
+    def update_planet_owner(self, planet, owner):
+        """Wywoływane przez Planet.set_owner przy zmianie właściciela
+        (i finish_colonization - zmiana stanu kolonii)."""
+        self.owner_version += 1
+        self.owner_changes.append(planet)
+        if owner is None:
+            self.planet_owners.pop(planet, None)
+        else:
+            self.planet_owners[planet] = owner
+
+    def owner_changes_since(self, version):
+        """Planety zmienione po `owner_version` == version (w kolejności zmian);
+        None gdy tylu zmian galaktyka już nie pamięta."""
+        if version is None:
+            return None
+        count = self.owner_version - version
+        if count > len(self.owner_changes):
+            return None
+        return list(self.owner_changes)[len(self.owner_changes) - count:]
+
+    def locate_planet(self, planet):
+        """Zwraca (wpis systemu, orbita) planety w O(1) lub (None, None)."""
+        return self.planet_locations.get(planet, (None, None))
+
     def cash_crisis(self, empire):
         empire.cash = 0
 
@@ -163,7 +300,4 @@ class Galaxy:
             planet.population.size *= 0.98  
 
     def find_system_entry_of_planet(self, planet):
-        for entry in self.systems:
-            if planet in entry["system"].planets:
-                return entry
-        return None
+        return self.locate_planet(planet)[0]
@@ -0,0 +1,41 @@
+# galaxy/generation.py
+"""
+Równoległe generowanie systemów galaktyki.
+
+Każdy system ma własny strumień losowy (core/rng.py), więc może powstać
+w dowolnym procesie i kolejności. Procesy robocze dostają tylko
+(ścieżka, ziarno) strumienia, budują ``StarSystem`` i odsyłają
+``generation_record()`` - typ gwiazdy i tablice pól jako bajty - a
+proces główny odtwarza z nich planety bez ponownego liczenia pól.
+Wynik jest identyczny z generowaniem szeregowym.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from core.rng import RngStream
+from galaxy.system import StarSystem
+
+# poniżej tylu systemów start puli kosztuje więcej niż zysk
+MIN_PARALLEL_SYSTEMS = 64
+
+
+def _build_system_record(key):
+    path, seed = key
+    return StarSystem(RngStream(path, seed)).generation_record()
+
+
+def generate_systems(streams, workers=None):
+    """Buduje StarSystem dla każdego strumienia (w kolejności `streams`).
+
+    `workers` > 1 włącza pulę procesów.
+    """
+    streams = list(streams)
+    if not workers or workers <= 1 or len(streams) < MIN_PARALLEL_SYSTEMS:
+        return [StarSystem(rng) for rng in streams]
+
+    keys = [(rng.path, rng.root_seed) for rng in streams]
+    chunksize = max(1, len(keys) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        records = list(pool.map(_build_system_record, keys, chunksize=chunksize))
+
+    return [StarSystem.from_generation_record(record) for record in records]
@@ -0,0 +1,103 @@
+# galaxy/routing.py
+"""
+Trasy po połączeniach (hyperlanes) między systemami.
+
+``RouteTable`` liczy dla systemu źródłowego liczbę skoków (BFS) i
+długość najkrótszej trasy (Dijkstra, waga = długość połączenia) do
+wszystkich systemów naraz i trzyma wynik w ograniczonym cache LRU
+(``ROUTE_CACHE_SIZE`` źródeł). Transporty startują z planet imperiów,
+czyli z niewielu systemów, więc po pierwszym zapytaniu kolejne są O(1).
+Graf jest nieskierowany - wiersz celu też odpowiada na zapytanie.
+
+Cache jest czyszczony, gdy zmieni się ``galaxy.lanes_version``.
+"""
+import heapq
+import math
+from collections import OrderedDict, deque
+
+ROUTE_CACHE_SIZE = 256
+
+
+class RouteTable:
+    def __init__(self, galaxy, cache_size=ROUTE_CACHE_SIZE):
+        self.galaxy = galaxy
+        self.cache_size = cache_size
+        self.version = None
+        self._rows = OrderedDict()   # id systemu -> (skoki, odległości)
+
+    def hops(self, source, target):
+        """Liczba skoków między wpisami systemów (None = brak trasy)."""
+        return self._lookup(source, target)[0]
+
+    def distance(self, source, target):
+        """Długość najkrótszej trasy po połączeniach (None = brak trasy)."""
+        return self._lookup(source, target)[1]
+
+    def route(self, source, target):
+        """(skoki, długość) - obie wartości z jednego wiersza cache."""
+        return self._lookup(source, target)
+
+    def clear(self):
+        self._rows.clear()
+
+    def __getstate__(self):
+        # cache nie trafia do zapisu gry - wypełni się ponownie
+        state = dict(self.__dict__)
+        state["version"] = None
+        state["_rows"] = OrderedDict()
+        return state
+
+    # ---------- cache ----------
+
+    def _lookup(self, source, target):
+        if self.version != self.galaxy.lanes_version:
+            self._rows.clear()
+            self.version = self.galaxy.lanes_version
+
+        sid, tid = source["id"], target["id"]
+        rows = self._rows
+
+        if sid in rows:
+            rows.move_to_end(sid)
+            hops, dist = rows[sid]
+            return hops[tid], dist[tid]
+        if tid in rows:
+            rows.move_to_end(tid)
+            hops, dist = rows[tid]
+            return hops[sid], dist[sid]
+
+        hops, dist = rows[sid] = self._compute(source)
+        if len(rows) > self.cache_size:
+            rows.popitem(last=False)
+        return hops[tid], dist[tid]
+
+    def _compute(self, source):
+        systems = self.galaxy.systems
+        count = len(systems)
+
+        # 1️⃣ skoki - BFS
+        hops = [None] * count
+        hops[source["id"]] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            h = hops[node["id"]] + 1
+            for n in node["links"]:
+                if hops[n["id"]] is None:
+                    hops[n["id"]] = h
+                    queue.append(n)
+
+        # 2️⃣ długości - Dijkstra
+        dist = [None] * count
+        heap = [(0.0, source["id"])]
+        while heap:
+            d, i = heapq.heappop(heap)
+            if dist[i] is not None:
+                continue
+            dist[i] = d
+            node = systems[i]
+            for n in node["links"]:
+                if dist[n["id"]] is None:
+                    heapq.heappush(heap, (d + math.hypot(n["x"] - node["x"], n["y"] - node["y"]), n["id"]))
+
+        return hops, dist
@@ -0,0 +1,196 @@
+# galaxy/spatial.py
+"""
+Indeks przestrzenny dla systemów galaktyki.
+
+Jednolita siatka (uniform grid): każdy punkt trafia do komórki
+``(x // cell_size, y // cell_size)``, a zapytania o najbliższych sąsiadów
+przeszukują pierścienie komórek od środka na zewnątrz.
+"""
+import heapq
+import math
+
+
+class SpatialGrid:
+    """Uniform grid over 2D points with k-nearest-neighbour queries.
+
+    Ties are broken by insertion order, so a query returns the same items
+    in the same order as a stable sort of all points by distance would.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self.count = 0
+
+        self._min_cx = self._min_cy = None
+        self._max_cx = self._max_cy = None
+
+    @classmethod
+    def for_points(cls, points, per_cell=2.0):
+        """Builds a grid sized so that each cell holds ~`per_cell` points.
+
+        `points` is a list of (item, x, y).
+        """
+        grid = cls(cls.cell_size_for(points, per_cell))
+        for item, x, y in points:
+            grid.insert(item, x, y)
+        return grid
+
+    @staticmethod
+    def cell_size_for(points, per_cell=2.0):
+        """Rozmiar komórki dla listy (item, x, y) przy ~`per_cell` punktach na komórkę."""
+        if not points:
+            return 1.0
+
+        xs = [p[1] for p in points]
+        ys = [p[2] for p in points]
+        area = max(1.0, (max(xs) - min(xs)) * (max(ys) - min(ys)))
+        return max(1.0, math.sqrt(area * per_cell / len(points)))
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, item, x, y):
+        cx, cy = self._cell(x, y)
+        self.cells.setdefault((cx, cy), []).append((x, y, self.count, item))
+        self.count += 1
+
+        if self._min_cx is None:
+            self._min_cx = self._max_cx = cx
+            self._min_cy = self._max_cy = cy
+        else:
+            self._min_cx = min(self._min_cx, cx)
+            self._max_cx = max(self._max_cx, cx)
+            self._min_cy = min(self._min_cy, cy)
+            self._max_cy = max(self._max_cy, cy)
+
+    def _ring(self, cx, cy, r):
+        """Komórki na obwodzie kwadratu o promieniu `r` (metryka Czebyszewa)."""
+        cells = self.cells
+        if r == 0:
+            bucket = cells.get((cx, cy))
+            if bucket:
+                yield bucket
+            return
+
+        for x in range(cx - r, cx + r + 1):
+            for y in (cy - r, cy + r):
+                bucket = cells.get((x, y))
+                if bucket:
+                    yield bucket
+        for y in range(cy - r + 1, cy + r):
+            for x in (cx - r, cx + r):
+                bucket = cells.get((x, y))
+                if bucket:
+                    yield bucket
+
+    def _max_ring(self, cx, cy):
+        if self._min_cx is None:
+            return -1
+        return max(
+            cx - self._min_cx, self._max_cx - cx,
+            cy - self._min_cy, self._max_cy - cy,
+        )
+
+    def nearest(self, x, y, k, exclude=None):
+        """Returns up to `k` items closest to (x, y), nearest first.
+
+        Distances are compared as ``math.sqrt(dx*dx + dy*dy)`` with ties
+        resolved by insertion order. `exclude` is skipped by identity.
+        """
+        if k <= 0:
+            return []
+
+        cx, cy = self._cell(x, y)
+        max_ring = self._max_ring(cx, cy)
+        found = []
+        r = 0
+
+        while r <= max_ring:
+            for bucket in self._ring(cx, cy, r):
+                for px, py, seq, item in bucket:
+                    if item is exclude:
+                        continue
+                    dx = x - px
+                    dy = y - py
+                    found.append((math.sqrt(dx * dx + dy * dy), seq, item))
+
+            # Każdy punkt poza przeszukanymi pierścieniami jest dalej niż r * cell_size
+            if len(found) >= k:
+                kth = heapq.nsmallest(k, found, key=_sort_key)[-1][0]
+                if kth < r * self.cell_size:
+                    break
+            r += 1
+
+        return [item for _, _, item in heapq.nsmallest(k, found, key=_sort_key)]
+
+    def closest(self, x, y):
+        """Returns (squared distance, items) for all items nearest to (x, y).
+
+        Every item at the minimal squared distance is returned (in insertion
+        order), so callers can apply their own tie-breaking.
+        """
+        cx, cy = self._cell(x, y)
+        max_ring = self._max_ring(cx, cy)
+        best = None
+        ties = []
+        r = 0
+
+        while r <= max_ring:
+            for bucket in self._ring(cx, cy, r):
+                for px, py, seq, item in bucket:
+                    dx = x - px
+                    dy = y - py
+                    d = dx * dx + dy * dy
+                    if best is None or d < best:
+                        best = d
+                        ties = [(seq, item)]
+                    elif d == best:
+                        ties.append((seq, item))
+
+            edge = r * self.cell_size
+            if best is not None and best < edge * edge:
+                break
+            r += 1
+
+        ties.sort(key=lambda t: t[0])
+        return best, [item for _, item in ties]
+
+    def query_rect(self, x0, y0, x1, y1):
+        """Returns items with x0 <= x <= x1 and y0 <= y <= y1, in insertion order."""
+        if self._min_cx is None or x1 < x0 or y1 < y0:
+            return []
+
+        cx0, cy0 = self._cell(x0, y0)
+        cx1, cy1 = self._cell(x1, y1)
+        cx0 = max(cx0, self._min_cx)
+        cy0 = max(cy0, self._min_cy)
+        cx1 = min(cx1, self._max_cx)
+        cy1 = min(cy1, self._max_cy)
+
+        # Przy dużym prostokącie taniej przejść po zajętych komórkach
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+            buckets = [
+                bucket for (cx, cy), bucket in self.cells.items()
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1
+            ]
+        else:
+            buckets = [
+                self.cells[(cx, cy)]
+                for cx in range(cx0, cx1 + 1)
+                for cy in range(cy0, cy1 + 1)
+                if (cx, cy) in self.cells
+            ]
+
+        hits = [
+            (seq, item)
+            for bucket in buckets
+            for px, py, seq, item in bucket
+            if x0 <= px <= x1 and y0 <= py <= y1
+        ]
+        hits.sort(key=lambda t: t[0])
+        return [item for _, item in hits]
+
+
+def _sort_key(entry):
+    return entry[0], entry[1]
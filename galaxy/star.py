@@ -1,5 +1,5 @@
 # galaxy/star.py
-from core.rng import choice
+from core.rng import shared_stream
 
 STAR_TYPES = {
     "red_dwarf": {
@@ -17,9 +17,19 @@ STAR_TYPES = {
 }
 
 class Star:
-    def __init__(self):
-        self.type = choice(list(STAR_TYPES.keys()))
-        data = STAR_TYPES[self.type]
+    def __init__(self, rng=None):
+        rng = rng or shared_stream()
+        self._set_type(rng.choice(list(STAR_TYPES.keys())))
+
+    @classmethod
+    def of_type(cls, star_type):
+        star = cls.__new__(cls)
+        star._set_type(star_type)
+        return star
+
+    def _set_type(self, star_type):
+        self.type = star_type
+        data = STAR_TYPES[star_type]
 
         self.temp_bias = data["temp_bias"]
         self.planet_range = data["planet_count"]
@@ -1,24 +1,42 @@
 # galaxy/system.py
-from core.rng import randint
+from core.rng import shared_stream
 from galaxy.star import Star
 from planet.planet import Planet
 
 
 class StarSystem:
-    def __init__(self):
+    def __init__(self, rng=None):
+        # strumień systemu (core/rng.py); bez niego - wspólny strumień modułu
+        rng = rng or shared_stream()
+
         # ⭐ gwiazda
-        self.star = Star()
+        self.star = Star(rng)
 
         # 🪐 planety
         self.planets = []
 
-        count = randint(*self.star.planet_range)
+        count = rng.randint(*self.star.planet_range)
 
-        for _ in range(count):
-            planet = Planet()
+        for i in range(count):
+            # własny podstrumień planety - jej zawartość nie zależy od
+            # liczby losowań poprzednich planet systemu
+            planet_rng = rng.split("planet", i) if hasattr(rng, "split") else rng
+            planet = Planet(rng=planet_rng)
             planet.base_temperature = self.star.temp_bias
             self.planets.append(planet)
 
+    def generation_record(self):
+        """(typ gwiazdy, rekordy planet) - patrz Planet.generation_record."""
+        return self.star.type, tuple(p.generation_record() for p in self.planets)
+
+    @classmethod
+    def from_generation_record(cls, record):
+        star_type, planets = record
+        system = cls.__new__(cls)
+        system.star = Star.of_type(star_type)
+        system.planets = [Planet.from_generation_record(p) for p in planets]
+        return system
+
     def summary(self):
         return {
             "star": self.star.type,
@@ -34,3 +52,13 @@ class StarSystem:
                 total[res] = total.get(res, 0.0) + val
 
         return total
+
+    def forecast_production(self):
+        """Jak produce(), ale bez zmiany magazynów planet."""
+        total = {}
+
+        for p in self.planets:
+            for res, val in p.forecast_production().items():
+                total[res] = total.get(res, 0.0) + val
+
+        return total
@@ -2,14 +2,19 @@
 from buildings.EmpireSpacePort import EmpireSpacePort
 from core.init import init_start_planet
 import pygame
+from render.fonts import get_font, render_text
 import math
+import sys
 from render.build_menu import (
     draw_simple_build_menu,
     handle_build_menu_scroll,
     BuildMenuState
 )
 from galaxy.galaxy import Galaxy
-from render.draw_galaxy import draw_galaxy, pick_system, system_tooltip_data
+from render.draw_galaxy import draw_galaxy, pick_system, system_tooltip_data, ZOOM_STEP
+from render.camera import GalaxyCamera
+from core.scheduler import SimScheduler
+from core import telemetry
 from render.system_view import draw_system, planet_tooltip_data
 from render.planet_view import draw_planet, hex_tooltip_data, pick_hex, draw_build_menu
 from empire.empire import Empire
@@ -47,6 +52,7 @@ MILITARY_GARRISON_VIEW = 8
 
 
 LEFT_PANEL_W = 550
+GALAXY_PAN_STEP = 80
 
 # ============================================
 # OVERLAY MODES
@@ -59,7 +65,7 @@ OVERLAY_PRODUCTION = 4
 OVERLAY_POPULATION = 5
 
 WIDTH, HEIGHT = 1600, 1000
-TICK_MS = 1000
+FAST_FORWARD_TURNS = 100
 
 def main():
     build_menu_hex = None
@@ -94,10 +100,13 @@ def main():
     HEX_TABLE_Y = 20
     HEX_TABLE_H = HEIGHT - 40
 
+    # logi gry (core/telemetry.py) np. GAME_LOG=info,ai=debug
+    telemetry.configure_from_env(sys.stdout)
+
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 18)
+    font = get_font(None, 18)
 
     galaxy = Galaxy(system_count=40, size=900)
 
@@ -112,22 +121,30 @@ def main():
     # ✅ START AI (INNY SYSTEM!)
     init_start_planet(ai_empire, galaxy.systems[1])
 
-    prod = galaxy.produce()
+    prod = galaxy.forecast_production()
     print("=== GALACTIC PRODUCTION (1 TICK) ===")
     for res, val in sorted(prod.items()):
         print(f"{res:10s}: {val:8.2f}")
 
     current_view = GALAXY_VIEW
+    galaxy_camera = GalaxyCamera(offset=(LEFT_PANEL_W, 0))
     current_system = None
     current_planet = None
     selected_hex = None
     overlay_mode = OVERLAY_TEMP
 
-    last_tick = pygame.time.get_ticks()
+    # tury liczone w osobnym wątku (core/scheduler.py)
+    scheduler = SimScheduler(galaxy, paused=True)
+    scheduler.start()
     running = True
-    paused = True
 
     while running:
+        # trwa tura - nie czekamy, tylko nakładka ze snapshotu
+        if not scheduler.begin_frame():
+            running = handle_busy_frame(screen, scheduler, empire)
+            clock.tick(60)
+            continue
+
         # ================= EVENTS =================
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -138,6 +155,8 @@ def main():
                     # Scroll build menu
                     handle_build_menu_scroll(build_menu_state, event.y)
                     # Max scroll będzie zastosowany przy renderowaniu
+                elif current_view == GALAXY_VIEW:
+                    galaxy_camera.zoom_at(ZOOM_STEP ** event.y, pygame.mouse.get_pos())
                 elif current_view == PLANET_VIEW:
                     # Existing hex table scroll
                     hex_table_scroll -= event.y * HEX_ROW_H
@@ -166,7 +185,22 @@ def main():
                     elif current_view == MILITARY_GARRISON_VIEW:
                         current_view = PLANET_VIEW
                 elif event.key == pygame.K_SPACE:
-                    paused = not paused
+                    scheduler.toggle_pause()
+                elif event.key == pygame.K_f:
+                    scheduler.cycle_speed()
+                elif event.key == pygame.K_n:
+                    scheduler.run_turns(FAST_FORWARD_TURNS)
+
+                # === GALAXY VIEW ===
+                if current_view == GALAXY_VIEW:
+                    if event.key == pygame.K_LEFT:
+                        galaxy_camera.pan_by(-GALAXY_PAN_STEP, 0)
+                    elif event.key == pygame.K_RIGHT:
+                        galaxy_camera.pan_by(GALAXY_PAN_STEP, 0)
+                    elif event.key == pygame.K_UP:
+                        galaxy_camera.pan_by(0, -GALAXY_PAN_STEP)
+                    elif event.key == pygame.K_DOWN:
+                        galaxy_camera.pan_by(0, GALAXY_PAN_STEP)
 
                 # === PLANET VIEW ===
                 if current_view == PLANET_VIEW:
@@ -344,7 +378,7 @@ def main():
 
                 # Galaxy click
                 if current_view == GALAXY_VIEW:
-                    system = pick_system(galaxy,(event.pos[0] - LEFT_PANEL_W, event.pos[1]))
+                    system = pick_system(galaxy, event.pos, galaxy_camera)
                     if system:
                         current_system = system
                         current_view = SYSTEM_VIEW
@@ -427,12 +461,6 @@ def main():
                                 current_planet.military_units.append(unit)
 
                                 print(f"Zrekrutowano {unit.name}")
-        # ================= TICK =================
-        now = pygame.time.get_ticks()
-        if not paused and now - last_tick >= TICK_MS:
-            last_tick = now
-            galaxy.tick()
-
         # ================= RENDER =================
         screen.fill((0, 0, 0))
 
@@ -441,20 +469,21 @@ def main():
                 screen,
                 galaxy,
                 offset=(LEFT_PANEL_W, 0),
-                area=(WIDTH - LEFT_PANEL_W, HEIGHT)
+                area=(WIDTH - LEFT_PANEL_W, HEIGHT),
+                camera=galaxy_camera
             )
 
             table_clicks = draw_galaxy_table(screen, galaxy, font)
             
             draw_transport_panel(screen, empire, galaxy, font, pygame.mouse.get_pos())
 
-            hovered = pick_system(galaxy, pygame.mouse.get_pos())
+            hovered = pick_system(galaxy, pygame.mouse.get_pos(), galaxy_camera)
             if hovered:
                 lines = system_tooltip_data(hovered)
                 mx, my = pygame.mouse.get_pos()
                 y = my + 10
                 for l in lines:
-                    img = font.render(l, True, (220,220,220))
+                    img = render_text(font, l, True, (220,220,220))
                     screen.blit(img, (mx + 10, y))
                     y += 16
 
@@ -473,7 +502,7 @@ def main():
                     lines = planet_tooltip_data(planet, orbit)
                     y = my + 10
                     for l in lines:
-                        screen.blit(font.render(l, True, (220,220,220)), (mx+10, y))
+                        screen.blit(render_text(font, l, True, (220,220,220)), (mx+10, y))
                         y += 16
 
         elif current_view == PLANET_VIEW:
@@ -505,15 +534,20 @@ def main():
                 mx, my = pygame.mouse.get_pos()
                 y = my + 10
                 for l in lines:
-                    screen.blit(font.render(l, True, (230,230,230)), (mx+10, y))
+                    screen.blit(render_text(font, l, True, (230,230,230)), (mx+10, y))
                     y += 16
 
             # === STORAGE ===
             y = 150
-            screen.blit(font.render("STORAGE:", True, (200, 200, 200)), (10+LEFT_PANEL_W, y))
+            screen.blit(render_text(font, "STORAGE:", True, (200, 200, 200)), (10+LEFT_PANEL_W, y))
             y += 20
+            forecast = current_planet.forecast_production()
             for res, val in current_planet.storage.items():
-                img = font.render(f"{res.upper()}: {val:.1f}", True, (180, 180, 220))
+                delta = forecast.get(res, 0.0)
+                label = f"{res.upper()}: {val:.1f}"
+                if delta:
+                    label += f" ({delta:+.1f}/turn)"
+                img = render_text(font, label, True, (180, 180, 220))
                 screen.blit(img, (10 +LEFT_PANEL_W, y))
                 y += 18
 
@@ -522,14 +556,14 @@ def main():
             if transports:
                 y += 10
                 screen.blit(
-                    font.render(f"TRANSPORTS: {len(transports)} active", True, (200, 220, 240)),
+                    render_text(font, f"TRANSPORTS: {len(transports)} active", True, (200, 220, 240)),
                     (10 + LEFT_PANEL_W, y)
                 )
 
             # === OVERLAY LABELS ===
             labels = ["1 TEMP", "2 HEIGHT", "3 LIFE", "4 RES", "5 PROD", "6 POP"]
             for i, txt in enumerate(labels):
-                img = font.render(txt, True, (180, 180, 180))
+                img = render_text(font, txt, True, (180, 180, 180))
                 screen.blit(img, (10+LEFT_PANEL_W, HEIGHT - 20 * (len(labels) - i)))
 
             # === BUILD KEYS ===
@@ -541,7 +575,7 @@ def main():
             ]
 
             for i, txt in enumerate(build_labels):
-                img = font.render(txt, True, (200, 200, 200))
+                img = render_text(font, txt, True, (200, 200, 200))
                 screen.blit(img, (WIDTH - 160, HEIGHT - 20 * (len(build_labels) - i)))
 
             # === HEX INFO ===
@@ -555,7 +589,7 @@ def main():
                 ]
 
                 for i, text in enumerate(lines):
-                    img = font.render(text, True, (200, 200, 200))
+                    img = render_text(font, text, True, (200, 200, 200))
                     screen.blit(img, (10+ LEFT_PANEL_W, 600 + i * 18))
                     
                     if hasattr(current_planet, 'military_manager'):
@@ -678,8 +712,8 @@ def main():
             )
 
         # === cash PANEL ===
-        font_small = pygame.font.SysFont(None, 18)
-        font_big = pygame.font.SysFont(None, 24)
+        font_small = get_font(None, 18)
+        font_big = get_font(None, 24)
         cash_panel_x = 10+LEFT_PANEL_W 
         cash_panel_y = 10
         cash_panel_w = 250
@@ -689,7 +723,7 @@ def main():
         pygame.draw.rect(screen, (60, 80, 100), (cash_panel_x, cash_panel_y, cash_panel_w, cash_panel_h), 2)
         
         screen.blit(
-            font_big.render("CASH", True, (200, 220, 240)),
+            render_text(font_big, "CASH", True, (200, 220, 240)),
             (cash_panel_x + 10, cash_panel_y + 8)
         )
         
@@ -702,7 +736,7 @@ def main():
             cash_color = (220, 80, 80)
 
         screen.blit(
-            font_big.render(f"{cash_value:.1f}", True, cash_color),
+            render_text(font_big, f"{cash_value:.1f}", True, cash_color),
             (cash_panel_x + 15, cash_panel_y + 32)
         )
         
@@ -711,13 +745,13 @@ def main():
         delta_color = (120, 220, 120) if delta >= 0 else (220, 120, 120)
 
         screen.blit(
-            font_small.render(delta_text, True, delta_color),
+            render_text(font_small, delta_text, True, delta_color),
             (cash_panel_x + 15, cash_panel_y + 56)
         )
         
         arrow = "▲" if delta > 0 else "▼" if delta < 0 else "="
         screen.blit(
-            font_big.render(arrow, True, delta_color),
+            render_text(font_big, arrow, True, delta_color),
             (cash_panel_x + 110, cash_panel_y + 50)
         )
         
@@ -743,23 +777,93 @@ def main():
         
         planets_text = f"Planets: {len(empire.planets)}"
         screen.blit(
-            font_small.render(planets_text, True, (180, 180, 200)),
+            render_text(font_small, planets_text, True, (180, 180, 200)),
             (cash_panel_x + 140, cash_panel_y + 55)
         )
         
-        if paused:
-            pause_text = font_big.render("PAUSED", True, (220, 80, 80))
+        draw_sim_status(screen, scheduler, font_small)
+
+        if scheduler.paused:
+            pause_text = render_text(font_big, "PAUSED", True, (220, 80, 80))
             screen.blit(
                 pause_text,
                 (WIDTH // 2 - pause_text.get_width() // 2, 20)
             )
  
+        scheduler.end_frame()
         pygame.display.flip()
         clock.tick(60)
 
+    scheduler.stop()
     pygame.quit()
 
 
+def sim_status_image(scheduler, font):
+    snap = scheduler.snapshot
+    text = f"Turn {snap.turn}  |  speed {scheduler.speed}  |  tick {snap.tick_s * 1000:.0f} ms"
+    if scheduler.pending:
+        text += f"  |  queued {scheduler.pending}"
+    return render_text(font, text, True, (180, 180, 200))
+
+
+def draw_sim_status(screen, scheduler, font, img=None):
+    """Pasek statusu symulacji przy prawej krawędzi; zwraca jego lewe x."""
+    img = img or sim_status_image(scheduler, font)
+    x = WIDTH - img.get_width() - 20
+    screen.blit(img, (x, HEIGHT - 24))
+    return x
+
+
+# zdarzenia, które pełna klatka obsługuje - tylko te czekają na nią w kolejce
+DEFERRED_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL)
+
+
+def handle_busy_frame(screen, scheduler, empire):
+    """Klatka w trakcie tury: tylko klawisze sterujące i pasek statusu.
+
+    QUIT oraz SPACE / F / N obsługiwane są od razu; pozostałe klawisze,
+    kliknięcia i kółko (DEFERRED_EVENTS) wracają do kolejki w tej samej
+    kolejności na następną pełną klatkę. Resztę (ruch myszy, okno...)
+    pełna klatka i tak ignoruje - nie zapełnia ona kolejki w długiej turze.
+    """
+    running = True
+    deferred = []
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            running = False
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            scheduler.toggle_pause()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+            scheduler.cycle_speed()
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_n:
+            scheduler.run_turns(FAST_FORWARD_TURNS)
+        elif event.type in DEFERRED_EVENTS:
+            deferred.append(event)
+    for event in deferred:
+        pygame.event.post(event)
+
+    font = get_font(None, 18)
+    snap = scheduler.snapshot
+    me = snap.empire(empire.name)
+
+    # tło pod oba teksty - szerokość z ich zmierzonych rozmiarów
+    status = sim_status_image(scheduler, font)
+    cash = None
+    width = status.get_width() + 30
+    if me is not None:
+        cash = render_text(font, f"Cash: {me.cash:.0f} ({me.cash_last:+.1f})", True, (220, 200, 120))
+        width += cash.get_width() + 20
+    pygame.draw.rect(screen, (20, 20, 30), (WIDTH - width, HEIGHT - 30, width, 30))
+
+    left = draw_sim_status(screen, scheduler, font, status)
+    if cash is not None:
+        # na lewo od paska statusu
+        screen.blit(cash, (left - cash.get_width() - 20, HEIGHT - 24))
+
+    pygame.display.flip()
+    return running
+
+
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
@@ -808,13 +912,13 @@ def draw_source_selection_menu(screen, sources, galaxy, font):
     pygame.draw.rect(screen, (15, 15, 30), (x, y, 400, 480))
     pygame.draw.rect(screen, (120, 120, 180), (x, y, 400, 480), 2)
     
-    title = font.render("SELECT SOURCE PLANET", True, (255, 255, 255))
+    title = render_text(font, "SELECT SOURCE PLANET", True, (255, 255, 255))
     screen.blit(title, (x + 80, y + 10))
     
     y += 40
     
     if not sources:
-        msg = font.render("No valid source planets!", True, (200, 80, 80))
+        msg = render_text(font, "No valid source planets!", True, (200, 80, 80))
         screen.blit(msg, (x + 80, y + 100))
         return
     
@@ -824,28 +928,28 @@ def draw_source_selection_menu(screen, sources, galaxy, font):
         pygame.draw.rect(screen, (40, 40, 60), (x + 10, py, 380, 70))
         pygame.draw.rect(screen, (100, 100, 140), (x + 10, py, 380, 70), 1)
         
-        num = font.render(f"{i+1}.", True, (220, 220, 220))
+        num = render_text(font, f"{i+1}.", True, (220, 220, 220))
         screen.blit(num, (x + 20, py + 10))
         
         system, orbit = planet.get_location(galaxy)
         location = f"System {system.star.type if system else '??'}, Orbit {orbit}"
-        loc_text = font.render(location, True, (180, 180, 200))
+        loc_text = render_text(font, location, True, (180, 180, 200))
         screen.blit(loc_text, (x + 50, py + 10))
         
-        pop_text = font.render(f"Pop: {planet.population.size:.1f}", True, (200, 200, 200))
+        pop_text = render_text(font, f"Pop: {planet.population.size:.1f}", True, (200, 200, 200))
         screen.blit(pop_text, (x + 50, py + 28))
         
         energy = planet.storage.get('energy', 0)
         minerals = planet.storage.get('minerals', 0)
         
         res_color = (80, 200, 120) if energy >= 10 and minerals >= 5 else (200, 80, 80)
-        res_text = font.render(
+        res_text = render_text(font, 
             f"Resources: {energy:.0f} energy, {minerals:.0f} minerals",
             True, res_color
         )
         screen.blit(res_text, (x + 50, py + 46))
     
-    instruction = font.render("Press 1-9 to select source, ESC to cancel", True, (150, 150, 150))
+    instruction = render_text(font, "Press 1-9 to select source, ESC to cancel", True, (150, 150, 150))
     screen.blit(instruction, (x + 40, y + len(sources) * 80 + 20))
 
 
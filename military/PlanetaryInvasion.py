@@ -1,8 +1,11 @@
 
 
-import logging
+from core import telemetry
+from core.rng import stream
 from military.combat import CombatResolver
 
+log = telemetry.channel("military")
+
 
 class PlanetaryInvasion:
     """System desantu na planetę"""
@@ -34,7 +37,8 @@ class PlanetaryInvasion:
             self.resolver = CombatResolver(
                 self.invasion_force,
                 garrison,
-                location=self.target
+                location=self.target,
+                rng=self._battle_stream()
             )
             self.combat_log = self.resolver.log
         
@@ -54,6 +58,16 @@ class PlanetaryInvasion:
             self.invasion_force = [u for u in self.invasion_force if u.current_health > 0]
             self.target.military_manager.garrison = [u for u in garrison if u.current_health > 0]
     
+    def _battle_stream(self):
+        """Strumień bitwy: (tura, atakujący, system i orbita celu)."""
+        galaxy = getattr(self.attacker, "galaxy", None)
+        if galaxy is None:
+            return stream("battle", self.attacker.name)
+
+        entry, orbit = galaxy.locate_planet(self.target)
+        system_id = entry["id"] if entry else None
+        return stream("battle", galaxy.turn, self.attacker.name, system_id, orbit)
+
     def _capture_planet(self):
         """Przejmuje planetę - POPRAWIONA WERSJA"""
         
@@ -83,5 +97,5 @@ class PlanetaryInvasion:
         else:
             msg = f"[INVASION] {self.attacker.name} captured neutral planet!"
         
-        logging.info(msg)
+        log.info("invasion_captured", "%(msg)s", attacker=self.attacker.name, msg=msg)
         self.combat_log.append(msg)
\ No newline at end of file
@@ -1,9 +1,12 @@
 # military/combat.py
 
-import random
 from dataclasses import dataclass
 from typing import List, Optional
 
+from core import replay
+from core.profiler import profiled
+from core.rng import shared_stream
+
 # ============================================
 # RESULT
 # ============================================
@@ -29,7 +32,7 @@ class CombatResolver:
     - przechowuje stan bitwy
     """
 
-    def __init__(self, attackers=None, defenders=None, location=None):
+    def __init__(self, attackers=None, defenders=None, location=None, rng=None):
         self.attackers = [u for u in attackers] if attackers else []
         self.defenders = [u for u in defenders] if defenders else []
 
@@ -38,6 +41,8 @@ class CombatResolver:
         self.defender_losses = []
 
         self.location = location
+        # strumień bitwy (core/rng.py); bez niego - wspólny strumień modułu
+        self.rng = rng or shared_stream()
         self.defender_bonus = 1.15 if location else 1.0
 
         self.round = 0
@@ -60,6 +65,7 @@ class CombatResolver:
     # PUBLIC API
     # --------------------------------------------
 
+    @profiled("combat.tick")
     def tick(self):
         """Jedna runda walki (1 TURA GRY)"""
 
@@ -145,6 +151,15 @@ class CombatResolver:
         self.attackers = [u for u in self.attackers if u.current_health > 0]
 
         apply_active_effects(self.attackers + self.defenders, phase="end_of_round")        
+        replay.active().record(
+            "combat_round",
+            location=self.location,
+            round=self.round,
+            attackers=len(self.attackers),
+            defenders=len(self.defenders),
+            attacker_damage=self.attacker_damage,
+            defender_damage=self.defender_damage,
+        )
         if not self.attackers or not self.defenders:
             self._finish_battle()
 
@@ -203,7 +218,7 @@ class CombatResolver:
         reduction = defender.stats.defense * 0.3 * morale_def * defender.current_morale
 
         raw = max(1.0, base - reduction)
-        rng = random.uniform(0.8, 1.2)
+        rng = self.rng.uniform(0.8, 1.2)
         final = raw * rng
 
         return final, {
@@ -236,7 +251,7 @@ class CombatResolver:
         if unit.current_morale < 0.25:
             # im niższe morale, tym większa szansa ucieczki
             chance = 0.3 + (0.25 - unit.current_morale) * 2
-            if random.random() < chance:
+            if self.rng.random() < chance:
                 self.log.append(
                     f"{unit.name} ({side}) breaks morale and retreats!"
                 )
@@ -244,54 +259,55 @@ class CombatResolver:
 
         return None
 
-    def apply_auras(units):
-        for unit in units:
-            for buff in unit.buffs:
-                if buff.aura:
-                    for target in get_targets(unit, units, buff.aura["range"]):
-                        apply_effect(target, buff.aura["effect"])
-
-    def apply_active_effects(units, phase):
-        for unit in units:
-            for buff in unit.buffs:
-                if buff.active_effect and buff.active_effect["phase"] == phase:
-                    for target in get_targets(unit, units, buff.active_effect["target"]):
-                        target.stats.health = min(
-                            target.stats.max_health,
-                            target.stats.health + buff.active_effect.get("heal", 0)
-                        )
-
-    def get_targets(source, units, scope):
-        if scope == "self":
-            return [source]
-        if scope == "army":
-            return units
-        if scope == "adjacent":
-            return [u for u in units if u is not source]  # placeholder
-        return []
-
-    def resolve_attack(attacker, defender):
-        attacker.trigger("on_attack", defender)
-        defender.trigger("on_defense", attacker)
-
-        damage = attacker.get_stat("attack") - defender.get_stat("defense")
-        damage = max(0, damage)
-
-        defender.stats.health -= damage
-
-    def resolve_combat_turn(attacking_units, defending_units):
-        all_units = attacking_units + defending_units
-
-        # 1️⃣ start tury
-        apply_auras(all_units)
-        apply_active_effects(all_units, phase="turn_start")
-
-        # 2️⃣ ataki
-        for attacker, defender in zip(attacking_units, defending_units):
-            resolve_attack(attacker, defender)
-
-        # 3️⃣ koniec tury
-        apply_active_effects(all_units, phase="turn_end")
-
-        for unit in all_units:
-            unit.remove_expired_buffs()
+
+def apply_auras(units):
+    for unit in units:
+        for buff in unit.buffs:
+            if buff.aura:
+                for target in get_targets(unit, units, buff.aura["range"]):
+                    apply_effect(target, buff.aura["effect"])
+
+def apply_active_effects(units, phase):
+    for unit in units:
+        for buff in unit.buffs:
+            if buff.active_effect and buff.active_effect["phase"] == phase:
+                for target in get_targets(unit, units, buff.active_effect["target"]):
+                    target.stats.health = min(
+                        target.stats.max_health,
+                        target.stats.health + buff.active_effect.get("heal", 0)
+                    )
+
+def get_targets(source, units, scope):
+    if scope == "self":
+        return [source]
+    if scope == "army":
+        return units
+    if scope == "adjacent":
+        return [u for u in units if u is not source]  # placeholder
+    return []
+
+def resolve_attack(attacker, defender):
+    attacker.trigger("on_attack", defender)
+    defender.trigger("on_defense", attacker)
+
+    damage = attacker.get_stat("attack") - defender.get_stat("defense")
+    damage = max(0, damage)
+
+    defender.stats.health -= damage
+
+def resolve_combat_turn(attacking_units, defending_units):
+    all_units = attacking_units + defending_units
+
+    # 1️⃣ start tury
+    apply_auras(all_units)
+    apply_active_effects(all_units, phase="turn_start")
+
+    # 2️⃣ ataki
+    for attacker, defender in zip(attacking_units, defending_units):
+        resolve_attack(attacker, defender)
+
+    # 3️⃣ koniec tury
+    apply_active_effects(all_units, phase="turn_end")
+
+    for unit in all_units:
+        unit.remove_expired_buffs()
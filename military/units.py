@@ -5,7 +5,10 @@ Kompletny system jednostek wojskowych
 
 from dataclasses import dataclass
 from typing import Optional
-import logging
+
+from core import telemetry
+
+log = telemetry.channel("military")
 
 # ============================================
 # DEFINICJE JEDNOSTEK
@@ -342,10 +345,8 @@ class PlanetMilitaryManager:
         
         for unit in completed_units:
             self.garrison.append(unit)
-            try:
-                logging.info("[%s] %s completed!", self.planet.owner.name, unit.name)
-            except Exception:
-                logging.info("[Unknown owner] %s completed!", unit.name)
+            log.info("unit_completed", "[%(empire)s] %(unit)s completed!",
+                     empire=getattr(self.planet.owner, "name", "Unknown owner"), unit=unit.name)
             
         # Upkeep jednostek
         total_upkeep = sum(u.stats.upkeep for u in self.garrison)
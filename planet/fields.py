@@ -0,0 +1,163 @@
+# planet/fields.py
+"""
+Silnik pól heksów (temperature / height / life).
+
+Zamiast liczyć ``src.influence(h)`` dla każdej pary (źródło, hex), układ
+planety o danym promieniu jest liczony raz: współrzędne w tablicach,
+a dla każdego środka i zasięgu lista (indeks hexa, odległość). Źródło
+dodaje wtedy tylko swój profil ``profile()[d]`` do hexów w zasięgu.
+
+Kolejność sumowania jest taka sama jak w pętli per-hex (źródła po kolei,
+na końcu przesunięcie planety), a hexy poza zasięgiem dostawały tam 0.0 -
+wynik jest więc bit w bit identyczny z implementacją referencyjną.
+"""
+from array import array
+
+from core.config import FIELD_TOLERANCE
+from planet.resources import RESOURCE_THRESHOLDS
+
+FIELD_PARAMS = ("temperature", "height", "life")
+
+
+class HexLayout:
+    """Współrzędne heksów planety o promieniu `radius` (kolejność jak w HexMap)."""
+
+    def __init__(self, radius):
+        self.radius = radius
+        self.q = array("i")
+        self.r = array("i")
+
+        for q in range(-radius, radius + 1):
+            for r in range(-radius, radius + 1):
+                if abs(q + r) <= radius:
+                    self.q.append(q)
+                    self.r.append(r)
+
+        self.size = len(self.q)
+        self.index = {(q, r): i for i, (q, r) in enumerate(zip(self.q, self.r))}
+        self._disks = {}
+
+    def disk(self, q, r, reach):
+        """Lista (indeks, odległość) hexów w odległości <= reach od (q, r)."""
+        key = (q, r, reach)
+        cached = self._disks.get(key)
+        if cached is None:
+            cached = []
+            for i in range(self.size):
+                d = (abs(q - self.q[i])
+                     + abs(q + r - self.q[i] - self.r[i])
+                     + abs(r - self.r[i])) // 2
+                if d <= reach:
+                    cached.append((i, d))
+            cached = tuple(cached)
+            self._disks[key] = cached
+        return cached
+
+    def locate(self, q, r):
+        """Indeks hexa zawierającego ułamkowy punkt osiowy (q, r) albo None."""
+        return self.index.get(axial_round(q, r))
+
+
+def axial_round(q, r):
+    """Zaokrągla ułamkowe współrzędne osiowe do najbliższego hexa (przez cube)."""
+    x, z = q, r
+    y = -x - z
+    rx, ry, rz = round(x), round(y), round(z)
+
+    dx = abs(rx - x)
+    dy = abs(ry - y)
+    dz = abs(rz - z)
+
+    if dx > dy and dx > dz:
+        rx = -ry - rz
+    elif dy <= dz:
+        rz = -rx - ry
+
+    return int(rx), int(rz)
+
+
+_LAYOUTS = {}
+
+
+def layout_for(radius):
+    """Współdzielony (cache) układ dla danego promienia."""
+    layout = _LAYOUTS.get(radius)
+    if layout is None:
+        layout = HexLayout(radius)
+        _LAYOUTS[radius] = layout
+    return layout
+
+
+def compute_fields(layout, sources, offsets):
+    """Zwraca {param: array('d')} - suma wpływów źródeł + przesunięcie planety.
+
+    `offsets` to {param: wartość} (planetarne biasy).
+    """
+    fields = {param: array("d", bytes(8 * layout.size)) for param in FIELD_PARAMS}
+
+    for src in sources:
+        field = fields[src.param]
+        profile = src.profile()
+        for i, d in layout.disk(src.q, src.r, len(profile) - 1):
+            field[i] += profile[d]
+
+    for param in FIELD_PARAMS:
+        offset = offsets.get(param, 0.0)
+        field = fields[param]
+        for i in range(layout.size):
+            field[i] += offset
+
+    return fields
+
+
+def compute_resources(fields):
+    """Wydobycie naturalne wszystkich hexów naraz (progi jak calculate_resources).
+
+    Zwraca {param: array('d')} ze znakiem: v > 0 to zasób "high" parametru,
+    v < 0 to zasób "low" (wydobycie -v), 0.0 - brak zasobu.
+    """
+    size = len(fields[FIELD_PARAMS[0]])
+    yields = {param: array("d", bytes(8 * size)) for param in FIELD_PARAMS}
+
+    for param in FIELD_PARAMS:
+        th = RESOURCE_THRESHOLDS[param]
+        out = yields[param]
+        for i, v in enumerate(fields[param]):
+            if v > th:
+                out[i] = v - th
+            elif v < -th:
+                out[i] = -(abs(v) - th)
+
+    return yields
+
+
+def reference_fields(planet):
+    """Pola liczone wprost przez Source.influence (punkt odniesienia)."""
+    hexes = planet.hex_map.hexes
+    fields = {param: [0.0] * len(hexes) for param in FIELD_PARAMS}
+
+    for src in planet.sources:
+        field = fields[src.param]
+        for i, h in enumerate(hexes):
+            field[i] += src.influence(h)
+
+    for param in FIELD_PARAMS:
+        offset = getattr(planet, param)
+        fields[param] = [v + offset for v in fields[param]]
+
+    return fields
+
+
+def verify_fields(planet, tolerance=FIELD_TOLERANCE):
+    """Porównuje pola hexów planety z referencją.
+
+    Zwraca (ok, największa różnica).
+    """
+    reference = reference_fields(planet)
+    worst = 0.0
+
+    for param in FIELD_PARAMS:
+        for value, expected in zip(planet.hex_map.values(param), reference[param]):
+            worst = max(worst, abs(value - expected))
+
+    return worst <= tolerance, worst
@@ -3,21 +3,88 @@ from buildings.constants import BUILDING_MAJOR, BUILDING_SMALL
 MAX_SMALL_BUILDINGS = 2
 
 class Hex:
-    def __init__(self, q, r):
-        self.q = q
-        self.r = r
-        self.MAX_SMALL_BUILDINGS = 2
-        self.temperature = 0.0
-        self.height = 0.0
-        self.life = 0.0
+    """Widok jednego hexa w HexMap (dane leżą w tablicach mapy)."""
+
+    __slots__ = ("map", "index")
+
+    MAX_SMALL_BUILDINGS = MAX_SMALL_BUILDINGS
+
+    def __init__(self, hex_map, index):
+        self.map = hex_map
+        self.index = index
+
+    @property
+    def q(self):
+        return self.map.layout.q[self.index]
+
+    @property
+    def r(self):
+        return self.map.layout.r[self.index]
+
+    # parametry
+    @property
+    def temperature(self):
+        return self.map.temperature[self.index]
+
+    @temperature.setter
+    def temperature(self, value):
+        self.map.temperature[self.index] = value
+        self.map.version += 1
+
+    @property
+    def height(self):
+        return self.map.height[self.index]
+
+    @height.setter
+    def height(self, value):
+        self.map.height[self.index] = value
+        self.map.version += 1
+
+    @property
+    def life(self):
+        return self.map.life[self.index]
+
+    @life.setter
+    def life(self, value):
+        self.map.life[self.index] = value
+        self.map.version += 1
+
+    @property
+    def resources(self):
+        # tylko do odczytu - zmiany przez przypisanie `hex.resources = {...}`
+        return self.map.resources_view(self.index)
+
+    @resources.setter
+    def resources(self, value):
+        self.map.set_resources(self.index, value)
+
+    # 🔹 budynki
+    @property
+    def building_major(self):               # jeden duży / planet_unique
+        return self.map.major.get(self.index)
+
+    @building_major.setter
+    def building_major(self, building):
+        if building is None:
+            self.map.major.pop(self.index, None)
+        else:
+            self.map.major[self.index] = building
+        self.map.buildings_version += 1
 
-        self.resources = {}
+    @property
+    def buildings_small(self):              # krotka małych (dodawanie przez add_building)
+        return tuple(self.map.small.get(self.index, ()))
 
-        # 🔹 budynki
-        self.building_major = None          # jeden duży / planet_unique
-        self.buildings_small = []            # lista małych
+    @property
+    def occupied(self):                     # np. UI / debug
+        return self.index in self.map.occupied
 
-        self.occupied = False                # np. UI / debug
+    @occupied.setter
+    def occupied(self, value):
+        if value:
+            self.map.occupied.add(self.index)
+        else:
+            self.map.occupied.discard(self.index)
 
     def is_blocked(self):
         return (
@@ -70,7 +137,8 @@ class Hex:
         if building.category != BUILDING_SMALL:
             self.building_major = building
         else:
-            self.buildings_small.append(building)
+            self.map.small.setdefault(self.index, []).append(building)
+            self.map.buildings_version += 1
 
                 
     def production_summary(self, population):
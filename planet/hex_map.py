@@ -1,16 +1,253 @@
 # planet/hex_map.py
+"""
+Mapa heksów planety w układzie struct-of-arrays.
+
+Współrzędne q/r są współdzielone przez wszystkie mapy o tym samym
+promieniu (planet/fields.py), a parametry (temperature/height/life)
+i wydobycie zasobów naturalnych trzymane są w ciągłych tablicach
+``array('d')``. Wydobycie jest zapisane ze znakiem na parametr: zasoby
+"high" i "low" jednego parametru nigdy nie występują razem na hexie. Budynki zapisywane są rzadko (indeks -> budynek).
+
+``hexes`` zwraca lekkie widoki Hex (tworzone leniwie, zawsze te same
+obiekty), więc istniejący kod może dalej iterować po hexach.
+"""
+from array import array
+from types import MappingProxyType
+
 from planet.hex import Hex
+from planet.fields import layout_for, FIELD_PARAMS
+from planet.resources import RESOURCE_MAP, NATURAL_RESOURCES, RESOURCE_SIDES, resources_for
+
+
+_PARAM_SIDES = [
+    (param, RESOURCE_MAP[param]["high"], RESOURCE_MAP[param]["low"])
+    for param in FIELD_PARAMS
+]
+
+
+def _zeros(size):
+    return array("d", bytes(8 * size))
+
 
 class HexMap:
     def __init__(self, radius):
-        self.hexes = []
+        self.radius = radius
+        self.layout = layout_for(radius)
+        self.size = size = self.layout.size
+
+        self.temperature = _zeros(size)
+        self.height = _zeros(size)
+        self.life = _zeros(size)
+
+        # wydobycie naturalne: param -> tablica (>0 "high", <0 "low", 0.0 brak)
+        self.yields = {param: _zeros(size) for param in FIELD_PARAMS}
+        # hexy z ręcznie ustawionym słownikiem zasobów (indeks -> dict)
+        self.resource_overrides = {}
+        # słowniki zasobów budowane przy pierwszym odczycie (do zmiany wydobycia)
+        self._resources = None
+
+        # budynki (rzadko): indeks -> budynek / lista małych
+        self.major = {}
+        self.small = {}
+        self.occupied = set()
+
+        # rośnie przy każdej zmianie pól lub zasobów / budynków
+        self.version = 0
+        self.buildings_version = 0
+
+        self._views = {}
+        self._hexes = None
+
+    # ------------------------------------------------------------------
+    # ZAPIS / ODCZYT (core/savegame.py)
+    # ------------------------------------------------------------------
+
+    def to_record(self):
+        """Stan mapy bez tablic pól/wydobycia (zapisywane osobno) i bez cache."""
+        return (
+            self.radius,
+            self.resource_overrides,
+            self.major,
+            self.small,
+            self.occupied,
+            self.version,
+            self.buildings_version,
+        )
+
+    @classmethod
+    def shell(cls):
+        """Pusta mapa do wypełnienia przez ``restore`` (widoki działają od razu)."""
+        hex_map = cls.__new__(cls)
+        hex_map._views = {}
+        hex_map._hexes = None
+        return hex_map
+
+    def restore(self, record, fields, yields):
+        (
+            self.radius,
+            self.resource_overrides,
+            self.major,
+            self.small,
+            self.occupied,
+            self.version,
+            self.buildings_version,
+        ) = record
+
+        self.layout = layout_for(self.radius)
+        self.size = self.layout.size
+        for param in FIELD_PARAMS:
+            setattr(self, param, fields[param])
+        self.yields = yields
+        self._resources = None
+        return self
+
+    # ------------------------------------------------------------------
+    # WIDOKI
+    # ------------------------------------------------------------------
+
+    @property
+    def q(self):
+        return self.layout.q
+
+    @property
+    def r(self):
+        return self.layout.r
+
+    @property
+    def hexes(self):
+        if self._hexes is None:
+            self._hexes = [self.hex(i) for i in range(self.size)]
+        return self._hexes
+
+    def __len__(self):
+        return self.size
+
+    def hex(self, index):
+        """Widok Hex dla indeksu (ten sam obiekt przy każdym wywołaniu)."""
+        view = self._views.get(index)
+        if view is None:
+            view = Hex(self, index)
+            self._views[index] = view
+        return view
+
+    def hex_at(self, q, r):
+        index = self.layout.index.get((q, r))
+        return None if index is None else self.hex(index)
+
+    def building_indices(self):
+        """Indeksy hexów z budynkami, rosnąco (kolejność jak w `hexes`)."""
+        if not self.small:
+            return sorted(self.major)
+        return sorted(self.small.keys() | self.major.keys())
+
+    # ------------------------------------------------------------------
+    # POLA / ZASOBY
+    # ------------------------------------------------------------------
+
+    def values(self, param):
+        return getattr(self, param)
+
+    def set_fields(self, fields):
+        """Podmienia tablice parametrów ({param: array('d')})."""
+        for param in FIELD_PARAMS:
+            setattr(self, param, fields[param])
+        self.version += 1
+
+    def set_yields(self, yields):
+        """Podmienia wydobycie naturalne ({param: array('d')} ze znakiem)."""
+        self.yields = yields
+        self.resource_overrides = {}
+        self._resources = None
+        self.version += 1
+
+    def resources_at(self, index):
+        """Kopia słownika zasobów hexa."""
+        return self._resource_dicts()[index].copy()
+
+    def resources_view(self, index):
+        """Zasoby hexa tylko do odczytu (bez kopii) - `hex.resources`."""
+        return MappingProxyType(self._resource_dicts()[index])
+
+    def _resource_dicts(self):
+        cache = self._resources
+        if cache is None:
+            cache = self._resources = [self._build_resources(i) for i in range(self.size)]
+        return cache
+
+    def _build_resources(self, index):
+        override = self.resource_overrides.get(index)
+        if override is not None:
+            return dict(override)
+
+        res = {}
+        yields = self.yields
+        for param, high, low in _PARAM_SIDES:
+            v = yields[param][index]
+            if v > 0:
+                res[high] = v
+            elif v < 0:
+                res[low] = -v
+        return res
+
+    def set_resources(self, index, resources):
+        resources = dict(resources)
+        self.resource_overrides.pop(index, None)
+        self._resources = None
+
+        signed = {}
+        for name, v in resources.items():
+            side = RESOURCE_SIDES.get(name)
+            if side is None or not v > 0 or side[0] in signed:
+                signed = None
+                break
+            signed[side[0]] = side[1] * v
+
+        for param, values in self.yields.items():
+            values[index] = signed.get(param, 0.0) if signed else 0.0
+
+        if signed is None or list(resources) != list(self._build_resources(index)):
+            # nietypowe klucze / zera / oba zasoby parametru / inna kolejność
+            self.resource_overrides[index] = resources
+        self.version += 1
+
+    def resource_totals(self):
+        """Suma zasobów naturalnych po hexach (kolejność kluczy jak przy
+        sumowaniu słowników `resources` hex po hexie)."""
+        if self.resource_overrides:
+            total = {}
+            for i in range(self.size):
+                for res, val in self.resources_at(i).items():
+                    total[res] = total.get(res, 0) + val
+            return total
+
+        found = []
+        for pos, res in enumerate(NATURAL_RESOURCES):
+            param, sign = RESOURCE_SIDES[res]
+            total = 0
+            first = None
+            for i, v in enumerate(self.yields[param]):
+                v *= sign
+                if v > 0:
+                    total += v
+                    if first is None:
+                        first = i
+            if first is not None:
+                found.append((first, pos, res, total))
+
+        found.sort()
+        return {res: total for _, _, res, total in found}
 
-        for q in range(-radius, radius + 1):
-            for r in range(-radius, radius + 1):
-                if abs(q + r) <= radius:
-                    self.hexes.append(Hex(q, r))
+    def recalculate_resources(self):
+        """Wydobycie naturalne z bieżących pól (progi jak calculate_resources)."""
+        yields = {param: _zeros(self.size) for param in FIELD_PARAMS}
+        for i, (t, h, l) in enumerate(zip(self.temperature, self.height, self.life)):
+            for res, val in resources_for(t, h, l).items():
+                param, sign = RESOURCE_SIDES[res]
+                yields[param][i] = sign * val
+        self.set_yields(yields)
 
     def apply_temperature_gradient(self, base_temp):
-        for hex in self.hexes:
-            dist = abs(hex.q) + abs(hex.r)
-            hex.temperature = base_temp - dist * 0.15
+        for i, (q, r) in enumerate(zip(self.q, self.r)):
+            dist = abs(q) + abs(r)
+            self.temperature[i] = base_temp - dist * 0.15
+        self.version += 1
@@ -12,13 +12,20 @@ from planet.sources import (
     ColdSource,
     ErosionSource,
     ToxicSource,
+    SOURCE_TYPES,
 )
-from planet.resources import ALL_RESOURCES, calculate_resources
+from planet.resources import ALL_RESOURCES
+from planet.fields import layout_for, compute_fields, compute_resources, FIELD_PARAMS
+from planet.production_plan import ProductionPlan
 from military.units import PlanetMilitaryManager
 from buildings.constants import BUILDING_SMALL, BUILDING_PLANET_UNIQUE
-from core.rng import uniform, choice
+from core.rng import shared_stream
+from core import replay
+from core import telemetry
 from collections import defaultdict
-import logging
+from array import array
+
+log = telemetry.channel("planet")
 
 ENERGY_PER_FREE_POP = 0.3
 MAX_SMALL_BUILDINGS = 2
@@ -34,7 +41,22 @@ COLONIZATION_COST = {
 
 
 class Planet:
-    def __init__(self, radius=5):
+    def __init__(self, radius=5, rng=None):
+        rng = rng or shared_stream()
+        self._init_state(radius)
+
+        # planetarne biasy
+        self.temperature = rng.uniform(-1.5, 1.5)
+        self.height = rng.uniform(-1.5, 1.5)
+        self.life = rng.uniform(-1.5, 1.5)
+
+        self.sources = []
+        self._generate_sources(rng)
+        self._apply_sources()
+        self._calculate_resources()
+
+    def _init_state(self, radius):
+        """Stan niezależny od losowania (wspólny dla __init__ i odtwarzania)."""
         self.colonized = False
         self.owner = None
         self.radius = radius
@@ -55,11 +77,6 @@ class Planet:
         self.buildings = []
         self.morale_regen = 0.05
 
-        # planetarne biasy
-        self.temperature = uniform(-1.5, 1.5)
-        self.height = uniform(-1.5, 1.5)
-        self.life = uniform(-1.5, 1.5)
-
         self.colonization_state = "none"
         self.colonization_progress = 0.0
         self.colonization_time = 10.0
@@ -71,81 +88,109 @@ class Planet:
         self.hex_cap = 2
 
         self.hex_map = HexMap(radius)
+        # metryki pochodne pól, ważne dopóki hex_map.version się nie zmieni
+        self._metrics = {}
+        self._metrics_version = None
+        self._production_plan = None
+        self._forecast = None
 
         self.sources = []
-        self._generate_sources()
-        self._apply_sources()
-        self._calculate_resources()
-        self._determine_primary_resource()
         self.military_manager = PlanetMilitaryManager(self)
         self.production_speed = 1.0
 
     # ------------------------------------------------------------------
-    # SOURCES / HEXES
+    # GENERATION RECORD
     # ------------------------------------------------------------------
 
-    def _generate_sources(self):
-        sample_hexes = self.hex_map.hexes[:]
-
-        for _ in range(3):
-            h = choice(sample_hexes)
-            self.sources.append(TemperatureSource(h.q, h.r, uniform(2, 3)))
+    def generation_record(self):
+        """Wynik generowania planety w zwartej postaci (krotki + bajty tablic).
 
-        for _ in range(3):
-            h = choice(sample_hexes)
-            self.sources.append(HeightSource(h.q, h.r, uniform(2, 3)))
-
-        for _ in range(3):
-            h = choice(sample_hexes)
-            self.sources.append(LifeSource(h.q, h.r, uniform(2, 3)))
+        Wystarcza do odtworzenia planety bez ponownego liczenia pól.
+        """
+        hm = self.hex_map
+        return (
+            self.radius,
+            self.temperature,
+            self.height,
+            self.life,
+            getattr(self, "base_temperature", None),
+            tuple((type(s).__name__, s.q, s.r, s.strength) for s in self.sources),
+            tuple(getattr(hm, param).tobytes() for param in FIELD_PARAMS),
+            tuple(hm.yields[param].tobytes() for param in FIELD_PARAMS),
+        )
 
-        for _ in range(3):
-            h = choice(sample_hexes)
-            self.sources.append(ColdSource(h.q, h.r, uniform(2, 3)))
+    @classmethod
+    def from_generation_record(cls, record):
+        radius, temperature, height, life, base_temperature, sources, fields, yields = record
+
+        planet = cls.__new__(cls)
+        planet._init_state(radius)
+        planet.temperature = temperature
+        planet.height = height
+        planet.life = life
+        if base_temperature is not None:
+            planet.base_temperature = base_temperature
+
+        planet.sources = [SOURCE_TYPES[name](q, r, strength) for name, q, r, strength in sources]
+        planet.hex_map.set_fields({
+            param: array("d", data) for param, data in zip(FIELD_PARAMS, fields)
+        })
+        planet.hex_map.set_yields({
+            param: array("d", data) for param, data in zip(FIELD_PARAMS, yields)
+        })
+        return planet
 
-        for _ in range(3):
-            h = choice(sample_hexes)
-            self.sources.append(ErosionSource(h.q, h.r, uniform(2, 3)))
+    # ------------------------------------------------------------------
+    # SOURCES / HEXES
+    # ------------------------------------------------------------------
 
-        for _ in range(3):
-            h = choice(sample_hexes)
-            self.sources.append(ToxicSource(h.q, h.r, uniform(2, 3)))
+    def _generate_sources(self, rng=None):
+        rng = rng or shared_stream()
+        # losujemy indeks hexa (ten sam los co choice(hexes)), bez tworzenia widoków
+        cells = range(len(self.hex_map))
+        q, r = self.hex_map.q, self.hex_map.r
+
+        for source_cls in (
+            TemperatureSource,
+            HeightSource,
+            LifeSource,
+            ColdSource,
+            ErosionSource,
+            ToxicSource,
+        ):
+            for _ in range(3):
+                i = rng.choice(cells)
+                self.sources.append(source_cls(q[i], r[i], rng.uniform(2, 3)))
 
     def _apply_sources(self):
-        for h in self.hex_map.hexes:
-            h.temperature = 0.0
-            h.height = 0.0
-            h.life = 0.0
-
-        for src in self.sources:
-            for h in self.hex_map.hexes:
-                h.apply_parameter(src.param, src.influence(h))
-
-        # planetarne przesunięcie
-        for h in self.hex_map.hexes:
-            h.temperature += self.temperature
-            h.height += self.height
-            h.life += self.life
+        # silnik pól: wpływ źródeł tylko na hexy w zasięgu + planetarne przesunięcie
+        fields = compute_fields(
+            layout_for(self.radius),
+            self.sources,
+            {"temperature": self.temperature, "height": self.height, "life": self.life},
+        )
+        self.hex_map.set_fields(fields)
             
     def sources_at(self, q, r):
         return [s for s in self.sources if s.q == q and s.r == r]
 
 
     def _calculate_resources(self):
-        for h in self.hex_map.hexes:
-            calculate_resources(h)
+        hm = self.hex_map
+        hm.set_yields(compute_resources(
+            {"temperature": hm.temperature, "height": hm.height, "life": hm.life}
+        ))
             
     def get_location(self, galaxy):
-        for entry in galaxy.systems:
-            system = entry["system"]
-            if self in system.planets:
-                orbit = system.planets.index(self)
-                return system, orbit
-        return None, None
+        entry, orbit = galaxy.locate_planet(self)
+        if entry is None:
+            return None, None
+        return entry["system"], orbit
     
     def buildings_summary(self):
         summary = []
-        for h in self.hex_map.hexes:
+        for i in self.hex_map.building_indices():
+            h = self.hex_map.hex(i)
             if getattr(h, "building_major", None):
                 summary.append(f"{h.building_major.name} @ ({h.q},{h.r})")
             for b in h.buildings_small:
@@ -153,12 +198,8 @@ class Planet:
         return summary
     
     def total_buildings(self):
-        total = 0
-        for h in self.hex_map.hexes:
-            total += len(h.buildings_small)
-            if getattr(h, "building_major", None):
-                total += 1
-        return total
+        hm = self.hex_map
+        return len(hm.major) + sum(len(small) for small in hm.small.values())
 
 
     def extreme_level(self, stat_name):
@@ -167,7 +208,23 @@ class Planet:
         1.0 – ekstremalnie niestabilna
         """
         MAX_RANGE = 8.0
-        return min(1.0, self.stat_range(stat_name) / MAX_RANGE)
+        return self._cached(
+            ("extreme", stat_name),
+            lambda: min(1.0, self.stat_range(stat_name) / MAX_RANGE),
+        )
+
+    def _cached(self, key, compute):
+        """Metryka liczona raz na wersję pól (hex_map.version)."""
+        version = self.hex_map.version
+        if self._metrics_version != version:
+            self._metrics = {}
+            self._metrics_version = version
+
+        try:
+            return self._metrics[key]
+        except KeyError:
+            value = self._metrics[key] = compute()
+            return value
 
 
 
@@ -176,16 +233,21 @@ class Planet:
     # ------------------------------------------------------------------
 
     def _determine_primary_resource(self):
-        total = {}
-        for h in self.hex_map.hexes:
-            for res, val in h.resources.items():
-                total[res] = total.get(res, 0) + val
-        self.primary_resource = max(total, key=total.get)
+        total = self.resource_totals()
+        return max(total, key=total.get)
+
+    @property
+    def primary_resource(self):
+        return self._cached("primary_resource", self._determine_primary_resource)
+
+    def resource_totals(self):
+        """Suma zasobów naturalnych wszystkich hexów (kopia z cache)."""
+        return dict(self._cached("resource_totals", self.hex_map.resource_totals))
 
     def init_population_stats(self):
         stats = {r: 0.0 for r in BASIC_RESOURCES}
-        for h in self.hex_map.hexes:
-            for res, val in h.resources.items():
+        for i in range(len(self.hex_map)):
+            for res, val in self.hex_map.resources_at(i).items():
                 if val > stats[res]:
                     stats[res] = val
         self.population.stats = stats
@@ -212,10 +274,16 @@ class Planet:
     # ------------------------------------------------------------------
 
     def stat_range(self, stat_name):
-        values = [getattr(h, stat_name) for h in self.hex_map.hexes]
+        return self._cached(("range", stat_name), lambda: self._stat_range(stat_name))
+
+    def _stat_range(self, stat_name):
+        values = self.hex_map.values(stat_name)
         return max(values) - min(values)
 
     def instability(self):
+        return self._cached("instability", self._instability)
+
+    def _instability(self):
         temp = min(1.0, self.stat_range("temperature") / MAX_STAT_RANGE)
         height = min(1.0, self.stat_range("height") / MAX_STAT_RANGE)
         life = min(1.0, self.stat_range("life") / MAX_STAT_RANGE)
@@ -226,6 +294,17 @@ class Planet:
             life * 0.3
         )
 
+    def harmony_average(self):
+        """Średnie |temperature|+|height|+|life| / 3 po hexach (0.0 = harmonia)."""
+        return self._cached("harmony", self._harmony_average)
+
+    def _harmony_average(self):
+        avg_abs = 0.0
+        hm = self.hex_map
+        for t, hg, l in zip(hm.temperature, hm.height, hm.life):
+            avg_abs += (abs(t) + abs(hg) + abs(l)) / 3.0
+        return avg_abs / max(1, len(hm))
+
     # ------------------------------------------------------------------
     # PRODUCTION
     # ------------------------------------------------------------------
@@ -234,20 +313,38 @@ class Planet:
         if not self.colonized or self.population.size == 0:
             return {}
 
-        total = {}
-        self.population.used = 0.0
+        plan = self.production_plan()
+        total, used = plan.run(self.storage, self.population.size)
+        self.population.used = used
 
-        for h in self.hex_map.hexes:
+        return total
 
-            # SMALL
-            for b in h.buildings_small:
-                self._process_building(b, h, total)
+    def forecast_production(self):
+        """Produkcja następnej tury bez efektów ubocznych.
 
-            # MAJOR
-            if h.building_major:
-                self._process_building(h.building_major, h, total)
+        Liczy to samo co produce() na kopii magazynu - nie zmienia
+        storage ani population.used. Wynik jest pamiętany dopóki nie
+        zmieni się plan produkcji, populacja lub magazyn (czyli do
+        następnej tury).
+        """
+        if not self.colonized or self.population.size == 0:
+            return {}
 
-        return total
+        plan = self.production_plan()
+        key = (plan.key, self.population.size, tuple(self.storage.items()))
+        if self._forecast is None or self._forecast[0] != key:
+            total, _ = plan.run(dict(self.storage), self.population.size)
+            self._forecast = (key, total)
+
+        return dict(self._forecast[1])
+
+    def production_plan(self):
+        """Skompilowany plan produkcji (przebudowywany po zmianie budynków,
+        populacji lub pól)."""
+        plan = self._production_plan
+        if plan is None or plan.key != ProductionPlan.key_for(self):
+            plan = self._production_plan = ProductionPlan.compile(self)
+        return plan
 
 
     # ------------------------------------------------------------------
@@ -266,11 +363,7 @@ class Planet:
 
         # Jeśli planeta skolonizowana, ale populacja wygasła -> dekolonizuj
         if self.population.size <= 0.0:
-            try:
-                import logging
-                logging.info("kolonia wymarła %s", id(self))
-            except Exception:
-                pass
+            log.info("colony_died", "kolonia wymarła %(planet)s", planet=id(self))
             self.set_owner(None)
             return
         production = self.produce()
@@ -306,10 +399,7 @@ class Planet:
         # then population grows faster. Compute average absolute deviation per-hex
         # and give a modest bonus when avg_abs < 0.5 (up to +50% growth_mod).
         try:
-            avg_abs = 0.0
-            for h in self.hex_map.hexes:
-                avg_abs += (abs(h.temperature) + abs(h.height) + abs(h.life)) / 3.0
-            avg_abs /= max(1, len(self.hex_map.hexes))
+            avg_abs = self.harmony_average()
             # Stronger harmony bonus: if hex stats are near 0 (avg_abs -> 0)
             # grant up to +100% growth_mod. Scale linearly so avg_abs==0 -> +1.0, avg_abs>=0.6 -> +0
             max_threshold = 0.6
@@ -318,7 +408,7 @@ class Planet:
             harmony_bonus = harmony_norm  # up to 1.0
             growth_mod *= (1.0 + harmony_bonus)
         except Exception:
-            logging.debug("Failed computing harmony bonus for planet %s", id(self))
+            log.debug("harmony_failed", "Failed computing harmony bonus for planet %(planet)s", planet=id(self))
         
         # 2️⃣ Carrying capacity (max populacja)
         max_pop = getattr(self, 'max_population', 100.0)  # domyślnie 100
@@ -340,8 +430,7 @@ class Planet:
         self.population.size = min(self.population.size, max_pop)
         
         if self.population.size<=0.0:
-            import logging
-            logging.info("kolonia wymarła %s", id(self))
+            log.info("colony_died", "kolonia wymarła %(planet)s", planet=id(self))
             self.set_owner(None)
 
 
@@ -369,7 +458,8 @@ class Planet:
             # Do NOT mutate planet storage here: `empire.sell_resources`
             # is responsible for validating and deducting the sold amount.
             revenue = empire.sell_resources(self, resource, amount, price_per_unit)
-            logging.info("Planet %s sold %.1f %s for %.2f", id(self), amount, resource, revenue)
+            log.info("sell", "Planet %(planet)s sold %(amount).1f %(res)s for %(revenue).2f",
+                     planet=id(self), amount=amount, res=resource, revenue=revenue)
             return revenue
         except Exception:
             return 0.0
@@ -391,21 +481,17 @@ class Planet:
         """POPRAWIONA WERSJA"""
         self.colonization_state = "colonized"
         self.colonized = True
+        replay.active().record("colonize", planet=self, empire=self.owner)
+        self._update_owner_index(self.owner, self.owner)
         
         # ✅ POPRAWKA: Sprawdź czy już jest w liście
         if self.owner and self not in self.owner.planets:
             self.owner.planets.append(self)
-            try:
-                import logging
-                logging.info("COLONY Planet %s colonized by %s", id(self), self.owner.name)
-            except Exception:
-                pass
+            log.info("colonize", "COLONY Planet %(planet)s colonized by %(empire)s",
+                     planet=id(self), empire=self.owner.name)
         elif self.owner and self in self.owner.planets:
-            try:
-                import logging
-                logging.info("COLONY Planet %s already in %s list", id(self), self.owner.name)
-            except Exception:
-                pass
+            log.info("colonize", "COLONY Planet %(planet)s already in %(empire)s list",
+                     planet=id(self), empire=self.owner.name)
         
         # Inicjalizacja
         if not self.population or self.population.size == 0:
@@ -419,28 +505,6 @@ class Planet:
             self.storage = {r: 10.0 for r in BASIC_RESOURCES}
 
 
-    def _process_building(self, b, hex, total):
-        workers = getattr(b, "workers_required", 0.0)
-        
-        if not self.population.can_support(workers):
-            return
-
-        delta = b.produce(hex, self.population)
-
-        # 1️⃣ SPRAWDŹ INPUTY
-        for res, val in delta.items():
-            if val < 0 and self.storage.get(res, 0.0) < -val:
-                return  # brak surowców → budynek nie działa
-
-        # 2️⃣ ZASTOSUJ DELTĘ
-        for res, val in delta.items():
-            self.storage[res] = self.storage.get(res, 0.0) + val
-            total[res] = total.get(res, 0.0) + val
-
-        self.population.add_load(workers)
-
-
-
     def get_center_hex(self):
         return min(
             self.hex_map.hexes,
@@ -448,8 +512,8 @@ class Planet:
         )
 
     def has_spaceport(self):
-        for h in self.hex_map.hexes:
-            if h.building_major and h.building_major.name == "Space Port":
+        for b in self.hex_map.major.values():
+            if b.name == "Space Port":
                 return True
         return False
 
@@ -458,26 +522,36 @@ class Planet:
         Bezpiecznie zmienia właściciela planety
         Usuwa z listy starego, dodaje do nowego
         """
+        old_owner = self.owner
+        if old_owner is not new_empire:
+            replay.active().record("owner", planet=self, old=old_owner, new=new_empire)
+
         # Usuń ze starego właściciela jeśli jest inny
         if self.owner and self.owner != new_empire:
             if self in self.owner.planets:
                 self.owner.planets.remove(self)
-                try:
-                    print(f"[OWNERSHIP] Removed planet from {self.owner.name}")
-                except Exception:
-                    pass
+                log.info("owner_removed", "[OWNERSHIP] Removed planet from %(empire)s",
+                         empire=getattr(self.owner, "name", None))
 
         # Jeśli new_empire to None (lub sentinel), wyczyść właściciela
         if new_empire is None or new_empire == "none":
             self.owner = None
+            self._update_owner_index(old_owner, None)
             return
 
         # Dodaj do nowego właściciela jeśli to obiekt Empire
         self.owner = new_empire
+        self._update_owner_index(old_owner, new_empire)
         try:
             if self not in new_empire.planets:
                 new_empire.planets.append(self)
-                print(f"[OWNERSHIP] Added planet to {new_empire.name}")
+                log.info("owner_added", "[OWNERSHIP] Added planet to %(empire)s", empire=new_empire.name)
         except Exception:
             # Nie zakładaj, że new_empire ma listę `planets`
-            pass
\ No newline at end of file
+            pass
+
+    def _update_owner_index(self, old_owner, new_owner):
+        """Aktualizuje indeks własności galaktyki (przez galaxy imperium)."""
+        galaxy = getattr(new_owner, "galaxy", None) or getattr(old_owner, "galaxy", None)
+        if galaxy is not None and hasattr(galaxy, "update_planet_owner"):
+            galaxy.update_planet_owner(self, new_owner)
@@ -0,0 +1,80 @@
+# planet/production_plan.py
+"""
+Skompilowany plan produkcji planety.
+
+``Building.produce(hex, population)`` zależy tylko od hexa (zasoby,
+parametry), statystyk populacji i stałych budynku, więc zamiast wołać go
+dla każdego budynku co turę, plan zapamiętuje gotowe delty w kolejności
+budynków (hex po hexie: małe, potem duży). Tura to jedno przejście po
+płaskich listach z semantyką "wszystko albo nic": budynek działa tylko
+gdy starcza populacji i wszystkich inputów w magazynie.
+"""
+
+
+class ProductionPlan:
+    def __init__(self, key, workers, needs, deltas):
+        self.key = key
+        self.workers = workers    # robotnicy na budynek
+        self.needs = needs        # ((zasób, wymagana ilość), ...) na budynek
+        self.deltas = deltas      # ((zasób, delta), ...) na budynek
+
+    def __len__(self):
+        return len(self.workers)
+
+    @staticmethod
+    def key_for(planet):
+        """Plan jest ważny dopóki nie zmienią się budynki, populacja
+        (obiekt i statystyki) ani pola hexów."""
+        hm = planet.hex_map
+        population = planet.population
+        return (
+            hm.buildings_version,
+            hm.version,
+            id(population),
+            tuple(population.stats.items()),
+        )
+
+    @classmethod
+    def compile(cls, planet):
+        hm = planet.hex_map
+        population = planet.population
+        workers, needs, deltas = [], [], []
+
+        for i in hm.building_indices():
+            h = hm.hex(i)
+            buildings = list(h.buildings_small)
+            if h.building_major:
+                buildings.append(h.building_major)
+
+            for b in buildings:
+                delta = b.produce(h, population)
+                workers.append(getattr(b, "workers_required", 0.0))
+                needs.append(tuple((res, -val) for res, val in delta.items() if val < 0))
+                deltas.append(tuple(delta.items()))
+
+        return cls(cls.key_for(planet), workers, needs, deltas)
+
+    def run(self, storage, size, used=0.0):
+        """Stosuje plan do `storage` (modyfikowany w miejscu).
+
+        Zwraca (suma delt, zajęta populacja).
+        """
+        total = {}
+
+        for workers, needs, delta in zip(self.workers, self.needs, self.deltas):
+            # populacja (jak Population.can_support)
+            if not used + workers <= size:
+                continue
+
+            # 1️⃣ SPRAWDŹ INPUTY
+            if any(storage.get(res, 0.0) < need for res, need in needs):
+                continue  # brak surowców → budynek nie działa
+
+            # 2️⃣ ZASTOSUJ DELTĘ
+            for res, val in delta:
+                storage[res] = storage.get(res, 0.0) + val
+                total[res] = total.get(res, 0.0) + val
+
+            used += workers
+
+        return total, used
@@ -48,12 +48,23 @@ RESOURCE_THRESHOLDS = {
 }
 
 
-def calculate_resources(hex):
-    res = {}
+# zasoby naturalne w kolejności, w jakiej powstają w resources_for
+NATURAL_RESOURCES = [
+    RESOURCE_MAP[param][side]
+    for param in ("temperature", "height", "life")
+    for side in ("high", "low")
+]
+
+# zasób -> (parametr, znak): "high" to wartość dodatnia, "low" ujemna
+RESOURCE_SIDES = {
+    RESOURCE_MAP[param][side]: (param, 1.0 if side == "high" else -1.0)
+    for param in RESOURCE_MAP
+    for side in ("high", "low")
+}
+
 
-    t = hex.temperature
-    h = hex.height
-    l = hex.life
+def resources_for(t, h, l):
+    res = {}
 
     t_th = RESOURCE_THRESHOLDS["temperature"]
     h_th = RESOURCE_THRESHOLDS["height"]
@@ -74,6 +85,8 @@ def calculate_resources(hex):
     elif l < -l_th:
         res["rare_elements"] = abs(l) - l_th
 
-    hex.resources = res
+    return res
 
 
+def calculate_resources(hex):
+    hex.resources = resources_for(hex.temperature, hex.height, hex.life)
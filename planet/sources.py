@@ -2,86 +2,88 @@
 from core.utils import hex_distance
 
 class Source:
+    # profil wpływu: radius (w hexach), wykładnik spadku i znak
+    __slots__ = ("q", "r", "strength")
+
+    param = None
+    radius = 5.0
+    power = 1.0
+    sign = 1.0
+
     def __init__(self, q, r, strength):
         self.q = q
         self.r = r
         self.strength = strength
 
-    def influence(self, target_hex):
-        raise NotImplementedError
+    def influence_at(self, d):
+        """Wpływ źródła na hex w odległości `d`."""
+        if d > self.radius:
+            return 0.0
+        falloff = 1.0 - d / self.radius
+        if self.power != 1.0:
+            falloff = falloff ** self.power
+        return self.sign * self.strength * falloff
+
+    def influence(self, h):
+        return self.influence_at(hex_distance(self, h))
+
+    def profile(self):
+        """Wpływ dla odległości 0..radius (tablica dla silnika pól)."""
+        return [self.influence_at(d) for d in range(int(self.radius) + 1)]
 
 
 class TemperatureSource(Source):
+    __slots__ = ()
     param = "temperature"
     icon = "temperature"
-    def influence(self, h):
-        d = hex_distance(self, h)
-        radius = 5.0
-        if d > radius:
-            return 0.0
-        falloff = 1.0 - d / radius
-        return self.strength * falloff
+
 
 class ColdSource(Source):
+    __slots__ = ()
     param = "temperature"
     icon = "cold"
-    def influence(self, h):
-        d = hex_distance(self, h)
-        radius = 5.0
-        if d > radius:
-            return 0.0
-        falloff = 1.0 - d / radius
-        return -self.strength * falloff
+    sign = -1.0
 
 
 class HeightSource(Source):
+    __slots__ = ()
     param = "height"
     icon = "height"
-
-    def influence(self, h):
-        d = hex_distance(self, h)
-        radius = 5.0
-        if d > radius:
-            return 0.0
-        falloff = 1.0 - d / radius
-        falloff = falloff ** 0.6
-        return self.strength * falloff
+    power = 0.6
 
 
 class ErosionSource(Source):
+    __slots__ = ()
     param = "height"
     icon = "erosion"
+    power = 0.6
+    sign = -1.0
 
-    def influence(self, h):
-        d = hex_distance(self, h)
-        radius = 5.0
-        if d > radius:
-            return 0.0
-        falloff = 1.0 - d / radius
-        falloff = falloff ** 0.6
-        return -self.strength * falloff
 
 class LifeSource(Source):
+    __slots__ = ()
     param = "life"
     icon = "life"
-
-    def influence(self, h):
-        d = hex_distance(self, h)
-        radius = 4.0
-        if d > radius:
-            return 0.0
-        falloff = 1.0 - d / radius
-        return self.strength * falloff
+    radius = 4.0
 
 
 class ToxicSource(Source):
+    __slots__ = ()
     param = "life"
     icon = "toxic"
-
-    def influence(self, h):
-        d = hex_distance(self, h)
-        radius = 4.0
-        if d > radius:
-            return 0.0
-        falloff = 1.0 - d / radius
-        return -self.strength * falloff
+    radius = 4.0
+    sign = -1.0
+
+
+# nazwa klasy -> klasa (odtwarzanie źródeł z zapisanych rekordów)
+SOURCE_TYPES = {
+    cls.__name__: cls
+    for cls in (
+        TemperatureSource,
+        ColdSource,
+        HeightSource,
+        ErosionSource,
+        LifeSource,
+        ToxicSource,
+    )
+}
@@ -4,6 +4,7 @@ Prosty, działający system scrollowania dla build menu
 """
 
 import pygame
+from render.fonts import get_font, render_text
 
 class BuildMenuState:
     """Stan menu budowy (używany w main.py)"""
@@ -37,13 +38,13 @@ def draw_simple_build_menu(screen, planet, hex, available_buildings, font, menu_
     pygame.draw.rect(screen, (15, 15, 30), (x, y, menu_w, menu_h))
     pygame.draw.rect(screen, (120, 120, 180), (x, y, menu_w, menu_h), 2)
     
-    big_font = pygame.font.SysFont(None, 26)
+    big_font = get_font(None, 26)
     
     # === HEADER (nie scrolluje) ===
     header_h = 120
     pygame.draw.rect(screen, (20, 25, 35), (x, y, menu_w, header_h))
     
-    title = big_font.render("BUILD MENU", True, (255, 255, 255))
+    title = render_text(big_font, "BUILD MENU", True, (255, 255, 255))
     screen.blit(title, (x + menu_w // 2 - title.get_width() // 2, y + 10))
     
     # Taby kategorii
@@ -77,7 +78,7 @@ def draw_simple_build_menu(screen, planet, hex, available_buildings, font, menu_
         pygame.draw.rect(screen, (100, 120, 160), tab_rect, 2 if is_active else 1)
         
         text_color = (220, 220, 240) if is_active else (180, 180, 200)
-        text = font.render(cat_name, True, text_color)
+        text = render_text(font, cat_name, True, text_color)
         screen.blit(text, (tab_x + tab_w//2 - text.get_width()//2, tab_y + 8))
         
         clickable_tabs.append((cat_value, tab_rect))
@@ -90,7 +91,7 @@ def draw_simple_build_menu(screen, planet, hex, available_buildings, font, menu_
         filtered = available_buildings
     
     count_text = f"{len(filtered)} buildings"
-    screen.blit(font.render(count_text, True, (180, 180, 200)), (x + 20, tab_y + 40))
+    screen.blit(render_text(font, count_text, True, (180, 180, 200)), (x + 20, tab_y + 40))
     
     # === SCROLLABLE AREA ===
     scroll_y = y + header_h
@@ -101,7 +102,7 @@ def draw_simple_build_menu(screen, planet, hex, available_buildings, font, menu_
     
     if not filtered:
         screen.blit(
-            font.render("No buildings available", True, (200, 150, 150)),
+            render_text(font, "No buildings available", True, (200, 150, 150)),
             (x + 50, scroll_y + 50)
         )
         return [], clickable_tabs
@@ -144,11 +145,11 @@ def draw_simple_build_menu(screen, planet, hex, available_buildings, font, menu_
         pygame.draw.rect(screen, (100, 120, 160), item_rect, 2 if is_hovered else 1)
         
         # Nazwa
-        name = big_font.render(building.name, True, (220, 220, 240))
+        name = render_text(big_font, building.name, True, (220, 220, 240))
         screen.blit(name, (item_rect.x + 10, item_rect.y + 8))
         
         # Kategoria
-        cat = font.render(f"[{building.category}]", True, (140, 140, 160))
+        cat = render_text(font, f"[{building.category}]", True, (140, 140, 160))
         screen.blit(cat, (item_rect.x + 10, item_rect.y + 32))
         
         # Koszt
@@ -159,18 +160,18 @@ def draw_simple_build_menu(screen, planet, hex, available_buildings, font, menu_
             color = (120, 200, 120) if avail >= amount else (200, 120, 120)
             
             text = f"{res[:3]}: {amount:.0f}"
-            screen.blit(font.render(text, True, color), (cost_x, cost_y))
+            screen.blit(render_text(font, text, True, color), (cost_x, cost_y))
             cost_x += 85
         
         # Upkeep
         upkeep = f"Up: {building.pop_upkeep:.1f}p {building.cash:.1f}e"
-        screen.blit(font.render(upkeep, True, (130, 130, 150)), (item_rect.x + 300, item_rect.y + 30))
+        screen.blit(render_text(font, upkeep, True, (130, 130, 150)), (item_rect.x + 300, item_rect.y + 30))
         
         # Status
         can_afford = building.can_afford(planet)
         status = "✓" if can_afford else "✗"
         color = (120, 200, 120) if can_afford else (200, 120, 120)
-        screen.blit(big_font.render(status, True, color), (item_rect.x + menu_w - 100, item_rect.y + 15))
+        screen.blit(render_text(big_font, status, True, color), (item_rect.x + menu_w - 100, item_rect.y + 15))
         
         # ✅ Dodaj do clickable TYLKO widoczny rect
         clickable_buildings.append((building, visible_rect))
@@ -200,7 +201,7 @@ def draw_simple_build_menu(screen, planet, hex, available_buildings, font, menu_
     pygame.draw.line(screen, (100, 100, 120), (x, footer_y), (x + menu_w, footer_y), 1)
     
     inst = "Click to build | Mouse wheel to scroll | ESC to cancel"
-    screen.blit(font.render(inst, True, (150, 150, 150)), (x + 20, footer_y + 12))
+    screen.blit(render_text(font, inst, True, (150, 150, 150)), (x + 20, footer_y + 12))
     
     return clickable_buildings, clickable_tabs
 
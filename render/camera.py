@@ -0,0 +1,59 @@
+# render/camera.py
+"""
+Kamera widoku galaktyki: przesunięcie obszaru rysowania (offset),
+przesunięcie świata (pan) i zoom.
+
+    ekran = offset + (świat - pan) * zoom
+
+Bez zależności od pygame, żeby dało się ją testować bez okna.
+"""
+
+MIN_ZOOM = 0.1
+MAX_ZOOM = 4.0
+
+
+class GalaxyCamera:
+    def __init__(self, offset=(0, 0), zoom=1.0, pan=(0.0, 0.0)):
+        self.offset = tuple(offset)
+        self.zoom = zoom
+        self.pan = tuple(pan)
+
+    def view_key(self):
+        return self.offset, self.zoom, self.pan
+
+    def world_to_screen(self, x, y):
+        return (
+            int(self.offset[0] + (x - self.pan[0]) * self.zoom),
+            int(self.offset[1] + (y - self.pan[1]) * self.zoom),
+        )
+
+    def screen_to_world(self, sx, sy):
+        return (
+            (sx - self.offset[0]) / self.zoom + self.pan[0],
+            (sy - self.offset[1]) / self.zoom + self.pan[1],
+        )
+
+    def visible_world(self, area, margin=0.0):
+        """Prostokąt świata (x0, y0, x1, y1) widoczny w obszarze `area`."""
+        x0 = self.pan[0] - margin
+        y0 = self.pan[1] - margin
+        x1 = self.pan[0] + area[0] / self.zoom + margin
+        y1 = self.pan[1] + area[1] / self.zoom + margin
+        return x0, y0, x1, y1
+
+    def pan_by(self, dx, dy):
+        """Przesuwa widok o (dx, dy) pikseli ekranu."""
+        self.pan = (self.pan[0] + dx / self.zoom, self.pan[1] + dy / self.zoom)
+
+    def zoom_at(self, factor, screen_pos):
+        """Zmienia zoom tak, by punkt świata pod `screen_pos` został na miejscu."""
+        zoom = max(MIN_ZOOM, min(MAX_ZOOM, self.zoom * factor))
+        if zoom == self.zoom:
+            return
+
+        wx, wy = self.screen_to_world(*screen_pos)
+        self.zoom = zoom
+        self.pan = (
+            wx - (screen_pos[0] - self.offset[0]) / zoom,
+            wy - (screen_pos[1] - self.offset[1]) / zoom,
+        )
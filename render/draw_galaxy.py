@@ -1,48 +1,187 @@
 # render/draw_galaxy.py
 import pygame
 from render.colors import STAR_COLORS, BACKGROUND
+from render.camera import GalaxyCamera
+from galaxy.spatial import SpatialGrid
 
 SYSTEM_RADIUS = 6
 
 LINK_COLOR = (80, 80, 120)
 
-def draw_galaxy(screen, galaxy,offset,area):
-    screen.fill(BACKGROUND)
+# Poziomy szczegółów: poniżej LANE_MIN_ZOOM bez torów,
+# poniżej DOT_MAX_ZOOM systemy jako pojedyncze kropki
+LANE_MIN_ZOOM = 0.3
+DOT_MAX_ZOOM = 0.5
+ZOOM_STEP = 1.2
 
-    # połączenia
-    for s in galaxy.systems:
-        for t in s["links"]:
-            pygame.draw.line(
-                screen,
-                LINK_COLOR,
-                (int(s["x"])+offset[0], int(s["y"])),
-                (int(t["x"])+offset[0], int(t["y"])),
-                1
-            )
 
-    # systemy
-    for s in galaxy.systems:
-        x = int(s["x"])
-        y = int(s["y"])
+def marker_radius(zoom):
+    return max(1, int(round(SYSTEM_RADIUS * zoom)))
 
-        system = s["system"]
-        color = system_color(system)
 
-        pygame.draw.circle(screen, color, (x+offset[0], y), SYSTEM_RADIUS)
+def galaxy_lanes(galaxy):
+    """Każdy tor raz jako (i, j), i < j - `links` są symetryczne."""
+    index = {id(s): i for i, s in enumerate(galaxy.systems)}
+    lanes = set()
+    for i, s in enumerate(galaxy.systems):
+        for t in s["links"]:
+            j = index[id(t)]
+            if i != j:
+                lanes.add((min(i, j), max(i, j)))
+    return sorted(lanes)
+
+
+class GalaxyRenderer:
+    """
+    Warstwa galaktyki (tory + znaczniki systemów) na powierzchni poza ekranem.
+
+    Warstwa jest przerysowywana tylko po zmianie kamery lub obszaru;
+    rysuje wtedy wyłącznie tory i systemy w widocznym prostokącie.
+    Kolory systemów przeliczane są tylko dla systemów planet, które
+    zmieniły właściciela lub stan kolonii (``galaxy.owner_changes``), a
+    przerysowywane są tylko znaczniki, których kolor się zmienił.
+    """
+
+    def __init__(self, galaxy):
+        self.galaxy = galaxy
+        self.system_count = len(galaxy.systems)
+        self.grid = SpatialGrid.for_points(
+            [(i, s["x"], s["y"]) for i, s in enumerate(galaxy.systems)]
+        )
+        self.lanes = galaxy_lanes(galaxy)
+
+        self.colors = [None] * self.system_count
+        self.color_version = None
+
+        self.surface = None
+        self.view_key = None
+        self.visible = ()
+
+    def matches(self, galaxy):
+        return self.galaxy is galaxy and self.system_count == len(galaxy.systems)
+
+    def refresh_colors(self):
+        """Przelicza kolory systemów; zwraca indeksy tych, które się zmieniły."""
+        galaxy = self.galaxy
+        if galaxy.owner_version == self.color_version:
+            return []
+
+        planets = galaxy.owner_changes_since(self.color_version)
+        self.color_version = galaxy.owner_version
+        if planets is None:
+            touched = range(self.system_count)
+        else:
+            touched = sorted({
+                galaxy.locate_planet(p)[0]["id"] for p in planets
+                if galaxy.locate_planet(p)[0] is not None
+            })
+
+        changed = []
+        for i in touched:
+            color = tuple(system_color(galaxy.systems[i]["system"]))
+            if color != self.colors[i]:
+                self.colors[i] = color
+                changed.append(i)
+        return changed
+
+    def draw(self, screen, camera, area):
+        changed = self.refresh_colors()
+        view_key = (camera.view_key(), tuple(area))
+
+        if view_key != self.view_key or self.surface is None:
+            self.view_key = view_key
+            self.render(screen, camera, area)
+        elif changed:
+            visible = self.visible
+            for i in changed:
+                if i in visible:
+                    self.draw_marker(i, camera)
+
+        screen.blit(self.surface, camera.offset)
+
+    def render(self, screen, camera, area):
+        size = (max(1, int(area[0])), max(1, int(area[1])))
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, 0, screen)
+        self.surface.fill(BACKGROUND)
+
+        margin = SYSTEM_RADIUS / camera.zoom
+        x0, y0, x1, y1 = camera.visible_world(area, margin)
+        systems = self.galaxy.systems
+
+        # 1️⃣ tory - tylko te, których prostokąt przecina widok
+        if camera.zoom >= LANE_MIN_ZOOM:
+            for i, j in self.lanes:
+                a = systems[i]
+                b = systems[j]
+                if max(a["x"], b["x"]) < x0 or min(a["x"], b["x"]) > x1:
+                    continue
+                if max(a["y"], b["y"]) < y0 or min(a["y"], b["y"]) > y1:
+                    continue
+                pygame.draw.line(
+                    self.surface,
+                    LINK_COLOR,
+                    self.to_layer(a, camera),
+                    self.to_layer(b, camera),
+                    1
+                )
+
+        # 2️⃣ systemy z indeksu przestrzennego
+        self.visible = frozenset(self.grid.query_rect(x0, y0, x1, y1))
+        for i in sorted(self.visible):
+            self.draw_marker(i, camera)
+
+    def to_layer(self, s, camera):
+        return (
+            int((s["x"] - camera.pan[0]) * camera.zoom),
+            int((s["y"] - camera.pan[1]) * camera.zoom),
+        )
+
+    def draw_marker(self, i, camera):
+        pos = self.to_layer(self.galaxy.systems[i], camera)
+        color = self.colors[i]
+
+        if camera.zoom < DOT_MAX_ZOOM:
+            self.surface.fill(color, (pos[0] - 1, pos[1] - 1, 2, 2))
+        else:
+            pygame.draw.circle(self.surface, color, pos, marker_radius(camera.zoom))
+
+
+_renderer = None
+
+
+def galaxy_renderer(galaxy):
+    global _renderer
+    if _renderer is None or not _renderer.matches(galaxy):
+        _renderer = GalaxyRenderer(galaxy)
+    return _renderer
+
+
+def draw_galaxy(screen, galaxy,offset,area, camera=None):
+    screen.fill(BACKGROUND)
 
+    if camera is None:
+        camera = GalaxyCamera(offset)
 
+    galaxy_renderer(galaxy).draw(screen, camera, area)
 
 
-def pick_system(galaxy, mouse_pos):
+
+
+def pick_system(galaxy, mouse_pos, camera=None):
     mx, my = mouse_pos
+    radius = SYSTEM_RADIUS
+
+    if camera is not None:
+        mx, my = camera.screen_to_world(mx, my)
+        radius = max(marker_radius(camera.zoom), 3) / camera.zoom
 
-    for s in galaxy.systems:
-        dx = s["x"] - mx
-        dy = s["y"] - my
-        if dx * dx + dy * dy < SYSTEM_RADIUS ** 2:
-            return s["system"]
+    # najbliższy system z siatki renderera (budowanej raz na układ galaktyki)
+    d2, hits = galaxy_renderer(galaxy).grid.closest(mx, my)
+    if not hits or d2 >= radius ** 2:
+        return None
 
-    return None
+    return galaxy.systems[hits[0]]["system"]
 
 def system_color(system):
     owners = set(p.owner for p in system.planets if p.colonized)
@@ -0,0 +1,72 @@
+# render/fonts.py
+"""
+Wspólny cache fontów i wyrenderowanych napisów.
+
+``pygame.font.SysFont`` szuka pliku fontu na dysku, więc wołanie go w
+każdej klatce (czy dla każdego hexa) kosztuje. ``get_font`` tworzy font
+raz na (nazwa, rozmiar, bold, italic), a ``render_text`` trzyma LRU
+gotowych powierzchni po (font, tekst, antialias, kolor, tło).
+
+Zwracane powierzchnie są współdzielone - nie należy ich modyfikować.
+"""
+from collections import OrderedDict
+
+import pygame
+
+TEXT_CACHE_SIZE = 2048
+
+_fonts = {}
+_text_cache = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def get_font(name=None, size=18, bold=False, italic=False):
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(name, size, bold, italic)
+        _fonts[key] = font
+    return font
+
+
+def _color_key(color):
+    if color is None:
+        return None
+    return tuple(color)
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Jak font.render(...), ale z cache (LRU) gotowych powierzchni."""
+    key = (font, str(text), antialias, _color_key(color), _color_key(background))
+    surface = _text_cache.get(key)
+
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        _stats["hits"] += 1
+        return surface
+
+    _stats["misses"] += 1
+    if background is None:
+        surface = font.render(key[1], antialias, color)
+    else:
+        surface = font.render(key[1], antialias, color, background)
+
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+
+def cache_info():
+    return {
+        "fonts": len(_fonts),
+        "texts": len(_text_cache),
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+    }
+
+
+def clear_text_cache():
+    _text_cache.clear()
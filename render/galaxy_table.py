@@ -1,3 +1,6 @@
+from render.fonts import render_text
+
+
 def draw_galaxy_table(screen, galaxy, font):
     clicks = []
 
@@ -10,7 +13,7 @@ def draw_galaxy_table(screen, galaxy, font):
         rect = (x, y, 360, row_h)
         clicks.append((system, rect))
 
-        screen.blit(font.render(system.star.type, True, (200,200,200)), (x, y))
+        screen.blit(render_text(font, system.star.type, True, (200,200,200)), (x, y))
         y += row_h
 
     return clicks
@@ -4,6 +4,7 @@ Kompletne UI dla systemu wojskowego
 """
 
 import pygame
+from render.fonts import get_font, render_text
 
 UNIT_ICONS = {
     "Infantry": "👤",
@@ -34,22 +35,22 @@ def draw_military_panel(screen, planet, font, x, y, width=500):
     pygame.draw.rect(screen, (100, 80, 80), (x, y, width, panel_height), 2)
     
     # Nagłówek
-    big_font = pygame.font.SysFont(None, 22)
-    title = big_font.render("MILITARY", True, (220, 180, 180))
+    big_font = get_font(None, 22)
+    title = render_text(big_font, "MILITARY", True, (220, 180, 180))
     screen.blit(title, (x + 10, y + 8))
     
     ty = y + 35
     
     # === GARNIZON ===
     screen.blit(
-        font.render("GARRISON:", True, (200, 180, 180)),
+        render_text(font, "GARRISON:", True, (200, 180, 180)),
         (x + 10, ty)
     )
     ty += 20
     
     if not manager.garrison:
         screen.blit(
-            font.render("No units", True, (150, 150, 150)),
+            render_text(font, "No units", True, (150, 150, 150)),
             (x + 20, ty)
         )
         ty += 20
@@ -59,7 +60,7 @@ def draw_military_panel(screen, planet, font, x, y, width=500):
             ty += 2
             
         if len(manager.garrison) > 5:
-            more = font.render(
+            more = render_text(font, 
                 f"... and {len(manager.garrison) - 5} more",
                 True, (150, 150, 150)
             )
@@ -69,14 +70,14 @@ def draw_military_panel(screen, planet, font, x, y, width=500):
     # Siła
     strength = manager.get_garrison_strength()
     screen.blit(
-        font.render(f"Total Strength: {strength:.0f}", True, (220, 200, 180)),
+        render_text(font, f"Total Strength: {strength:.0f}", True, (220, 200, 180)),
         (x + 10, ty)
     )
     ty += 30
     
     # === KOLEJKA PRODUKCJI ===
     screen.blit(
-        font.render("PRODUCTION QUEUE:", True, (200, 180, 180)),
+        render_text(font, "PRODUCTION QUEUE:", True, (200, 180, 180)),
         (x + 10, ty)
     )
     ty += 20
@@ -85,7 +86,7 @@ def draw_military_panel(screen, planet, font, x, y, width=500):
     
     if not queue:
         screen.blit(
-            font.render("Nothing in production", True, (150, 150, 150)),
+            render_text(font, "Nothing in production", True, (150, 150, 150)),
             (x + 20, ty)
         )
         ty += 20
@@ -103,7 +104,7 @@ def draw_military_panel(screen, planet, font, x, y, width=500):
     upkeep_text = f"Total Upkeep: {upkeep:.1f} cash/turn"
     upkeep_color = (220, 180, 180) if upkeep < 10 else (220, 120, 120)
     screen.blit(
-        font.render(upkeep_text, True, upkeep_color),
+        render_text(font, upkeep_text, True, upkeep_color),
         (x + 10, ty)
     )
     
@@ -123,7 +124,7 @@ def draw_unit_compact(screen, unit, font, x, y, width):
     # Ikona i nazwa
     icon = UNIT_ICONS.get(unit.name, "?")
     text = f"{icon} {unit.name}"
-    screen.blit(font.render(text, True, color), (x + 5, y + 4))
+    screen.blit(render_text(font, text, True, color), (x + 5, y + 4))
     
     # HP bar
     hp_x = x + 150
@@ -143,7 +144,7 @@ def draw_unit_compact(screen, unit, font, x, y, width):
     # Ranga
     rank = unit.get_rank()
     screen.blit(
-        font.render(rank, True, (180, 180, 200)),
+        render_text(font, rank, True, (180, 180, 200)),
         (hp_x + hp_w + 10, y + 4)
     )
     
@@ -165,7 +166,7 @@ def draw_production_item(screen, item, font, x, y, width, is_current):
     # Ikona i nazwa
     icon = UNIT_ICONS.get(unit_name, "?")
     text = f"{icon} {unit_name}"
-    screen.blit(font.render(text, True, color), (x + 5, y + 4))
+    screen.blit(render_text(font, text, True, color), (x + 5, y + 4))
     
     # Progress bar (tylko current)
     if is_current:
@@ -185,11 +186,11 @@ def draw_production_item(screen, item, font, x, y, width, is_current):
         # ETA
         remaining = item["time_total"] - item["progress"]
         eta = f"ETA: {int(remaining)} turns"
-        screen.blit(font.render(eta, True, (180, 180, 200)), (bar_x + bar_w - 80, y + 4))
+        screen.blit(render_text(font, eta, True, (180, 180, 200)), (bar_x + bar_w - 80, y + 4))
     else:
         time_text = f"{item['time_total']} turns"
         screen.blit(
-            font.render(time_text, True, (150, 150, 150)),
+            render_text(font, time_text, True, (150, 150, 150)),
             (x + width - 70, y + 10)
         )
     
@@ -214,8 +215,8 @@ def draw_military_production_menu(screen, planet, empire, font):
     pygame.draw.rect(screen, (120, 100, 100), (x, y, menu_w, menu_h), 2)
     
     # Tytuł
-    big_font = pygame.font.SysFont(None, 26)
-    title = big_font.render("RECRUIT UNITS", True, (255, 220, 220))
+    big_font = get_font(None, 26)
+    title = render_text(big_font, "RECRUIT UNITS", True, (255, 220, 220))
     screen.blit(title, (x + menu_w // 2 - title.get_width() // 2, y + 10))
     
     ty = y + 50
@@ -231,11 +232,11 @@ def draw_military_production_menu(screen, planet, empire, font):
         if military_level == 0:
             msg1 = "No Military sources on this planet!"
             msg2 = "Find planets with Toxic sources to recruit units."
-            screen.blit(font.render(msg1, True, (200, 150, 150)), (x + 50, ty))
+            screen.blit(render_text(font, msg1, True, (200, 150, 150)), (x + 50, ty))
             ty += 20
-            screen.blit(font.render(msg2, True, (180, 140, 140)), (x + 50, ty))
+            screen.blit(render_text(font, msg2, True, (180, 140, 140)), (x + 50, ty))
         else:
-            screen.blit(font.render("No units available", True, (200, 150, 150)), (x + 50, ty))
+            screen.blit(render_text(font, "No units available", True, (200, 150, 150)), (x + 50, ty))
         
         return []
     
@@ -259,7 +260,7 @@ def draw_military_production_menu(screen, planet, empire, font):
         # Numer i ikona
         num_icon = f"{i+1}. {UNIT_ICONS.get(unit.name, '?')} {unit.name}"
         screen.blit(
-            big_font.render(num_icon, True, (220, 200, 200)),
+            render_text(big_font, num_icon, True, (220, 200, 200)),
             (x + 30, py + 8)
         )
         
@@ -275,13 +276,13 @@ def draw_military_production_menu(screen, planet, empire, font):
         
         sx = x + 30
         for stat in stats:
-            screen.blit(font.render(stat, True, (180, 180, 200)), (sx, stats_y))
+            screen.blit(render_text(font, stat, True, (180, 180, 200)), (sx, stats_y))
             sx += 90
         
         # Koszt produkcji
         cost_y = py + 55
         screen.blit(
-            font.render("Cost:", True, (200, 180, 180)),
+            render_text(font, "Cost:", True, (200, 180, 180)),
             (x + 30, cost_y)
         )
         
@@ -291,13 +292,13 @@ def draw_military_production_menu(screen, planet, empire, font):
             cost_color = (120, 200, 120) if available_amount >= amount else (200, 120, 120)
             
             cost_text = f"{res}: {amount:.0f}"
-            screen.blit(font.render(cost_text, True, cost_color), (cx, cost_y))
+            screen.blit(render_text(font, cost_text, True, cost_color), (cx, cost_y))
             cx += 120
         
         # Czas produkcji
         time_text = f"Time: {unit.production_time} turns"
         screen.blit(
-            font.render(time_text, True, (180, 180, 200)),
+            render_text(font, time_text, True, (180, 180, 200)),
             (x + 30, cost_y + 18)
         )
         
@@ -315,7 +316,7 @@ def draw_military_production_menu(screen, planet, empire, font):
             status_color = (200, 120, 120)
         
         screen.blit(
-            font.render(status, True, status_color),
+            render_text(font, status, True, status_color),
             (x + menu_w - 200, py + 8)
         )
     
@@ -323,7 +324,7 @@ def draw_military_production_menu(screen, planet, empire, font):
     ty = y + menu_h - 35
     instructions = "Click unit to recruit | ESC to cancel"
     screen.blit(
-        font.render(instructions, True, (150, 150, 150)),
+        render_text(font, instructions, True, (150, 150, 150)),
         (x + 20, ty)
     )
     
@@ -349,15 +350,15 @@ def draw_garrison_detail_view(screen, planet, font):
     pygame.draw.rect(screen, (100, 80, 80), (x, y, panel_w, panel_h), 2)
     
     # Nagłówek
-    big_font = pygame.font.SysFont(None, 26)
-    title = big_font.render(f"GARRISON ({len(manager.garrison)} units)", True, (255, 220, 220))
+    big_font = get_font(None, 26)
+    title = render_text(big_font, f"GARRISON ({len(manager.garrison)} units)", True, (255, 220, 220))
     screen.blit(title, (x + 10, y + 10))
     
     ty = y + 50
     
     if not manager.garrison:
         screen.blit(
-            font.render("No units in garrison", True, (150, 150, 150)),
+            render_text(font, "No units in garrison", True, (150, 150, 150)),
             (x + 20, ty)
         )
         return
@@ -377,7 +378,7 @@ def draw_garrison_detail_view(screen, planet, font):
     upkeep = sum(u.stats.upkeep for u in manager.garrison)
     
     info = f"Total: {len(manager.garrison)} units | Strength: {strength:.0f} | Upkeep: {upkeep:.1f} energy/turn"
-    screen.blit(font.render(info, True, (200, 180, 180)), (x + 20, ty))
+    screen.blit(render_text(font, info, True, (200, 180, 180)), (x + 20, ty))
 
 
 def draw_unit_detailed(screen, unit, font, x, y, width):
@@ -393,7 +394,7 @@ def draw_unit_detailed(screen, unit, font, x, y, width):
     # Ikona i nazwa
     icon = UNIT_ICONS.get(unit.name, "?")
     text = f"{icon} {unit.name}"
-    screen.blit(font.render(text, True, color), (x + 10, y + 5))
+    screen.blit(render_text(font, text, True, color), (x + 10, y + 5))
     
     # Ranga
     rank = unit.get_rank()
@@ -405,7 +406,7 @@ def draw_unit_detailed(screen, unit, font, x, y, width):
     }.get(rank, (150, 150, 150))
     
     screen.blit(
-        font.render(f"[{rank}]", True, rank_color),
+        render_text(font, f"[{rank}]", True, rank_color),
         (x + 10, y + 22)
     )
     
@@ -419,7 +420,7 @@ def draw_unit_detailed(screen, unit, font, x, y, width):
     
     sy = y + 5
     for stat in stats:
-        screen.blit(font.render(stat, True, (180, 180, 200)), (stats_x, sy))
+        screen.blit(render_text(font, stat, True, (180, 180, 200)), (stats_x, sy))
         sy += 16
     
     # HP bar
@@ -438,7 +439,7 @@ def draw_unit_detailed(screen, unit, font, x, y, width):
     pygame.draw.rect(screen, (100, 100, 110), (hp_x, hp_y, hp_w, hp_h), 1)
     
     hp_text = f"{unit.current_health:.0f}/{unit.stats.health:.0f}"
-    screen.blit(font.render(hp_text, True, (220, 220, 220)), (hp_x + 5, hp_y + 1))
+    screen.blit(render_text(font, hp_text, True, (220, 220, 220)), (hp_x + 5, hp_y + 1))
     
     # XP bar
     xp_y = hp_y + 18
@@ -449,11 +450,11 @@ def draw_unit_detailed(screen, unit, font, x, y, width):
     pygame.draw.rect(screen, (100, 100, 110), (hp_x, xp_y, hp_w, 10), 1)
     
     xp_text = f"XP: {unit.experience:.0f}/100"
-    screen.blit(font.render(xp_text, True, (180, 200, 220)), (hp_x + 5, xp_y))
+    screen.blit(render_text(font, xp_text, True, (180, 200, 220)), (hp_x + 5, xp_y))
     
     # Combat power
     power = unit.combat_power()
     power_text = f"Power: {power:.0f}"
-    screen.blit(font.render(power_text, True, (220, 180, 120)), (hp_x, y + 42))
+    screen.blit(render_text(font, power_text, True, (220, 180, 120)), (hp_x, y + 42))
     
     return y + item_height
\ No newline at end of file
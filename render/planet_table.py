@@ -1,4 +1,5 @@
 import pygame
+from render.fonts import render_text
 
 RES_KEYS = ["thermal", "cryo", "solids", "fluidics", "biomass", "compounds"]
 def draw_planet_hex_table(screen, planet, font, mouse_pos, scroll_y, sort_key):
@@ -24,7 +25,7 @@ def draw_planet_hex_table(screen, planet, font, mouse_pos, scroll_y, sort_key):
 
     cx = x
     for name, key in headers:
-        img = font.render(name, True, (220,220,240))
+        img = render_text(font, name, True, (220,220,240))
         screen.blit(img, (cx, y0))
         if key:
             header_clicks.append((key, pygame.Rect(cx, y0, 50, row_h)))
@@ -53,7 +54,7 @@ def draw_planet_hex_table(screen, planet, font, mouse_pos, scroll_y, sort_key):
 
 
         line = f"({h.q},{h.r})"
-        screen.blit(font.render(line, True, (200,200,200)), (x, ry))
+        screen.blit(render_text(font, line, True, (200,200,200)), (x, ry))
 
         vals = [
             f"{h.temperature:+.2f}",
@@ -68,7 +69,7 @@ def draw_planet_hex_table(screen, planet, font, mouse_pos, scroll_y, sort_key):
 
         cx = x + 50
         for v in vals:
-            screen.blit(font.render(v, True, (200,200,200)), (cx, ry))
+            screen.blit(render_text(font, v, True, (200,200,200)), (cx, ry))
             cx += 50
 
         # === BUILD BUTTON ===
@@ -78,7 +79,7 @@ def draw_planet_hex_table(screen, planet, font, mouse_pos, scroll_y, sort_key):
 
         color = (140,180,240) if hovered else (100,140,200)
         pygame.draw.rect(screen, color, (bx, by, bw, bh))
-        screen.blit(font.render("BUILD", True, (20,20,30)), (bx+6, by+1))
+        screen.blit(render_text(font, "BUILD", True, (20,20,30)), (bx+6, by+1))
 
         build_buttons.append((h, (bx, by, bw, bh)))
         y += row_h
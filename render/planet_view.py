@@ -1,5 +1,7 @@
 # render/planet_view.py
 import pygame
+from render.fonts import get_font, render_text
+from collections import OrderedDict
 import math
 
 HEX_SIZE = 18
@@ -30,6 +32,17 @@ RESOURCE_COLORS = {
 
 
 NEGATIVE_ICON_COLOR = (80, 120, 200)
+BACKGROUND_COLOR = (5, 5, 10)
+SELECTED_BORDER = (255, 255, 255)
+
+# Rogi heksu względem środka - liczone raz, nie dla każdego hexa w każdej klatce
+HEX_CORNERS = tuple(
+    (HEX_SIZE * math.cos(math.pi / 3 * i), HEX_SIZE * math.sin(math.pi / 3 * i))
+    for i in range(6)
+)
+
+# Ile planet trzyma gotową warstwę (każda to powierzchnia wielkości ekranu)
+PLANET_LAYER_CACHE = 4
 
 def hex_to_pixel(q, r, center):
     x = HEX_SIZE * (3/2 * q)
@@ -80,65 +93,179 @@ def clamp(x, a=0, b=255):
     return max(a, min(b, int(x)))
 
 
-def draw_hex(screen, pos, color,planet ,selected=False ):
+def hex_points(pos):
     x, y = pos
-    points = []
+    return [(x + dx, y + dy) for dx, dy in HEX_CORNERS]
 
-    for i in range(6):
-        angle = math.pi / 3 * i
-        px = x + HEX_SIZE * math.cos(angle)
-        py = y + HEX_SIZE * math.sin(angle)
-        points.append((px, py))
-
-    pygame.draw.polygon(screen, color, points)
 
+def planet_border_color(planet):
     if planet.colonization_state == "colonizing":
-        border_color = (240, 220, 120)
-    elif planet.owner:
-        border_color = planet.owner.color
-    else:
-        border_color = (80, 80, 80)
+        return (240, 220, 120)
+    if planet.owner:
+        return tuple(planet.owner.color)
+    return (80, 80, 80)
+
+
+def overlay_color(hex, planet, overlay_mode):
+    if overlay_mode == 4:
+        return production_hex_color(hex, planet)
+    if overlay_mode == 5:
+        return population_hex_color(hex, planet)
+    return hex_color(hex, overlay_mode)
+
 
+def draw_hex(screen, pos, color,planet ,selected=False, points=None):
+    if points is None:
+        points = hex_points(pos)
 
-    border = (255, 255, 255) if selected  else  border_color
+    pygame.draw.polygon(screen, color, points)
+
+    border = SELECTED_BORDER if selected else planet_border_color(planet)
     
     width = 3 if selected else 1
     pygame.draw.polygon(screen, border, points, width)
 
 
+class PlanetLayer:
+    """
+    Statyczna warstwa widoku planety (retained mode).
+
+    Geometria heksów liczona jest raz na (planeta, środek, rozmiar ekranu),
+    a heksy rysowane są na powierzchni poza ekranem. W każdej klatce
+    ``update`` porównuje tani klucz stanu (overlay, wersje mapy, ramka,
+    populacja dla overlayów 4/5) i dopiero gdy się zmieni, przelicza klucze
+    heksów i przerysowuje tylko te, które się różnią.
+    Zaznaczenie rysowane jest na ekranie, poza warstwą.
+    """
+
+    def __init__(self, screen, planet, center):
+        self.planet = planet
+        self.hex_map = planet.hex_map
+        self.center = center
+        self.size = screen.get_size()
+        self.surface = pygame.Surface(self.size, 0, screen)
+        self.surface.fill(BACKGROUND_COLOR)
+
+        hm = self.hex_map
+        self.positions = [hex_to_pixel(q, r, center) for q, r in zip(hm.q, hm.r)]
+        self.points = [hex_points(pos) for pos in self.positions]
+        self.keys = [None] * len(self.positions)
+        self.state = None
+        self.redrawn = 0
+
+    def matches(self, screen, planet, center):
+        return (
+            self.planet is planet
+            and self.hex_map is planet.hex_map
+            and self.center == center
+            and self.size == screen.get_size()
+        )
+
+    def state_key(self, overlay_mode):
+        planet = self.planet
+        hm = self.hex_map
+        key = (
+            overlay_mode,
+            hm.version,
+            hm.buildings_version,
+            planet_border_color(planet),
+            len(planet.sources),
+        )
+        if overlay_mode in (4, 5):
+            population = planet.population
+            key += (population.size, tuple(population.stats.items()))
+        return key
+
+    def update(self, overlay_mode):
+        """Przerysowuje zmienione heksy; zwraca ich liczbę."""
+        state = self.state_key(overlay_mode)
+        if state == self.state:
+            return 0
+        self.state = state
+
+        planet = self.planet
+        border = state[3]
+
+        icons = {}
+        for src in planet.sources:
+            icons.setdefault((src.q, src.r), []).append(src.icon)
+
+        redrawn = 0
+        for i, hex in enumerate(self.hex_map.hexes):
+            key = (
+                overlay_color(hex, planet, overlay_mode),
+                border,
+                tuple(icons.get((hex.q, hex.r), ())),
+                hex.building_major,
+                tuple(hex.buildings_small),
+            )
+            if key == self.keys[i]:
+                continue
+
+            self.keys[i] = key
+            pos = self.positions[i]
+            draw_hex(self.surface, pos, key[0], planet, False, self.points[i])
+            draw_source_icons(self.surface, planet, hex, pos)
+            draw_hex_buildings(self.surface, hex, pos)
+            redrawn += 1
+
+        self.redrawn += redrawn
+        return redrawn
+
+
+_layers = OrderedDict()
+
+
+def planet_layer(screen, planet, center):
+    """Warstwa planety z małego LRU (tworzona od nowa po zmianie geometrii)."""
+    key = id(planet)
+    layer = _layers.get(key)
+    if layer is not None and layer.matches(screen, planet, center):
+        _layers.move_to_end(key)
+        return layer
+
+    layer = PlanetLayer(screen, planet, center)
+    _layers[key] = layer
+    _layers.move_to_end(key)
+    while len(_layers) > PLANET_LAYER_CACHE:
+        _layers.popitem(last=False)
+    return layer
+
+
+def clear_planet_layers():
+    _layers.clear()
+
+
 def draw_planet(screen, planet, center, selected_hex, overlay_mode):
-    screen.fill((5, 5, 10))
-
-    for hex in planet.hex_map.hexes:
-        pos = hex_to_pixel(hex.q, hex.r, center)
-        if overlay_mode == 4:
-            color = production_hex_color(hex, planet)
-        elif overlay_mode == 5:
-            color = population_hex_color(hex, planet)
-        else:
-            color = hex_color(hex, overlay_mode)
-
-        draw_hex(screen, pos, color,planet, hex is selected_hex)
-        draw_source_icons(screen, planet, hex, pos)
-        draw_hex_buildings(screen, hex, pos)
+    layer = planet_layer(screen, planet, center)
+    layer.update(overlay_mode)
+    screen.blit(layer.surface, (0, 0))
+
+    if selected_hex is not None and selected_hex.map is layer.hex_map:
+        pygame.draw.polygon(
+            screen, SELECTED_BORDER, layer.points[selected_hex.index], 3
+        )
+
     draw_population_panel(screen, planet)
 
 
             
 
 
-def pick_hex(planet, mouse_pos, center):
-    mx, my = mouse_pos
+def pixel_to_axial(pos, center):
+    """Odwrotność hex_to_pixel: piksel -> ułamkowe (q, r)."""
+    q = (pos[0] - center[0]) / (HEX_SIZE * 3 / 2)
+    r = (pos[1] - center[1]) / (HEX_SIZE * math.sqrt(3)) - q / 2
+    return q, r
 
-    for hex in planet.hex_map.hexes:
-        hx, hy = hex_to_pixel(hex.q, hex.r, center)
-        dx = mx - hx
-        dy = my - hy
 
-        if dx * dx + dy * dy < HEX_SIZE * HEX_SIZE:
-            return hex
-
-    return None
+def pick_hex(planet, mouse_pos, center):
+    # O(1): piksel -> współrzędne osiowe -> indeks z układu planety
+    hex_map = planet.hex_map
+    index = hex_map.layout.locate(*pixel_to_axial(mouse_pos, center))
+    if index is None:
+        return None
+    return hex_map.hex(index)
 
 
 def draw_source_icons(screen, planet, hex, pos):
@@ -146,7 +273,7 @@ def draw_source_icons(screen, planet, hex, pos):
     if not sources:
         return
 
-    font = pygame.font.SysFont(None, 18)
+    font = get_font(None, 18)
 
     # przesunięcia, żeby ikony się nie nakładały
     offsets = [(-6, -6), (6, -6), (0, 6)]
@@ -156,7 +283,7 @@ def draw_source_icons(screen, planet, hex, pos):
             src.icon, ("?", (200, 200, 200))
         )
 
-        img = font.render(symbol, True, color)
+        img = render_text(font, symbol, True, color)
         dx, dy = offsets[i % len(offsets)]
         rect = img.get_rect(center=(pos[0] + dx, pos[1] + dy))
         screen.blit(img, rect)
@@ -167,7 +294,7 @@ def building_symbol(building):
         (building.name[0].upper(), (220, 220, 220))
     )
 def draw_hex_buildings(screen, hex, pos):
-    font = pygame.font.SysFont(None, 14)
+    font = get_font(None, 14)
     x, y = pos
 
     offset_y = -10
@@ -175,22 +302,22 @@ def draw_hex_buildings(screen, hex, pos):
     # major building (jeśli kiedyś dodasz)
     if getattr(hex, "building_major", None):
         symbol, color = building_symbol(hex.building_major)
-        img = font.render(symbol, True, color)
+        img = render_text(font, symbol, True, color)
         screen.blit(img, (x - 6, y + offset_y))
         offset_y += 12
 
     # small buildings
     for b in hex.buildings_small:
         symbol, color = building_symbol(b)
-        img = font.render(symbol, True, color)
+        img = render_text(font, symbol, True, color)
         screen.blit(img, (x - 6, y + offset_y))
         offset_y += 10
 
 
 
 def draw_population_panel(screen, planet):
-    font = pygame.font.SysFont(None, 18)
-    big = pygame.font.SysFont(None, 22)
+    font = get_font(None, 18)
+    big = get_font(None, 22)
 
     x = screen.get_width() - 220
     y = 20
@@ -198,11 +325,11 @@ def draw_population_panel(screen, planet):
     pygame.draw.rect(screen, (20, 20, 40), (x - 10, y - 10, 210, 220))
     pygame.draw.rect(screen, (80, 80, 120), (x - 10, y - 10, 210, 220), 1)
 
-    screen.blit(big.render("Population", True, (255, 255, 255)), (x, y))
+    screen.blit(render_text(big, "Population", True, (255, 255, 255)), (x, y))
     y += 26
 
     screen.blit(
-        font.render(f"Size: {planet.population.size:.2f}", True, (220, 220, 220)),
+        render_text(font, f"Size: {planet.population.size:.2f}", True, (220, 220, 220)),
         (x, y)
     )
     y += 20
@@ -211,22 +338,22 @@ def draw_population_panel(screen, planet):
         bar_len = int(val * 8)
         bar = "." * bar_len
         txt = f"{stat[:6].upper():6} {bar}"
-        screen.blit(font.render(txt, True, (200, 200, 200)), (x, y))
+        screen.blit(render_text(font, txt, True, (200, 200, 200)), (x, y))
         y += 16
         
         
     free = planet.population.free
     used = planet.population.used
 
-    screen.blit(font.render(
+    screen.blit(render_text(font, 
         f"POP: {planet.population.size:.2f} (free {free:.2f} / work {used:.2f})",
         True, (220,220,220)
     ), (x, y))
 
 
 def draw_build_menu(screen, planet, hex, items):
-    font = pygame.font.SysFont(None, 20)
-    big = pygame.font.SysFont(None, 26)
+    font = get_font(None, 20)
+    big = get_font(None, 26)
 
     w, h = screen.get_size()
     x = w // 2 - 160
@@ -236,16 +363,16 @@ def draw_build_menu(screen, planet, hex, items):
     pygame.draw.rect(screen, (15, 15, 30), (x, y, 320, 360))
     pygame.draw.rect(screen, (120, 120, 180), (x, y, 320, 360), 2)
 
-    screen.blit(big.render("BUILD", True, (255, 255, 255)), (x + 110, y + 10))
+    screen.blit(render_text(big, "BUILD", True, (255, 255, 255)), (x + 110, y + 10))
     y += 50
 
     if not items:
-        screen.blit(font.render("No buildings available", True, (180, 80, 80)), (x + 60, y))
+        screen.blit(render_text(font, "No buildings available", True, (180, 80, 80)), (x + 60, y))
         return
 
     for i, b in enumerate(items):
         txt = f"{i+1}. {b.name}"
-        screen.blit(font.render(txt, True, (220, 220, 220)), (x + 20, y))
+        screen.blit(render_text(font, txt, True, (220, 220, 220)), (x + 20, y))
         y += 28
 
         # koszt
@@ -253,7 +380,7 @@ def draw_build_menu(screen, planet, hex, items):
         for res, val in b.cost.items():
             c = (180, 180, 180) if planet.storage.get(res, 0) >= val else (200, 80, 80)
             screen.blit(
-                font.render(f"   {res}: {val}", True, c),
+                render_text(font, f"   {res}: {val}", True, c),
                 (x + 40, cost_y)
             )
             cost_y += 18
@@ -349,7 +476,7 @@ def draw_hex_panel(screen, hex, planet, font, mouse_pos):
 
     ty = y + 10
     for l in lines:
-        screen.blit(font.render(l, True, (220, 220, 220)), (x + 10, ty))
+        screen.blit(render_text(font, l, True, (220, 220, 220)), (x + 10, ty))
         ty += 18
 
     # === BUILD BUTTON ===
@@ -365,7 +492,7 @@ def draw_hex_panel(screen, hex, planet, font, mouse_pos):
     pygame.draw.rect(screen, color, (btn_x, btn_y, btn_w, btn_h))
     pygame.draw.rect(screen, (200, 200, 220), (btn_x, btn_y, btn_w, btn_h), 1)
 
-    txt = font.render("BUILD", True, (20, 20, 30))
+    txt = render_text(font, "BUILD", True, (20, 20, 30))
     screen.blit(
         txt,
         (btn_x + btn_w // 2 - txt.get_width() // 2,
@@ -1,3 +1,6 @@
+from render.fonts import render_text
+
+
 def draw_system_table(screen, system, font, sort_key="pop"):
     x, y = 20, 20
     row_h = 22
@@ -13,7 +16,7 @@ def draw_system_table(screen, system, font, sort_key="pop"):
         planets.sort(key=lambda p: sum(p.storage.values()) if p.colonized else 0, reverse=True)
 
     header = "PL | POP | EN | TH SO BI FL CR EX"
-    screen.blit(font.render(header, True, (220,220,240)), (x, y))
+    screen.blit(render_text(font, header, True, (220,220,240)), (x, y))
     y += row_h
 
     for i, p in enumerate(planets):
@@ -37,7 +40,7 @@ def draw_system_table(screen, system, font, sort_key="pop"):
         if p.colonized and p.owner:
             color = p.owner.color
         
-        screen.blit(font.render(line, True, color), (x, y))
+        screen.blit(render_text(font, line, True, color), (x, y))
         
         # kliknięcie na planetę
         rect = (x, y, 400, row_h)
@@ -4,6 +4,7 @@ UI dla systemu transportu
 """
 
 import pygame
+from render.fonts import get_font, render_text
 
 def draw_transport_panel(screen, empire, galaxy, font, mouse_pos):
     """
@@ -23,9 +24,9 @@ def draw_transport_panel(screen, empire, galaxy, font, mouse_pos):
     pygame.draw.rect(screen, (60, 80, 100), (x, y, w, h), 2)
     
     # Nagłówek
-    big_font = pygame.font.SysFont(None, 22)
+    big_font = get_font(None, 22)
     screen.blit(
-        big_font.render("TRANSPORTS", True, (200, 220, 240)),
+        render_text(big_font, "TRANSPORTS", True, (200, 220, 240)),
         (x + 10, y + 8)
     )
     
@@ -36,7 +37,7 @@ def draw_transport_panel(screen, empire, galaxy, font, mouse_pos):
     
     if not manager.transports:
         screen.blit(
-            font.render("No active transports", True, (150, 150, 150)),
+            render_text(font, "No active transports", True, (150, 150, 150)),
             (x + 10, ty)
         )
         ty += 20
@@ -51,29 +52,37 @@ def draw_transport_panel(screen, empire, galaxy, font, mouse_pos):
     # Historia (ostatnie dostawy)
     ty += 10
     screen.blit(
-        font.render("RECENT DELIVERIES:", True, (180, 180, 200)),
+        render_text(font, "RECENT DELIVERIES:", True, (180, 180, 200)),
         (x + 10, ty)
     )
     ty += 20
     
-    for entry in manager.history[-5:]:  # ostatnie 5
+    for entry in list(manager.history)[-5:]:  # ostatnie 5
         source_sys, source_orbit = entry["source"].get_location(galaxy)
         target_sys, target_orbit = entry["target"].get_location(galaxy)
         
-        if entry["type"] == "resources":
-            cargo_str = ", ".join(f"{k}:{v:.0f}" for k, v in entry["cargo"].items())
-        else:
-            cargo_str = f"Pop: {entry['cargo']:.1f}"
+        cargo_str = format_cargo(entry["type"], entry["cargo"], "Pop")
             
         line = f"S{source_orbit}→S{target_orbit}: {cargo_str}"
         color = (100, 200, 100) if entry["status"] == "delivered" else (200, 100, 100)
         
-        screen.blit(font.render(line, True, color), (x + 10, ty))
+        screen.blit(render_text(font, line, True, color), (x + 10, ty))
         ty += 16
         
     return []
 
 
+def format_cargo(transport_type, cargo, pop_label="Population"):
+    """Opis ładunku: zasoby, populacja albo oba (konwój mieszany)"""
+    if transport_type == "population":
+        return f"{pop_label}: {cargo:.1f}"
+
+    parts = [f"{k}:{v:.0f}" for k, v in cargo.items() if k != "population"]
+    if transport_type == "mixed":
+        parts.append(f"{pop_label}: {cargo['population']:.1f}")
+    return ", ".join(parts)
+
+
 def draw_transport_item(screen, transport, galaxy, font, x, y, width):
     """Rysuje pojedynczy transport w trakcie podróży"""
     
@@ -88,17 +97,15 @@ def draw_transport_item(screen, transport, galaxy, font, x, y, width):
     route = f"System {source_sys.star.type if source_sys else '??'} Orbit {source_orbit}"
     route += f" → System {target_sys.star.type if target_sys else '??'} Orbit {target_orbit}"
     
-    screen.blit(font.render(route, True, (200, 200, 220)), (x + 5, y + 5))
+    screen.blit(render_text(font, route, True, (200, 200, 220)), (x + 5, y + 5))
     
     # Cargo
-    if transport.transport_type == "resources":
-        cargo_text = "Resources: " + ", ".join(
-            f"{k}:{v:.0f}" for k, v in transport.cargo.items()
-        )
+    if transport.transport_type == "population":
+        cargo_text = format_cargo("population", transport.cargo)
     else:
-        cargo_text = f"Population: {transport.cargo:.1f}"
+        cargo_text = "Resources: " + format_cargo(transport.transport_type, transport.cargo)
         
-    screen.blit(font.render(cargo_text, True, (180, 200, 220)), (x + 5, y + 23))
+    screen.blit(render_text(font, cargo_text, True, (180, 200, 220)), (x + 5, y + 23))
     
     # Progress bar
     progress = transport.progress()
@@ -115,7 +122,7 @@ def draw_transport_item(screen, transport, galaxy, font, x, y, width):
     
     # ETA
     eta_text = f"ETA: {transport.time_remaining} turns"
-    screen.blit(font.render(eta_text, True, (150, 150, 170)), (bar_x + bar_w - 100, y + 60))
+    screen.blit(render_text(font, eta_text, True, (150, 150, 170)), (bar_x + bar_w - 100, y + 60))
     
     return y + 75
 
@@ -136,8 +143,8 @@ def draw_transport_creation_menu(screen, source_planet, empire, galaxy, font):
     pygame.draw.rect(screen, (120, 140, 180), (x, y, menu_w, menu_h), 2)
     
     # Tytuł
-    big_font = pygame.font.SysFont(None, 26)
-    title = big_font.render("CREATE TRANSPORT", True, (255, 255, 255))
+    big_font = get_font(None, 26)
+    title = render_text(big_font, "CREATE TRANSPORT", True, (255, 255, 255))
     screen.blit(title, (x + menu_w // 2 - title.get_width() // 2, y + 10))
     
     ty = y + 50
@@ -145,12 +152,12 @@ def draw_transport_creation_menu(screen, source_planet, empire, galaxy, font):
     # Source info
     source_sys, source_orbit = source_planet.get_location(galaxy)
     source_info = f"FROM: System {source_sys.star.type if source_sys else '??'}, Orbit {source_orbit}"
-    screen.blit(font.render(source_info, True, (200, 200, 220)), (x + 20, ty))
+    screen.blit(render_text(font, source_info, True, (200, 200, 220)), (x + 20, ty))
     ty += 30
     
     # Lista dostępnych planet docelowych
     screen.blit(
-        font.render("SELECT TARGET PLANET:", True, (180, 200, 220)),
+        render_text(font, "SELECT TARGET PLANET:", True, (180, 200, 220)),
         (x + 20, ty)
     )
     ty += 25
@@ -175,8 +182,8 @@ def draw_transport_creation_menu(screen, source_planet, empire, galaxy, font):
         location = f"{i+1}. System {target_sys.star.type if target_sys else '??'}, Orbit {target_orbit}"
         pop = f"Pop: {planet.population.size:.1f}"
         
-        screen.blit(font.render(location, True, (200, 200, 200)), (x + 35, py + 2))
-        screen.blit(font.render(pop, True, (150, 150, 150)), (x + 400, py + 2))
+        screen.blit(render_text(font, location, True, (200, 200, 200)), (x + 35, py + 2))
+        screen.blit(render_text(font, pop, True, (150, 150, 150)), (x + 400, py + 2))
         
         clickable_planets.append((planet, rect))
         
@@ -190,7 +197,7 @@ def draw_transport_creation_menu(screen, source_planet, empire, galaxy, font):
     
     for line in instructions:
         screen.blit(
-            font.render(line, True, (120, 120, 140)),
+            render_text(font, line, True, (120, 120, 140)),
             (x + 20, ty)
         )
         ty += 18
@@ -213,8 +220,8 @@ def draw_cargo_selection_menu(screen, source_planet, target_planet, galaxy, font
     pygame.draw.rect(screen, (120, 140, 180), (x, y, menu_w, menu_h), 2)
     
     # Tytuł
-    big_font = pygame.font.SysFont(None, 26)
-    title = big_font.render("SELECT CARGO", True, (255, 255, 255))
+    big_font = get_font(None, 26)
+    title = render_text(big_font, "SELECT CARGO", True, (255, 255, 255))
     screen.blit(title, (x + menu_w // 2 - title.get_width() // 2, y + 10))
     
     ty = y + 50
@@ -224,12 +231,12 @@ def draw_cargo_selection_menu(screen, source_planet, target_planet, galaxy, font
     target_sys, target_orbit = target_planet.get_location(galaxy)
     
     route = f"FROM: Orbit {source_orbit} → TO: Orbit {target_orbit}"
-    screen.blit(font.render(route, True, (200, 200, 220)), (x + 20, ty))
+    screen.blit(render_text(font, route, True, (200, 200, 220)), (x + 20, ty))
     ty += 30
     
     # Dostępne zasoby
     screen.blit(
-        font.render("AVAILABLE RESOURCES:", True, (180, 200, 220)),
+        render_text(font, "AVAILABLE RESOURCES:", True, (180, 200, 220)),
         (x + 20, ty)
     )
     ty += 25
@@ -250,7 +257,7 @@ def draw_cargo_selection_menu(screen, source_planet, target_planet, galaxy, font
         line = f"{i+1}. {res.upper()}: {available:.0f} available"
         color = (200, 200, 200) if available > 10 else (150, 150, 150)
         
-        screen.blit(font.render(line, True, color), (x + 35, py + 2))
+        screen.blit(render_text(font, line, True, color), (x + 35, py + 2))
         
         if available >= 10:
             clickable_resources.append((res, rect))
@@ -266,7 +273,7 @@ def draw_cargo_selection_menu(screen, source_planet, target_planet, galaxy, font
         
     pop_line = f"P. POPULATION: {pop_available:.1f} available"
     pop_color = (200, 220, 200) if pop_available > 2.0 else (150, 150, 150)
-    screen.blit(font.render(pop_line, True, pop_color), (x + 35, ty + 2))
+    screen.blit(render_text(font, pop_line, True, pop_color), (x + 35, ty + 2))
     
     if pop_available >= 2.0:
         clickable_resources.append(("population", pop_rect))
@@ -282,7 +289,7 @@ def draw_cargo_selection_menu(screen, source_planet, target_planet, galaxy, font
     
     for line in instructions:
         screen.blit(
-            font.render(line, True, (120, 120, 140)),
+            render_text(font, line, True, (120, 120, 140)),
             (x + 20, ty)
         )
         ty += 18
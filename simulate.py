@@ -0,0 +1,241 @@
+# simulate.py - headless symulacja AI vs AI (bez pygame)
+"""
+Uruchomienie:
+    python simulate.py --systems 40 --empires 2 --turns 100
+    python simulate.py --systems 500 --empires 4 --turns 50 --json
+    python simulate.py --systems 2000 --turns 10 --workers 4
+    python simulate.py --systems 1000 --turns 50 --save g1000.sav
+    python simulate.py --load g1000.sav --turns 20
+    python simulate.py --systems 200 --turns 500 --record g200.replay
+    python simulate.py --replay g200.replay --seek 480 --turns 20
+    python simulate.py --systems 40 --turns 20 --log info,ai=debug
+
+Buduje galaktykę z N systemami i M imperiami AI, wykonuje K tur
+Galaxy.tick z wyciszonym logowaniem i printami, a na koniec raportuje
+tury/s, czasy faz tury (core/profiler.py) i szczytowe zużycie pamięci.
+Statystyki faz można zapisać do --profile-json / --profile-csv.
+--record zapisuje dziennik tur z klatkami kluczowymi (core/replay.py),
+a --replay/--seek zaczyna od dowolnej nagranej tury. --log włącza
+kanały zdarzeń gry (core/telemetry.py) na stderr.
+"""
+import argparse
+import contextlib
+import json
+import logging
+import math
+import os
+import random
+import sys
+import time
+
+from core.init import init_start_planet
+from core import profiler as tick_profiler
+from core import rng
+from core import replay
+from core import savegame
+from core import telemetry
+from empire.empire import Empire
+from galaxy.galaxy import Galaxy
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+EMPIRE_COLORS = [
+    (80, 200, 120),
+    (200, 70, 180),
+    (80, 140, 220),
+    (220, 180, 60),
+    (220, 90, 70),
+    (120, 220, 220),
+]
+
+
+def peak_memory_mb():
+    """Szczytowy RSS procesu w MB (None gdy niedostępny)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bajty
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextlib.contextmanager
+def silenced(enabled=True):
+    """Wycisza logging i stdout gry."""
+    if not enabled:
+        yield
+        return
+
+    previous = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        logging.disable(previous)
+
+
+def setup_galaxy(systems, empires, size=None, workers=None):
+    if size is None:
+        size = max(900, int(150 * math.sqrt(systems)))
+
+    galaxy = Galaxy(system_count=systems, size=size, workers=workers)
+
+    # imperia startują w systemach rozłożonych równo po liście
+    step = max(1, len(galaxy.systems) // max(1, empires))
+    for i in range(empires):
+        empire = Empire(f"AI {i + 1}", EMPIRE_COLORS[i % len(EMPIRE_COLORS)], galaxy)
+        galaxy.empires.append(empire)
+        init_start_planet(empire, galaxy.systems[(i * step) % len(galaxy.systems)])
+
+    return galaxy
+
+
+def simulate(systems=40, empires=2, turns=100, size=None, seed=None, quiet=True, workers=None,
+             load=None, save=None, record=None, keyframe_interval=replay.DEFAULT_KEYFRAME_INTERVAL,
+             replay_from=None, seek=None):
+    """Wykonuje symulację i zwraca (słownik z wynikami, ProfileStats)."""
+    if seed is not None:
+        random.seed(seed)
+        rng.set_seed(seed)
+
+    with silenced(quiet):
+        start = time.perf_counter()
+        if replay_from:
+            log = replay.ReplayLog.load(replay_from)
+            galaxy = log.seek(log.turn if seek is None else seek)
+        elif load:
+            galaxy = savegame.load_galaxy(load)
+        else:
+            galaxy = setup_galaxy(systems, empires, size, workers)
+        setup_time = time.perf_counter() - start
+
+        recorder = replay.ReplayLog(galaxy, keyframe_interval) if record else None
+        previous_recorder = replay.install(recorder)
+        profiler = tick_profiler.TickProfiler()
+        previous = tick_profiler.install(profiler)
+        try:
+            start = time.perf_counter()
+            for _ in range(turns):
+                galaxy.tick()
+            run_time = time.perf_counter() - start
+        finally:
+            tick_profiler.install(previous)
+            replay.install(previous_recorder)
+
+        if save:
+            savegame.save_galaxy(galaxy, save)
+        if record:
+            recorder.save(record)
+
+    stats = profiler.stats()
+
+    return {
+        "systems": len(galaxy.systems),
+        "planets": len(galaxy.planet_locations),
+        "empires": len(galaxy.empires),
+        "turns": turns,
+        "setup_s": setup_time,
+        "run_s": run_time,
+        "turns_per_s": turns / run_time if run_time > 0 else float("inf"),
+        "profile": stats.to_dict(),
+        "peak_memory_mb": peak_memory_mb(),
+        "empire_summary": [
+            {
+                "name": e.name,
+                "planets": len(e.planets),
+                "population": sum(p.population.size for p in e.planets),
+                "cash": e.cash,
+            }
+            for e in galaxy.empires
+        ],
+    }, stats
+
+
+def print_report(result):
+    print(f"systems={result['systems']} planets={result['planets']} "
+          f"empires={result['empires']} turns={result['turns']}")
+    print(f"setup: {result['setup_s']:.2f} s")
+    print(f"run:   {result['run_s']:.2f} s  ({result['turns_per_s']:.2f} turns/s)")
+
+    print(f"\n{'phase':<36} | {'calls':>7} | {'total [s]':>9} | {'per turn [ms]':>13} | {'share':>6}")
+    print("-" * 84)
+    run = result["run_s"] or 1.0
+    turns = result["turns"] or 1
+    for phase in result["profile"]["phases"]:
+        depth = phase["path"].count("/")
+        label = "  " * depth + phase["path"].rsplit("/", 1)[-1]
+        print(f"{label:<36} | {phase['calls']:7d} | {phase['total_s']:9.3f} | "
+              f"{phase['total_s'] / turns * 1000:13.2f} | {phase['total_s'] / run:6.1%}")
+
+    if result["peak_memory_mb"] is not None:
+        print(f"\npeak memory: {result['peak_memory_mb']:.1f} MB")
+
+    print()
+    for e in result["empire_summary"]:
+        print(f"{e['name']:<8} planets={e['planets']:<4} "
+              f"pop={e['population']:8.1f} cash={e['cash']:9.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless symulacja AI vs AI")
+    parser.add_argument("--systems", type=int, default=40)
+    parser.add_argument("--empires", type=int, default=2)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--size", type=int, default=None,
+                        help="rozmiar galaktyki (domyślnie wg liczby systemów)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="ziarno gry (core.rng.set_seed) i modułu random")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="procesy do generowania galaktyki (galaxy/generation.py)")
+    parser.add_argument("--load", metavar="PATH", help="zamiast generowania wczytaj zapis (core/savegame.py)")
+    parser.add_argument("--save", metavar="PATH", help="po symulacji zapisz stan galaktyki")
+    parser.add_argument("--record", metavar="PATH", help="zapisz dziennik tur (core/replay.py)")
+    parser.add_argument("--keyframe-interval", type=int, default=replay.DEFAULT_KEYFRAME_INTERVAL,
+                        help="co ile tur klatka kluczowa w dzienniku")
+    parser.add_argument("--replay", metavar="PATH", help="zacznij od tury z dziennika (--seek)")
+    parser.add_argument("--seek", type=int, default=None,
+                        help="tura z dziennika --replay (domyślnie ostatnia)")
+    parser.add_argument("--log", metavar="LEVELS",
+                        help="poziomy kanałów gry na stderr, np. info,ai=debug (core/telemetry.py)")
+    parser.add_argument("--json", action="store_true", help="wynik jako JSON")
+    parser.add_argument("--verbose", action="store_true",
+                        help="nie wyciszaj logów i printów gry")
+    parser.add_argument("--profile-json", metavar="PATH", help="zapisz statystyki faz (JSON)")
+    parser.add_argument("--profile-csv", metavar="PATH", help="zapisz statystyki faz (CSV)")
+    args = parser.parse_args(argv)
+
+    if args.log:
+        telemetry.configure(args.log, stream=sys.stderr)
+
+    result, stats = simulate(
+        systems=args.systems,
+        empires=args.empires,
+        turns=args.turns,
+        size=args.size,
+        seed=args.seed,
+        quiet=not (args.verbose or args.log),
+        workers=args.workers,
+        load=args.load,
+        save=args.save,
+        record=args.record,
+        keyframe_interval=args.keyframe_interval,
+        replay_from=args.replay,
+        seek=args.seek,
+    )
+
+    if args.profile_json:
+        stats.to_json(args.profile_json)
+    if args.profile_csv:
+        stats.to_csv(args.profile_csv)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print_report(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -68,12 +68,7 @@ def count_buildings_on_planet(planet):
 
 
 def gather_production(empire):
-    totals = {}
-    for p in empire.planets:
-        prod = p.produce()
-        for r, v in prod.items():
-            totals[r] = totals.get(r, 0.0) + v
-    return totals
+    return empire.forecast_production()
 
 
 def print_turn_report(galaxy, turn):
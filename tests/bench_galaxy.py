@@ -0,0 +1,137 @@
+"""
+tests/bench_galaxy.py
+Benchmark generowania połączeń (lanes) i spójności dla dużych galaktyk.
+
+Uruchomienie z katalogu głównego:
+    python -m tests.bench_galaxy [liczba_systemów ...]
+
+Układ systemów jest losowany tak samo jak w Galaxy.generate, ale bez budowania
+StarSystem/Planet - mierzymy tylko topologię galaktyki. Dla małych galaktyk
+wynik porównywany jest z pierwotnymi algorytmami (O(n² log n) dla lanes,
+brute-force par dla łączenia składowych).
+"""
+
+import math
+import random
+import time
+
+from galaxy.galaxy import Galaxy
+
+SIZES = [100, 1_000, 10_000, 50_000]
+LINKS_PER_SYSTEM = 3
+LEGACY_CHECK_LIMIT = 1_000
+
+
+def make_layout(system_count, seed=41):
+    """Galaktyka z samymi węzłami (bez systemów) - gęstość jak w main.py."""
+    rng = random.Random(seed)
+    size = max(900, int(150 * math.sqrt(system_count)))
+
+    galaxy = Galaxy.__new__(Galaxy)
+    galaxy.systems = []
+    for i in range(system_count):
+        galaxy.systems.append({
+            "id": i,
+            "x": rng.randint(50, size - 50),
+            "y": rng.randint(50, size - 50),
+            "system": None,
+            "links": [],
+        })
+    return galaxy
+
+
+def legacy_generate_links(galaxy, n):
+    """Pierwotna implementacja - punkt odniesienia."""
+    for s in galaxy.systems:
+        distances = []
+        for other in galaxy.systems:
+            if other is s:
+                continue
+            dx = s["x"] - other["x"]
+            dy = s["y"] - other["y"]
+            distances.append((math.sqrt(dx * dx + dy * dy), other))
+
+        distances.sort(key=lambda x: x[0])
+
+        for _, target in distances[:n]:
+            if target not in s["links"]:
+                s["links"].append(target)
+            if s not in target["links"]:
+                target["links"].append(s)
+
+
+def legacy_connect_components(galaxy):
+    """Pierwotne łączenie składowych - punkt odniesienia."""
+    components = galaxy._find_components()
+
+    while len(components) > 1:
+        a = components[0]
+        b = components[1]
+        best_pair = None
+        best_dist = float("inf")
+
+        for s1 in a:
+            for s2 in b:
+                dx = s1["x"] - s2["x"]
+                dy = s1["y"] - s2["y"]
+                d = dx * dx + dy * dy
+                if d < best_dist:
+                    best_dist = d
+                    best_pair = (s1, s2)
+
+        s1, s2 = best_pair
+        s1["links"].append(s2)
+        s2["links"].append(s1)
+
+        components = galaxy._find_components()
+
+
+def link_ids(galaxy):
+    return [[t["id"] for t in s["links"]] for s in galaxy.systems]
+
+
+def bench(system_count):
+    galaxy = make_layout(system_count)
+
+    start = time.perf_counter()
+    galaxy._generate_links(LINKS_PER_SYSTEM)
+    lanes = time.perf_counter() - start
+
+    start = time.perf_counter()
+    galaxy._connect_components()
+    connect = time.perf_counter() - start
+
+    result = {
+        "systems": system_count,
+        "lanes_s": lanes,
+        "connect_s": connect,
+        "components": len(galaxy._find_components()),
+    }
+
+    if system_count <= LEGACY_CHECK_LIMIT:
+        reference = make_layout(system_count)
+        start = time.perf_counter()
+        legacy_generate_links(reference, LINKS_PER_SYSTEM)
+        legacy_connect_components(reference)
+        result["legacy_s"] = time.perf_counter() - start
+        result["identical"] = link_ids(galaxy) == link_ids(reference)
+
+    return result
+
+
+def run(sizes=SIZES):
+    print(f"{'systems':>8} | {'lanes [s]':>10} | {'connect [s]':>11} | {'legacy [s]':>10} | identical")
+    print("-" * 62)
+    for count in sizes:
+        r = bench(count)
+        assert r["components"] == 1
+        legacy = f"{r['legacy_s']:10.3f}" if "legacy_s" in r else f"{'-':>10}"
+        identical = r.get("identical", "-")
+        print(f"{r['systems']:8d} | {r['lanes_s']:10.3f} | {r['connect_s']:11.3f} | {legacy} | {identical}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    run(sizes)
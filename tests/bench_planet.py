@@ -0,0 +1,54 @@
+"""
+tests/bench_planet.py
+Benchmark budowy planet: czas Planet() i pamięć (tracemalloc) dla galaktyki.
+
+Uruchomienie z katalogu głównego:
+    python -m tests.bench_planet [liczba_systemów ...]
+"""
+
+import random
+import time
+import tracemalloc
+
+from galaxy.galaxy import Galaxy
+from planet.planet import Planet
+
+SIZES = [100, 1_000, 5_000]
+PLANETS_FOR_TIMING = 500
+
+
+def time_planets(count=PLANETS_FOR_TIMING):
+    Planet()
+    start = time.perf_counter()
+    for _ in range(count):
+        Planet()
+    return (time.perf_counter() - start) / count
+
+
+def galaxy_memory(system_count, seed=41):
+    random.seed(seed)
+    tracemalloc.start()
+    try:
+        galaxy = Galaxy(system_count=system_count, size=int(150 * system_count ** 0.5))
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    planets = sum(len(entry["system"].planets) for entry in galaxy.systems)
+    return current, planets
+
+
+def run(sizes=SIZES):
+    print(f"Planet(): {time_planets() * 1000:.3f} ms")
+    print(f"{'systems':>8} | {'planets':>8} | {'memory [MB]':>11} | {'per planet [KB]':>15}")
+    print("-" * 52)
+    for count in sizes:
+        memory, planets = galaxy_memory(count)
+        print(f"{count:8d} | {planets:8d} | {memory / 1e6:11.1f} | {memory / planets / 1e3:15.2f}")
+
+
+if __name__ == "__main__":
+    import sys
+
+    sizes = [int(a) for a in sys.argv[1:]] or SIZES
+    run(sizes)
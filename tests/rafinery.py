@@ -129,7 +129,7 @@ def test_refinery_system():
     # Dodaj gases do hexów
     for hex in planet.hex_map.hexes[:3]:
         if 'gases' not in hex.resources:
-            hex.resources['gases'] = 1.5
+            hex.resources = {**hex.resources, 'gases': 1.5}
     
     # Zbuduj gas collector
     gas_collector = MiningComplex("gases")
@@ -0,0 +1,38 @@
+from ai.simple_ai import PlanetRole, SimpleAI
+from tests.test_transport import colonized_pair
+
+
+def test_planet_roles_update_only_for_changed_planets(monkeypatch):
+    galaxy, empire, source, target = colonized_pair()
+    ai = SimpleAI(empire, galaxy)
+    target.colonized = False
+
+    computed = []
+    determine = ai.determine_planet_role
+    monkeypatch.setattr(ai, "determine_planet_role", lambda p: computed.append(p) or determine(p))
+
+    ai.update_planet_roles()
+    assert computed == [source]
+    assert target not in ai.planet_roles
+    assert len(ai._military) == 1
+
+    # bez zdarzeń właściciela - ani role, ani przynależność nie są liczone ponownie
+    members = ai._role_members
+    ai.update_planet_roles()
+    assert computed == [source]
+    assert ai._role_members is members
+
+    # kolonizacja kończy oczekiwanie na rolę
+    target.colonized = True
+    ai.update_planet_roles()
+    assert computed == [source, target]
+
+    # utrata planety zwalnia jej rolę; MILITARY przechodzi na pozostałą
+    (military,) = ai._military
+    lost = source if military is source else target
+    kept = target if lost is source else source
+    lost.set_owner(None)
+    ai.update_planet_roles()
+    assert lost not in ai.planet_roles
+    assert ai._military == {kept}
+    assert ai.get_planet_role(kept) == PlanetRole.MILITARY
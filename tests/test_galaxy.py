@@ -0,0 +1,188 @@
+import math
+
+import pytest
+
+from tests.bench_galaxy import make_layout, legacy_generate_links, link_ids
+
+
+def test_generate_links_matches_legacy():
+    for count in (2, 5, 40, 300):
+        galaxy = make_layout(count, seed=count)
+        reference = make_layout(count, seed=count)
+
+        galaxy._generate_links(3)
+        legacy_generate_links(reference, 3)
+
+        assert link_ids(galaxy) == link_ids(reference)
+
+
+def test_generate_links_ties_use_system_order():
+    # ciasna siatka = dużo remisów odległości
+    galaxy = make_layout(200)
+    reference = make_layout(200)
+    for a, b in zip(galaxy.systems, reference.systems):
+        a["x"] = b["x"] = a["x"] % 12
+        a["y"] = b["y"] = a["y"] % 12
+
+    galaxy._generate_links(4)
+    legacy_generate_links(reference, 4)
+
+    assert link_ids(galaxy) == link_ids(reference)
+
+
+def test_connect_components_matches_legacy():
+    from tests.bench_galaxy import legacy_connect_components
+
+    for seed in range(6):
+        # klastry + 1 połączenie na system = wiele składowych
+        galaxy = make_layout(150, seed=seed)
+        reference = make_layout(150, seed=seed)
+        for i, (a, b) in enumerate(zip(galaxy.systems, reference.systems)):
+            offset = (i % 5) * 400
+            a["x"] = b["x"] = a["x"] % 60 + offset
+            a["y"] = b["y"] = a["y"] % 60 + offset
+
+        galaxy._generate_links(1)
+        legacy_generate_links(reference, 1)
+        assert len(galaxy._find_components()) > 1
+
+        galaxy._connect_components()
+        legacy_connect_components(reference)
+
+        assert link_ids(galaxy) == link_ids(reference)
+        assert len(galaxy._find_components()) == 1
+
+
+def test_planet_location_and_owner_index():
+    from galaxy.galaxy import Galaxy
+    from empire.empire import Empire
+    from core.init import init_start_planet
+
+    galaxy = Galaxy(system_count=3, size=300)
+    for entry in galaxy.systems:
+        for orbit, planet in enumerate(entry["system"].planets):
+            assert planet.get_location(galaxy) == (entry["system"], orbit)
+            assert galaxy.find_system_entry_of_planet(planet) is entry
+
+    empire = Empire("Index", (1, 2, 3), galaxy, is_player=True)
+    galaxy.empires.append(empire)
+    init_start_planet(empire, galaxy.systems[1])
+    planet = galaxy.systems[1]["system"].planets[0]
+    assert galaxy.planet_owners[planet] is empire
+
+    version = galaxy.owner_version
+    planet.set_owner(None)
+    assert planet not in galaxy.planet_owners
+
+    # zmiany od wersji - tylko dotknięte planety
+    other = galaxy.systems[2]["system"].planets[0]
+    other.set_owner(empire)
+    other.finish_colonization()
+    assert galaxy.owner_changes_since(version) == [planet, other, other]
+    assert galaxy.owner_changes_since(galaxy.owner_version) == []
+    assert galaxy.owner_changes_since(None) is None
+    assert galaxy.owner_changes_since(version - len(galaxy.owner_changes) - 1) is None
+
+
+def test_spatial_query_rect_matches_brute_force():
+    import random
+    from galaxy.spatial import SpatialGrid
+
+    rng = random.Random(7)
+    points = [(i, rng.uniform(0, 1000), rng.uniform(0, 1000)) for i in range(500)]
+    grid = SpatialGrid.for_points(points)
+
+    for _ in range(50):
+        x0, x1 = sorted(rng.uniform(-100, 1100) for _ in range(2))
+        y0, y1 = sorted(rng.uniform(-100, 1100) for _ in range(2))
+        expected = [i for i, x, y in points if x0 <= x <= x1 and y0 <= y <= y1]
+        assert grid.query_rect(x0, y0, x1, y1) == expected
+
+
+def test_galaxy_camera_zoom_keeps_cursor_point():
+    from render.camera import GalaxyCamera
+
+    camera = GalaxyCamera(offset=(550, 0))
+    assert camera.world_to_screen(100, 200) == (650, 200)
+
+    before = camera.screen_to_world(900, 400)
+    camera.zoom_at(1.2 ** 3, (900, 400))
+    after = camera.screen_to_world(900, 400)
+    assert abs(before[0] - after[0]) < 1e-9 and abs(before[1] - after[1]) < 1e-9
+
+    camera.pan_by(80, 0)
+    assert camera.visible_world((100, 100))[0] == camera.pan[0]
+
+
+def galaxy_signature(galaxy):
+    return [
+        (
+            entry["x"],
+            entry["y"],
+            entry["system"].star.type,
+            [
+                (
+                    p.temperature,
+                    p.base_temperature,
+                    [(type(s).__name__, s.q, s.r, s.strength) for s in p.sources],
+                    [p.hex_map.values(param).tobytes() for param in ("temperature", "height", "life")],
+                    p.hex_map.resource_totals(),
+                    p.hex_map.version,
+                )
+                for p in entry["system"].planets
+            ],
+            sorted(t["id"] for t in entry["links"]),
+        )
+        for entry in galaxy.systems
+    ]
+
+
+def test_parallel_generation_matches_serial(monkeypatch):
+    from galaxy import generation
+    from galaxy.galaxy import Galaxy
+
+    monkeypatch.setattr(generation, "MIN_PARALLEL_SYSTEMS", 1)
+    serial = Galaxy(system_count=12, size=500)
+    parallel = Galaxy(system_count=12, size=500, workers=2)
+
+    assert galaxy_signature(parallel) == galaxy_signature(serial)
+
+
+def test_route_table_matches_brute_force_and_invalidates():
+    import itertools
+    from collections import deque
+    from galaxy.routing import RouteTable
+
+    galaxy = make_layout(60, seed=7)
+    galaxy.lanes_version = 0
+    galaxy._generate_links(2)
+    galaxy._connect_components()
+    routes = RouteTable(galaxy, cache_size=4)
+
+    def bfs(start):
+        hops = {start["id"]: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for n in node["links"]:
+                if n["id"] not in hops:
+                    hops[n["id"]] = hops[node["id"]] + 1
+                    queue.append(n)
+        return hops
+
+    for a, b in itertools.combinations(galaxy.systems[:15], 2):
+        assert routes.hops(a, b) == bfs(a)[b["id"]] == routes.hops(b, a)
+        d = routes.distance(a, b)
+        assert d == pytest.approx(routes.distance(b, a))
+        for n in a["links"]:
+            direct = math.hypot(n["x"] - a["x"], n["y"] - a["y"])
+            assert d <= direct + routes.distance(n, b) + 1e-9
+    assert len(routes._rows) <= 4
+
+    # nowe połączenie skraca trasę po lanes_changed()
+    a, b = galaxy.systems[0], max(galaxy.systems, key=lambda s: bfs(galaxy.systems[0])[s["id"]])
+    assert routes.hops(a, b) > 1
+    a["links"].append(b)
+    b["links"].append(a)
+    galaxy.lanes_version += 1
+    assert routes.hops(a, b) == 1
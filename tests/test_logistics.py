@@ -0,0 +1,106 @@
+import itertools
+
+from ai.logistics import LogisticsPlanner, min_cost_transport
+from tests.test_transport import colonized_pair
+
+
+def test_min_cost_transport_finds_cheapest_assignment():
+    costs = [[1.0, 2.0], [1.0, 5.0]]
+    flows = min_cost_transport([10.0, 10.0], [10.0, 10.0], lambda i, j: costs[i][j])
+    assert flows == {(0, 1): 10.0, (1, 0): 10.0}
+
+    # brak trasy i limit na parę
+    costs = [[1.0, None], [3.0, 1.0]]
+    flows = min_cost_transport([8.0, 20.0], [15.0, 6.0], lambda i, j: costs[i][j], capacity=10.0)
+    assert flows == {(0, 0): 8.0, (1, 0): 7.0, (1, 1): 6.0}
+
+
+def test_min_cost_transport_matches_brute_force():
+    supplies = [3.0, 4.0]
+    demands = [2.0, 3.0, 1.0]
+    costs = [[4.0, 1.0, 3.0], [2.0, 6.0, 1.0]]
+    flows = min_cost_transport(supplies, demands, lambda i, j: costs[i][j])
+
+    def total(f):
+        return sum(costs[i][j] * amount for (i, j), amount in f.items())
+
+    # całkowite ilości - optimum zagadnienia transportowego jest całkowite
+    best = None
+    for plan in itertools.product(range(4), repeat=6):
+        f = {(k // 3, k % 3): a for k, a in enumerate(plan) if a}
+        if all(sum(a for (i, _), a in f.items() if i == s) <= supplies[s] for s in range(2)) and \
+                all(sum(a for (_, j), a in f.items() if j == d) == demands[d] for d in range(3)):
+            best = total(f) if best is None else min(best, total(f))
+
+    assert sum(flows.values()) == sum(demands)
+    assert total(flows) == best
+
+
+def test_planner_counts_cargo_in_flight():
+    galaxy, empire, source, target = colonized_pair()
+    planner = LogisticsPlanner(empire)
+    balances = {
+        source: {"needs": {}, "surpluses": {"energy": 30.0}},
+        target: {"needs": {"energy": 25.0, "minerals": 3.0}, "surpluses": {}},
+    }
+
+    assert planner.plan(balances) == {(source, target): {"energy": 25.0}}
+    ok, _ = empire.create_transport(source, target, {"energy": 25.0}, "resources")
+    assert ok
+
+    assert planner.plan(balances) == {}
+
+
+def test_planner_retries_shipment_that_failed_to_dispatch():
+    galaxy, empire, source, target = colonized_pair()
+    planner = LogisticsPlanner(empire)
+    balances = {
+        source: {"needs": {}, "surpluses": {"energy": 30.0}},
+        target: {"needs": {"energy": 25.0}, "surpluses": {}},
+    }
+
+    # cel chwilowo nieskolonizowany - nadanie się nie uda
+    target.colonized = False
+    plan = planner.plan(balances)
+    assert plan == {(source, target): {"energy": 25.0}}
+    ok, _ = empire.create_transport(source, target, plan[(source, target)], "resources")
+    assert not ok
+
+    # to samo wejście - przesyłka planowana ponownie
+    assert planner.plan(balances) == plan
+    target.colonized = True
+    ok, _ = empire.create_transport(source, target, planner.plan(balances)[(source, target)], "resources")
+    assert ok
+    assert planner.plan(balances) == {}
+
+
+def test_planner_caps_shipments_at_donor_storage():
+    galaxy, empire, source, target = colonized_pair()
+    planner = LogisticsPlanner(empire)
+    balances = {
+        source: {"needs": {}, "surpluses": {"energy": 30.0, "minerals": 12.0}},
+        target: {"needs": {"energy": 25.0, "minerals": 10.0}, "surpluses": {}},
+    }
+    source.storage["minerals"] = 1.0
+
+    # zgłoszona nadwyżka minerałów większa niż magazyn - nie blokuje energii
+    plan = planner.plan(balances)
+    assert plan == {(source, target): {"energy": 25.0, "minerals": 1.0}}
+    ok, _ = empire.create_transport(source, target, plan[(source, target)], "resources")
+    assert ok
+
+
+def test_pair_costs_are_kept_until_lanes_change(monkeypatch):
+    import ai.logistics as logistics
+
+    galaxy, empire, source, target = colonized_pair()
+    planner = LogisticsPlanner(empire)
+    calls = []
+    cost = logistics.calculate_transport_cost
+    monkeypatch.setattr(logistics, "calculate_transport_cost", lambda *a: calls.append(a) or cost(*a))
+
+    assert planner._cost(source, target, galaxy) == planner._cost(source, target, galaxy)
+    assert len(calls) == 1
+    galaxy.lanes_changed()
+    planner._cost(source, target, galaxy)
+    assert len(calls) == 2
@@ -0,0 +1,203 @@
+import pytest
+
+from planet.planet import Planet
+from planet.fields import reference_fields, verify_fields, FIELD_PARAMS
+from planet.resources import resources_for
+
+
+def test_field_engine_matches_source_influence():
+    for _ in range(20):
+        planet = Planet()
+        reference = reference_fields(planet)
+
+        for i, h in enumerate(planet.hex_map.hexes):
+            for param in FIELD_PARAMS:
+                assert getattr(h, param) == reference[param][i]
+
+        assert verify_fields(planet) == (True, 0.0)
+
+
+def test_field_engine_resources_match_per_hex():
+    for radius in (3, 5, 7):
+        planet = Planet(radius=radius)
+
+        for h in planet.hex_map.hexes:
+            expected = resources_for(h.temperature, h.height, h.life)
+            assert list(h.resources.items()) == list(expected.items())
+
+
+def test_hex_views_write_through_to_map():
+    planet = Planet()
+    hm = planet.hex_map
+
+    assert hm.hexes is hm.hexes
+    h = hm.hex_at(1, -2)
+    assert h is hm.hexes[h.index]
+    assert (h.q, h.r) == (1, -2)
+
+    version = hm.version
+    h.temperature = 0.5
+    assert hm.temperature[h.index] == 0.5
+    assert hm.version > version
+
+    h.resources = {"minerals": 2.0, "energy": 1.5, "water": 1.0}
+    assert h.resources == {"minerals": 2.0, "energy": 1.5, "water": 1.0}
+    assert list(h.resources) == ["minerals", "energy", "water"]
+
+    h.resources = {"energy": 1.5, "minerals": 2.0}
+    assert h.index not in hm.resource_overrides
+    assert hm.resource_totals()["energy"] == sum(x.resources.get("energy", 0) for x in hm.hexes)
+
+    with pytest.raises(TypeError):
+        h.resources["energy"] = 99.0
+    assert h.resources["energy"] == 1.5
+
+
+def test_hex_buildings_are_sparse():
+    from buildings.SpacePort import SpacePort
+
+    planet = Planet()
+    hm = planet.hex_map
+    h = hm.hexes[10]
+
+    assert h.building_major is None and h.buildings_small == ()
+    port = SpacePort()
+    h.add_building(port)
+    assert hm.major == {10: port}
+    assert planet.has_spaceport()
+    assert hm.building_indices() == [10]
+
+    # krotka - dopisanie z pominięciem add_building (i buildings_version) nie przejdzie
+    with pytest.raises(AttributeError):
+        hm.hexes[11].buildings_small.append(port)
+
+
+def test_metrics_cached_until_fields_change():
+    planet = Planet()
+    hm = planet.hex_map
+
+    values = list(hm.temperature)
+    assert planet.stat_range("temperature") == max(values) - min(values)
+    first = planet.instability()
+    assert planet.instability() is first
+
+    h = hm.hexes[0]
+    h.temperature = max(values) + 5.0
+    assert planet.stat_range("temperature") == max(values) + 5.0 - min(values)
+    assert planet.instability() != first
+
+    total = planet.resource_totals()
+    assert planet.primary_resource == max(total, key=total.get)
+    h.resources = {"rare_elements": 1000.0}
+    assert planet.primary_resource == "rare_elements"
+
+
+def legacy_produce(planet):
+    """Pierwotne Planet.produce - budynek po budynku przez produce()."""
+    total = {}
+    population = planet.population
+    population.used = 0.0
+
+    for h in planet.hex_map.hexes:
+        buildings = list(h.buildings_small)
+        if h.building_major:
+            buildings.append(h.building_major)
+
+        for b in buildings:
+            workers = getattr(b, "workers_required", 0.0)
+            if not population.can_support(workers):
+                continue
+            delta = b.produce(h, population)
+            if any(val < 0 and planet.storage.get(res, 0.0) < -val for res, val in delta.items()):
+                continue
+            for res, val in delta.items():
+                planet.storage[res] = planet.storage.get(res, 0.0) + val
+                total[res] = total.get(res, 0.0) + val
+            population.add_load(workers)
+
+    return total
+
+
+def test_production_plan_matches_per_building_dispatch():
+    import copy
+    from buildings.registry import BUILDINGS
+
+    planet = Planet()
+    planet.colonized = True
+    planet.population.size = 0.5
+    planet.init_population_stats()
+    planet.storage.update({"minerals": 3.0, "energy": 1.0, "gases": 2.0, "water": 1.0})
+
+    names = ["Smelter", "Mining Complex", "Gas Collector", "Chemical Plant", "Energy Collector",
+             "Bioreactor", "Water Extractor", "Electronics Fab"]
+    for i, name in enumerate(names * 2):
+        planet.hex_map.hexes[(i * 7) % len(planet.hex_map)].add_building(BUILDINGS[name]())
+
+    reference = copy.deepcopy(planet)
+    for turn in range(6):
+        if turn == 3:
+            planet.population.stats["minerals"] += 0.5
+            reference.population.stats["minerals"] += 0.5
+        assert planet.produce() == legacy_produce(reference)
+        assert planet.storage == reference.storage
+        assert planet.population.used == reference.population.used
+
+    plan = planet.production_plan()
+    assert planet.production_plan() is plan and len(plan) == planet.total_buildings()
+
+
+def test_forecast_production_has_no_side_effects():
+    from buildings.registry import BUILDINGS
+
+    planet = Planet()
+    planet.colonized = True
+    planet.population.size = 5.0
+    planet.init_population_stats()
+    planet.storage.update({"minerals": 4.0, "energy": 2.0})
+    for i, name in enumerate(["Smelter", "Mining Complex", "Energy Collector"]):
+        planet.hex_map.hexes[i * 10].add_building(BUILDINGS[name]())
+
+    storage = dict(planet.storage)
+    forecast = planet.forecast_production()
+    assert planet.forecast_production() == forecast
+    assert planet.storage == storage
+    assert planet.population.used == 0.0
+
+    assert planet.produce() == forecast
+    assert planet.storage != storage
+
+    # nowy magazyn - prognoza liczona od nowa, nadal bez zmian w storage
+    storage = dict(planet.storage)
+    expected, _ = planet.production_plan().run(dict(storage), planet.population.size)
+    assert planet.forecast_production() == expected
+    assert planet.storage == storage
+
+
+def test_layout_locate_picks_nearest_hex_center():
+    import math
+    import random
+    from planet.fields import layout_for
+
+    layout = layout_for(12)
+    centers = [
+        (1.5 * q, math.sqrt(3) * (r + q / 2))
+        for q, r in zip(layout.q, layout.r)
+    ]
+
+    rng = random.Random(3)
+    for _ in range(2000):
+        x = rng.uniform(-20, 20)
+        y = rng.uniform(-20, 20)
+        q = x / 1.5
+        r = y / math.sqrt(3) - q / 2
+
+        dists = [(cx - x) ** 2 + (cy - y) ** 2 for cx, cy in centers]
+        nearest = min(range(layout.size), key=dists.__getitem__)
+        # punkt w promieniu wpisanym hexa należy na pewno do niego
+        if dists[nearest] < 0.75:
+            assert layout.locate(q, r) == nearest
+        found = layout.locate(q, r)
+        if found is not None:
+            assert dists[found] <= dists[nearest] + 1e-9
+
+    assert layout.locate(40.0, 0.0) is None
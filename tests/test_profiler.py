@@ -0,0 +1,46 @@
+import csv
+import json
+
+from core import profiler as tick_profiler
+from core.profiler import TickProfiler, NULL_PROFILER, profiled
+
+
+@profiled("work")
+def work(n):
+    return n * 2
+
+
+def test_null_profiler_is_default_and_transparent():
+    assert tick_profiler.active() is NULL_PROFILER
+    with NULL_PROFILER.phase("x") as phase:
+        assert phase is NULL_PROFILER.phase("y")
+    assert work(3) == 6
+
+
+def test_nested_phases_and_export(tmp_path):
+    profiler = TickProfiler()
+    previous = tick_profiler.install(profiler)
+    try:
+        for _ in range(3):
+            profiler.count("turns")
+            with profiler.phase("empires"), profiler.phase("A"):
+                assert work(2) == 4
+                work(1)
+            with profiler.phase("planets"):
+                pass
+    finally:
+        tick_profiler.install(previous)
+
+    stats = profiler.stats()
+    assert [p.path for p in stats] == ["empires", "empires/A", "empires/A/work", "planets"]
+    assert stats.get("empires/A/work").calls == 6
+    assert stats.counters == {"turns": 3}
+
+    stats.to_csv(tmp_path / "p.csv")
+    with open(tmp_path / "p.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[2]["path"] == "empires/A/work" and rows[2]["calls"] == "6"
+
+    data = json.loads(stats.to_json(tmp_path / "p.json"))
+    assert data == json.loads((tmp_path / "p.json").read_text())
+    assert data["phases"][0]["path"] == "empires"
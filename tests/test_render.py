@@ -0,0 +1,59 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from tests.test_transport import colonized_pair
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    import main
+    yield pygame.display.set_mode((main.WIDTH, main.HEIGHT))
+    pygame.quit()
+
+
+def test_galaxy_frame_draws_and_recolors_changed_systems(screen):
+    import main
+    from render.camera import GalaxyCamera
+    from render.draw_galaxy import draw_galaxy, galaxy_renderer, pick_system
+
+    galaxy, empire, source, target = colonized_pair()
+    camera = GalaxyCamera(offset=(main.LEFT_PANEL_W, 0))
+    area = (main.WIDTH - main.LEFT_PANEL_W, main.HEIGHT)
+    draw_galaxy(screen, galaxy, offset=camera.offset, area=area, camera=camera)
+
+    entry, _ = galaxy.locate_planet(source)
+    assert pick_system(galaxy, camera.world_to_screen(entry["x"], entry["y"]), camera) is entry["system"]
+
+    renderer = galaxy_renderer(galaxy)
+    assert renderer.refresh_colors() == []
+    # skolonizowana planeta bez właściciela - konflikt w systemie, tylko on przeliczony
+    target.set_owner(None)
+    assert renderer.refresh_colors() == [entry["id"]]
+    draw_galaxy(screen, galaxy, offset=camera.offset, area=area, camera=camera)
+
+
+def test_planet_frame_and_busy_frame(screen):
+    import main
+    from core.scheduler import SimScheduler
+    from render.planet_view import draw_planet
+
+    galaxy, empire, source, target = colonized_pair()
+    center = (main.LEFT_PANEL_W + (main.WIDTH - main.LEFT_PANEL_W) // 2, main.HEIGHT // 2)
+    for overlay in (main.OVERLAY_TEMP, main.OVERLAY_RES):
+        draw_planet(screen, source, center, source.hex_map.hexes[0], overlay)
+
+    scheduler = SimScheduler(galaxy, paused=True)
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(1, 1), buttons=(0, 0, 0)))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode="", scancode=0))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" ", scancode=0))
+
+    assert main.handle_busy_frame(screen, scheduler, empire)
+    assert scheduler.paused is False
+
+    # ESC czeka na pełną klatkę, ruch myszy nie wraca do kolejki
+    events = pygame.event.get()
+    assert [(e.type, getattr(e, "key", None)) for e in events] == [(pygame.KEYDOWN, pygame.K_ESCAPE)]
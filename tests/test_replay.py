@@ -0,0 +1,71 @@
+import contextlib
+import io
+
+import pytest
+
+from core import replay
+from tests.test_galaxy import galaxy_signature
+from tests.test_savegame import empire_summary, play
+
+
+def recorded_game(turns, interval):
+    from simulate import setup_galaxy
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        galaxy = setup_galaxy(12, 2, size=600)
+
+    log = replay.ReplayLog(galaxy, keyframe_interval=interval)
+    previous = replay.install(log)
+    try:
+        play(galaxy, turns)
+    finally:
+        replay.install(previous)
+    return galaxy, log
+
+
+def test_seek_matches_recorded_game(tmp_path):
+    galaxy, log = recorded_game(30, interval=10)
+
+    assert sorted(log.keyframes) == [0, 10, 20]
+    kinds = {e.kind for e in log.events}
+    assert {"build", "colonize", "owner"} <= kinds
+
+    path = tmp_path / "game.replay"
+    log.save(path)
+    loaded = replay.ReplayLog.load(path)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        at_25 = loaded.seek(25)
+        end = loaded.seek(30)
+    assert at_25.turn == 25
+    assert galaxy_signature(end) == galaxy_signature(galaxy)
+    assert empire_summary(end) == empire_summary(galaxy)
+
+
+def test_seek_reports_divergence():
+    galaxy, log = recorded_game(12, interval=10)
+    tampered = [e for e in log.events if e.turn != 12]
+    assert len(tampered) < len(log.events)
+    log.events = tampered
+
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(replay.ReplayDivergence) as info:
+        log.seek(12)
+    assert info.value.turn == 12
+
+
+def test_rewind_continues_recording():
+    galaxy, log = recorded_game(20, interval=10)
+    expected = empire_summary(galaxy)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        rewound = log.rewind(15)
+    assert all(e.turn <= 15 for e in log.events)
+
+    previous = replay.install(log)
+    try:
+        play(rewound, 5)
+    finally:
+        replay.install(previous)
+
+    assert empire_summary(rewound) == expected
+    assert 15 in log.keyframes
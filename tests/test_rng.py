@@ -0,0 +1,58 @@
+import contextlib
+import io
+import pickle
+
+from core.rng import stream, RngStream
+from galaxy.system import StarSystem
+
+
+def test_streams_depend_only_on_path():
+    a = stream("galaxy", "system", 3)
+    b = stream("galaxy").split("system", 3)
+    assert [a.random() for _ in range(5)] == [b.random() for _ in range(5)]
+    assert stream("empire", "A").random() != stream("empire", "B").random()
+
+    a.random()
+    copy = pickle.loads(pickle.dumps(a))
+    assert isinstance(copy, RngStream) and copy.path == a.path
+    assert copy.random() == a.random()
+
+
+def system_signature(system):
+    return (
+        system.star.type,
+        [(p.temperature, p.height, p.life, [(s.q, s.r, s.strength) for s in p.sources])
+         for p in system.planets],
+    )
+
+
+def test_system_generation_independent_of_order():
+    root = stream("galaxy")
+    forward = [system_signature(StarSystem(root.split("system", i))) for i in range(6)]
+    backward = [system_signature(StarSystem(root.split("system", i))) for i in reversed(range(6))]
+    assert forward == backward[::-1]
+
+
+def run_game(turns):
+    from galaxy.galaxy import Galaxy
+    from empire.empire import Empire
+    from core.init import init_start_planet
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        galaxy = Galaxy(system_count=8, size=500)
+        a = Empire("A", (1, 1, 1), galaxy)
+        b = Empire("B", (2, 2, 2), galaxy)
+        galaxy.empires.extend([a, b])
+        init_start_planet(a, galaxy.systems[0])
+        init_start_planet(b, galaxy.systems[1])
+        for _ in range(turns):
+            galaxy.tick()
+
+    return [
+        (e.name, len(e.planets), e.cash, sum(p.population.size for p in e.planets))
+        for e in galaxy.empires
+    ]
+
+
+def test_game_is_reproducible():
+    assert run_game(15) == run_game(15)
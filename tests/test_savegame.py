@@ -0,0 +1,90 @@
+import contextlib
+import io
+
+import pytest
+
+from core import savegame
+from tests.test_galaxy import galaxy_signature
+
+
+def play(galaxy, turns):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(turns):
+            galaxy.tick()
+
+
+def empire_summary(galaxy):
+    return [
+        (
+            e.name,
+            e.cash,
+            sorted(galaxy.locate_planet(p)[0]["id"] for p in e.planets),
+            sum(p.population.size for p in e.planets),
+            sum(p.total_buildings() for p in e.planets),
+            len(e.transport_manager.transports),
+        )
+        for e in galaxy.empires
+    ]
+
+
+def test_save_load_round_trip_continues_identically(tmp_path):
+    from simulate import setup_galaxy
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        galaxy = setup_galaxy(12, 2, size=600)
+    play(galaxy, 25)
+
+    path = tmp_path / "game.sav"
+    savegame.save_galaxy(galaxy, path)
+    loaded = savegame.load_galaxy(path)
+
+    assert loaded.turn == galaxy.turn
+    assert galaxy_signature(loaded) == galaxy_signature(galaxy)
+    assert empire_summary(loaded) == empire_summary(galaxy)
+    for planet, owner in loaded.planet_owners.items():
+        assert planet.owner is owner
+        assert planet in owner.planets
+
+    # stan AI wskazuje wczytane planety, nie obiekty sprzed zapisu
+    planets = {p for entry in loaded.systems for p in entry["system"].planets}
+    for empire in loaded.empires:
+        ai = empire.ai
+        assert ai.planet_roles and set(ai.planet_roles) <= planets
+        assert ai._role_members <= planets
+        assert ai._military <= set(ai.planet_roles)
+
+    play(galaxy, 10)
+    play(loaded, 10)
+    assert empire_summary(loaded) == empire_summary(galaxy)
+
+
+def test_load_rejects_other_formats():
+    with pytest.raises(savegame.SaveFormatError):
+        savegame.loads(b"not a save file at all")
+
+    data = bytearray(savegame.dumps(_tiny_galaxy()))
+    data[6] = savegame.VERSION + 1
+    with pytest.raises(savegame.SaveFormatError):
+        savegame.loads(bytes(data))
+
+
+def test_load_rejects_non_game_globals():
+    import os
+    import pickle
+    from collections import deque
+    from core.rng import RngStream, stream
+
+    rng = stream("test")
+    queue, copy = savegame.safe_loads(pickle.dumps((deque([1]), rng)))
+    assert queue == deque([1])
+    assert isinstance(copy, RngStream) and copy.getstate() == rng.getstate()
+
+    # funkcje (także z pakietów gry) i moduły nie są tworzone
+    for data in (pickle.dumps(os.system), pickle.dumps(stream), b"ccore.savegame\npickle\n."):
+        with pytest.raises(savegame.SaveFormatError):
+            savegame.safe_loads(data)
+
+
+def _tiny_galaxy():
+    from galaxy.galaxy import Galaxy
+    return Galaxy(system_count=2, size=200)
@@ -0,0 +1,79 @@
+import threading
+import time
+
+from core.scheduler import SimScheduler
+
+
+class FakeEmpire:
+    def __init__(self, name):
+        self.name = name
+        self.color = [1, 2, 3]
+        self.cash = 0.0
+        self.cash_last = 0.0
+        self.planets = []
+
+
+class FakeGalaxy:
+    def __init__(self):
+        self.turn = 0
+        self.empires = [FakeEmpire("A")]
+
+    def tick(self):
+        self.turn += 1
+        self.empires[0].cash += 1.0
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < end
+        time.sleep(0.001)
+
+
+def test_step_publishes_immutable_snapshots():
+    galaxy = FakeGalaxy()
+    scheduler = SimScheduler(galaxy)
+    first = scheduler.snapshot
+
+    snap = scheduler.step(3)
+    assert first.turn == 0 and first.empire("A").cash == 0.0
+    assert snap.turn == 3 and snap.empire("A").cash == 3.0
+    assert snap.empire("A").color == (1, 2, 3)
+    assert scheduler.snapshot is snap
+
+
+def test_background_turns_and_nonblocking_frames():
+    galaxy = FakeGalaxy()
+    scheduler = SimScheduler(galaxy, paused=True)
+    scheduler.start()
+    try:
+        scheduler.run_turns(200)
+        wait_for(lambda: scheduler.snapshot.turn == 200)
+        assert scheduler.pending == 0
+
+        # tura w toku (lock zajęty przez inny wątek) - klatka UI nie czeka
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with scheduler.lock:
+                held.set()
+                release.wait()
+
+        worker = threading.Thread(target=hold)
+        worker.start()
+        held.wait()
+        assert scheduler.begin_frame() is False
+        release.set()
+        worker.join()
+
+        assert scheduler.begin_frame() is True
+        assert galaxy.turn == 200
+        scheduler.end_frame()
+
+        scheduler.set_speed("max")
+        scheduler.toggle_pause()
+        wait_for(lambda: scheduler.snapshot.turn >= 300)
+        scheduler.toggle_pause()
+    finally:
+        scheduler.stop()
@@ -0,0 +1,50 @@
+import logging
+
+import pytest
+
+from core import telemetry
+
+
+@pytest.fixture
+def restore_levels():
+    yield
+    telemetry.configure()
+
+
+def test_channel_is_silent_by_default_and_formats_lazily(restore_levels):
+    buf = telemetry.configure()
+    log = telemetry.channel("ai")
+
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted while disabled")
+
+    log.info("transport", "%(value)s", value=Exploding())
+    assert not buf.records
+
+    buf = telemetry.configure("warning,ai=debug")
+    log.debug("transport", "[AI %(empire)s] Transport %(amount).1f", empire="AI 1", amount=2.25)
+    telemetry.channel("planet").info("owner_added", "ignored")
+
+    (record,) = buf.events()
+    assert record.event == "transport"
+    assert record.args == {"empire": "AI 1", "amount": 2.25}
+    assert record.getMessage() == "[AI AI 1] Transport 2.2"
+    assert buf.events(subsystem="ai") == [record]
+    assert buf.events(event="owner_added") == []
+
+
+def test_ring_buffer_keeps_latest_records(restore_levels):
+    buf = telemetry.configure("info", buffer_size=3)
+    log = telemetry.channel("empire")
+    for i in range(5):
+        log.info("tick", "turn %(turn)d", turn=i)
+
+    assert [r.args["turn"] for r in buf.events()] == [2, 3, 4]
+    assert buf.lines()[-1] == "game.empire INFO turn 4"
+
+
+def test_parse_levels():
+    assert telemetry.parse_levels("info,ai=debug") == {None: logging.INFO, "ai": logging.DEBUG}
+    with pytest.raises(ValueError):
+        telemetry.parse_levels("ai=loud")
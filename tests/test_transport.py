@@ -0,0 +1,123 @@
+import contextlib
+import io
+
+from empire.transport import HISTORY_SIZE
+
+
+def colonized_pair():
+    from simulate import setup_galaxy
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        galaxy = setup_galaxy(6, 1, size=400)
+    empire = galaxy.empires[0]
+    source = empire.planets[0]
+    entry, _ = galaxy.locate_planet(source)
+    target = next(p for p in entry["system"].planets if p is not source)
+
+    target.set_owner(empire)
+    target.colonized = True
+    source.storage["energy"] = 1000.0
+    return galaxy, empire, source, target
+
+
+def test_transports_arrive_on_their_turn_and_index_tracks_them():
+    galaxy, empire, source, target = colonized_pair()
+    manager = empire.transport_manager
+    before = target.storage.get("energy", 0.0)
+
+    # po jednym ładunku na turę - konwój, który wyruszył, nie przyjmuje kolejnych
+    ok, _ = manager.create_transport(source, target, {"energy": 1.0})
+    assert ok
+    (first,) = manager.transports
+    assert first.time_total == 3 and first.time_remaining == 3 and first.progress() == 0.0
+
+    manager.tick()
+    assert first.time_remaining == 2
+    assert abs(first.progress() - 1 / 3) < 1e-9
+    manager.create_transport(source, target, {"energy": 2.0})
+    manager.tick()
+    manager.create_transport(source, target, {"energy": 3.0})
+
+    first, second, third = manager.transports
+    assert galaxy.transports.for_planet(target) == [first, second, third]
+
+    assert manager.cancel(second)
+    assert manager.get_active_transports_for_planet(source) == [first, third]
+    assert galaxy.transports.for_planet(target) == [first, third]
+
+    manager.tick()
+    assert manager.transports == [third]
+    manager.tick()
+    manager.tick()
+
+    assert manager.transports == []
+    assert galaxy.transports.for_planet(target) == []
+    assert target.storage["energy"] == before + 4.0
+    assert [h["status"] for h in manager.history] == ["cancelled", "delivered", "delivered"]
+
+
+def test_shipments_on_one_route_form_a_convoy():
+    galaxy, empire, source, target = colonized_pair()
+    manager = empire.transport_manager
+    source.storage["minerals"] = 50.0
+    source.population.size = 10.0
+    energy, minerals = target.storage.get("energy", 0.0), target.storage.get("minerals", 0.0)
+    population = target.population.size
+
+    manager.create_transport(source, target, {"energy": 2.0})
+    ok, msg = manager.create_transport(source, target, {"energy": 1.0, "minerals": 4.0})
+    assert ok and msg.startswith("Joined convoy")
+    manager.create_transport(source, target, 1.5, "population")
+
+    (convoy,) = manager.transports
+    assert convoy.transport_type == "mixed"
+    assert convoy.cargo == {"energy": 3.0, "minerals": 4.0, "population": 1.5}
+    assert convoy.time_remaining == convoy.time_total == 3
+
+    # konwój już wyruszył - ładunek leci osobno, w pełnym czasie trasy
+    manager.tick()
+    manager.create_transport(source, target, {"energy": 1.0})
+    convoy, late = manager.transports
+    assert (convoy.time_remaining, late.time_remaining) == (2, 3)
+
+    manager.tick()
+    manager.tick()
+    assert manager.transports == [late]
+    assert target.storage["energy"] == energy + 3.0
+    assert target.storage["minerals"] == minerals + 4.0
+    assert target.population.size == population + 1.5
+
+    assert manager.cancel(late)
+    assert manager.transports == [] and manager.convoys == {}
+
+
+def test_direct_cancel_returns_cargo_once():
+    galaxy, empire, source, target = colonized_pair()
+    manager = empire.transport_manager
+    energy, before = source.storage["energy"], target.storage.get("energy", 0.0)
+
+    manager.create_transport(source, target, {"energy": 5.0})
+    (transport,) = manager.transports
+    assert transport.cancel()
+    assert not transport.cancel() and not manager.cancel(transport)
+    assert manager.transports == [] and manager.convoys == {}
+    assert galaxy.transports.for_planet(target) == []
+
+    for _ in range(transport.time_total + 1):
+        manager.tick()
+    assert source.storage["energy"] == energy
+    assert target.storage.get("energy", 0.0) == before
+    assert [h["status"] for h in manager.history] == ["cancelled"]
+
+
+def test_history_is_bounded():
+    galaxy, empire, source, target = colonized_pair()
+    manager = empire.transport_manager
+
+    for _ in range(HISTORY_SIZE + 5):
+        manager.create_transport(source, target, {"energy": 1.0})
+        manager.tick()
+    for _ in range(3):
+        manager.tick()
+
+    assert len(manager.history) == HISTORY_SIZE